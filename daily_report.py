@@ -23,360 +23,110 @@ except ImportError as e:
     print(f"이메일 모듈 import 오류: {e}")
     EMAIL_AVAILABLE = False
 
-# Streamlit 관련 import 제거하고 핵심 로직만 가져오기
+# Streamlit 의존성 없이 분석 엔진만 사용
 import requests
-import pandas as pd
+from analysis_engine import AnalysisEngine
+from page_archive import PageArchive
+from report_outbox import ReportOutbox
+from report_sinks import HttpSink, sinks_from_env, fan_out
+from snapshot_export import SnapshotWriter, PARQUET_AVAILABLE
+from title_index import TitleIndex
+from posting_lifecycle import PostingLifecycle
+from pay_stats import PayCollector, pay_summary
+from tag_stats import TagStore, tag_summary
+
+
+def print_event(event):
+    """분석 엔진 이벤트를 콘솔에 출력 (진행 상황은 100페이지마다)"""
+    if event['level'] == 'progress':
+        stage = event.get('stage')
+        if stage in ('worknet', 'jobkorea', 'delta') and event.get('page', 0) % 100 != 0:
+            return
+        # 전수 조사는 페이지가 끝나는 순서가 섞이므로 완료한 페이지 수 기준 (마지막 페이지는 항상 출력)
+        if stage == 'census' and event['current'] % 100 != 0 and event['current'] != event['total']:
+            return
+    print(event['message'])
+
+
+class AlbamonAnalyzerCLI(AnalysisEngine):
+    """CLI 전용 알바몬 분석기 - 분석 엔진 + 콘솔 출력"""
+
+    def __init__(self, archive=None):
+        super().__init__(listener=print_event, archive=archive)
+
+    def comprehensive_job_analysis(self, search_period_type='ALL', *args, **kwargs):
+        """효율적인 범위 탐색으로 공고 분석 - CLI 버전 (나머지 인자는 엔진에 그대로 전달)"""
+        print(f"🔍 {search_period_type} 공고 분석 시작...")
+        return super().comprehensive_job_analysis(search_period_type, *args, **kwargs)
+
+
+def report_headers(api_password):
+    """리포트 API 요청 헤더"""
+    return {
+        'Authorization': f'Bearer {api_password}',
+        'User-Agent': 'job-site-monitor/1.0.0'
+    }
+
+
+def flush_outbox(outbox):
+    """
+    이전 실행에서 전송하지 못한 리포트 재전송 (추가 HTTP 대상은 각자 보관함에서 재전송)
+    반환: 기본 API의 (전송한 항목 메타 목록, 실패한 항목 메타 목록)
+    """
+    for sink in sinks_from_env(outbox):
+        if isinstance(sink, HttpSink) and sink.outbox.pending():
+            print(f"📮 {sink.name} 보관함에 남은 리포트 {len(sink.outbox.pending())}개 재전송 중...")
+            sink_delivered, sink_failed = sink.outbox.flush(sink.url, sink.headers)
+            print(f"   {sink.name}: 재전송 {len(sink_delivered)}개, 실패 {len(sink_failed)}개")
 
-
-class AlbamonAnalyzerCLI:
-    """CLI 전용 알바몬 분석기 - Streamlit 의존성 제거"""
-    
-    def __init__(self):
-        self.base_url = 'https://bff-general.albamon.com'
-        self.headers = {
-            'Accept': '*/*',
-            'User-Agent': 'job-site/1.0.0',
-            'origin': 'https://www.albamon.com',
-            'Content-Type': 'application/json',
-            'cookie': (
-                'ConditionId=25C99562-77E3-40EB-A750-DA27D2D03C54; '
-                'ab.storage.deviceId.7a5f1472-069a-4372-8631-2f711442ee40'
-                '=%7B%22g%22%3A%22efb20921-d9c8-43dd-3c27-8a1487d7d2c4%22'
-                '%2C%22c%22%3A1756907811760%2C%22l%22%3A1756943038663%7D; '
-                'AM_USER_UUID=e69544f8-bed4-4fc3-94c7-6efac20359f7; '
-                'ab.storage.sessionId.7a5f1472-069a-4372-8631-2f711442ee40'
-                '=%7B%22g%22%3A%22898147fc-a8ba-6427-1f60-647c10d3514e%22'
-                '%2C%22e%22%3A1756945521947%2C%22c%22%3A1756943038661%2C'
-                '%22l%22%3A1756943721947%7D'
-            )
-        }
-
-    def search_jobs(self, page=1, size=200, search_period_type='ALL'):
-        """공고 검색 API 호출"""
-        request_body = {
-            "pagination": {
-                "page": int(page),
-                "size": int(size)
-            },
-            "recruitListType": "SEARCH",
-            "sortTabCondition": {
-                "searchPeriodType": str(search_period_type),
-                "sortType": "RELATION"
-            },
-            "condition": {
-                "areas": [],
-                "employmentTypes": [],
-                "excludeKeywords": [],
-                "excludeBar": False,
-                "excludeNegoAge": False,
-                "excludeNegoWorkWeek": False,
-                "excludeNegoWorkTime": False,
-                "excludeNegoGender": False,
-                "parts": [],
-                "similarDongJoin": False,
-                "workDayTypes": [],
-                "workPeriodTypes": [],
-                "workTimeTypes": [],
-                "workWeekTypes": [],
-                "endWorkTime": "",
-                "startWorkTime": "",
-                "includeKeyword": "",
-                "excludeKeywordList": [],
-                "age": 0,
-                "genderType": "NONE",
-                "moreThanEducation": False,
-                "educationType": "ALL"
-            },
-            "extensionCondition": {
-                "search": {
-                    "keyword": "",
-                    "featureCode": "",
-                    "disableExceptedConditions": []
-                }
-            }
-        }
-
-        try:
-            response = requests.post(
-                f'{self.base_url}/recruit/search',
-                json=request_body,
-                headers=self.headers,
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # 올바른 JSON 경로로 공고 데이터 추출
-            jobs = data.get('base', {}).get('normal', {}).get('collection', [])
-
-            # 기존 형식에 맞추어 반환 (호환성 유지)
-            return {
-                'result': {'recruitList': jobs},
-                'base': data.get('base', {}),
-                '_debug_info': {
-                    'original_job_count': len(jobs),
-                    'json_structure': 'base.normal.collection'
-                }
-            }
-        except requests.exceptions.RequestException as e:
-            print(f"API 요청 실패: {e}")
-            return None
-
-    def find_source_range_efficient(self, search_period_type='ALL'):
-        """효율적인 범위 탐색 - CLI 버전 (로깅 제거)"""
-        search_start_time = time.time()
-        total_requests = 0
-        
-        # 전체 공고 수 확인
-        first_response = self.search_jobs(1, 200, search_period_type)
-        total_requests += 1
-        
-        if not first_response:
-            return None, None, None, None, 0, {}, {}, 0
-
-        total_count = (
-            first_response.get('base', {})
-            .get('pagination', {})
-            .get('totalCount', 0)
-        )
-        max_pages = (total_count + 199) // 200 if total_count > 0 else 1
-
-        print(f"🚀 경계 기반 탐색: 전체 {total_count:,}개 공고 ({max_pages}페이지)")
-
-        # 1단계: 워크넷 경계 찾기 (끝페이지부터)
-        print("🔍 워크넷 경계 탐색 중...")
-        worknet_start = None
-        worknet_end = None
-        worknet_end_count = 0
-        worknet_start_count = 0
-        
-        # 끝페이지에서 워크넷 확인
-        try:
-            response = self.search_jobs(max_pages, 200, search_period_type)
-            total_requests += 1
-            if response:
-                jobs = response.get('result', {}).get('recruitList', [])
-                worknet_count = sum(1 for job in jobs if job.get('externalRecruitSite') == 'WN')
-                if worknet_count > 0:
-                    worknet_end = max_pages
-                    worknet_end_count = worknet_count
-                    print(f"📍 워크넷 끝: {max_pages}페이지 ({worknet_count}개)")
-        except Exception as e:
-            print(f"끝페이지 확인 오류: {e}")
-
-        # 워크넷이 있으면 시작점 찾기
-        if worknet_end:
-            for i, page in enumerate(range(max_pages, 0, -1)):
-                try:
-                    # 진행 상황 표시 (100페이지마다)
-                    if page % 100 == 0:
-                        progress = (i + 1) / max_pages * 100
-                        remaining_pages = max_pages - i
-                        print(f"🔍 워크넷 탐색: 페이지 {page} | 진행률: {progress:.1f}% | 남은: {remaining_pages}")
-                    
-                    response = self.search_jobs(page, 200, search_period_type)
-                    total_requests += 1
-                    
-                    if not response:
-                        continue
-
-                    jobs = response.get('result', {}).get('recruitList', [])
-                    if not jobs:
-                        continue
-                    
-                    worknet_count = sum(1 for job in jobs if job.get('externalRecruitSite') == 'WN')
-                    
-                    if worknet_count > 0:
-                        worknet_start = page
-                        worknet_start_count = worknet_count
-                    else:
-                        # 워크넷이 없는 첫 페이지 발견 = 워크넷 시작점 확정
-                        print(f"✅ 워크넷 시작점 확정: {worknet_start}~{worknet_end}페이지")
-                        break
-                        
-                    time.sleep(0.002)
-                    
-                except Exception as e:
-                    print(f"페이지 {page} 검색 오류: {e}")
-                    continue
-
-        if worknet_start and worknet_end:
-            print(f"✅ 워크넷: {worknet_start}~{worknet_end}페이지")
-        else:
-            print("📊 워크넷 공고 없음")
-
-        # 2단계: 잡코리아 경계 찾기 (워크넷 앞쪽부터)
-        print("🔍 잡코리아 경계 탐색 중...")
-        jobkorea_start = None
-        jobkorea_end = None
-        jobkorea_end_count = 0
-        jobkorea_start_count = 0
-        search_start_page = worknet_start - 1 if worknet_start else max_pages
-        
-        # 워크넷 바로 앞 페이지에서 잡코리아 확인
-        if search_start_page > 0:
-            try:
-                response = self.search_jobs(search_start_page, 200, search_period_type)
-                total_requests += 1
-                if response:
-                    jobs = response.get('result', {}).get('recruitList', [])
-                    jobkorea_count = sum(1 for job in jobs if job.get('jobkoreaRecruitNo', 0) != 0)
-                    if jobkorea_count > 0:
-                        jobkorea_end = search_start_page
-                        jobkorea_end_count = jobkorea_count
-                        print(f"📍 잡코리아 끝: {search_start_page}페이지 ({jobkorea_count}개)")
-            except Exception as e:
-                print(f"잡코리아 끝페이지 확인 오류: {e}")
-
-        # 잡코리아가 있으면 시작점 찾기
-        if jobkorea_end:
-            total_search_pages = search_start_page
-            for i, page in enumerate(range(search_start_page, 0, -1)):
-                try:
-                    # 진행 상황 표시 (100페이지마다)
-                    if page % 100 == 0:
-                        progress = (i + 1) / total_search_pages * 100
-                        remaining_pages = total_search_pages - i
-                        print(f"🔍 잡코리아 탐색: 페이지 {page} | 진행률: {progress:.1f}% | 남은: {remaining_pages}")
-                    
-                    response = self.search_jobs(page, 200, search_period_type)
-                    total_requests += 1
-                    
-                    if not response:
-                        continue
-
-                    jobs = response.get('result', {}).get('recruitList', [])
-                    if not jobs:
-                        continue
-                    
-                    jobkorea_count = sum(1 for job in jobs if job.get('jobkoreaRecruitNo', 0) != 0)
-                    
-                    if jobkorea_count > 0:
-                        jobkorea_start = page
-                        jobkorea_start_count = jobkorea_count
-                    else:
-                        # 잡코리아가 없는 첫 페이지 발견 = 잡코리아 시작점 확정
-                        print(f"✅ 잡코리아 시작점 확정: {jobkorea_start}~{jobkorea_end}페이지")
-                        break
-                        
-                    time.sleep(0.002)
-                    
-                except Exception as e:
-                    print(f"페이지 {page} 검색 오류: {e}")
-                    continue
-
-        if jobkorea_start and jobkorea_end:
-            print(f"✅ 잡코리아: {jobkorea_start}~{jobkorea_end}페이지")
-        else:
-            print("📊 잡코리아 공고 없음")
-
-        # 3단계: 실제 확인한 개수 기반 계산 (추가 요청 없이)
-        print("🔍 공고 수 계산 중...")
-        jobkorea_counts = {}
-        worknet_counts = {}
-        
-        # 잡코리아 공고 수 계산 (실제 확인한 개수 사용)
-        if jobkorea_start and jobkorea_end:
-            total_pages = jobkorea_end - jobkorea_start + 1
-            if total_pages == 1:
-                # 1페이지만 있으면 시작=끝이므로 시작 페이지 개수 사용
-                jobkorea_counts[jobkorea_start] = jobkorea_start_count if jobkorea_start_count > 0 else jobkorea_end_count
-            else:
-                # 여러 페이지면 시작/끝은 실제 개수, 중간은 200개
-                for page in range(jobkorea_start, jobkorea_end + 1):
-                    if page == jobkorea_start:
-                        jobkorea_counts[page] = jobkorea_start_count  # 실제 확인한 시작 페이지 개수
-                    elif page == jobkorea_end:
-                        jobkorea_counts[page] = jobkorea_end_count  # 실제 확인한 끝 페이지 개수
-                    else:
-                        jobkorea_counts[page] = 200  # 중간 페이지는 200개 (해당 소스만 있음)
-        
-        # 워크넷 공고 수 계산 (실제 확인한 개수 사용)
-        if worknet_start and worknet_end:
-            total_pages = worknet_end - worknet_start + 1
-            if total_pages == 1:
-                # 1페이지만 있으면 시작=끝이므로 시작 페이지 개수 사용
-                worknet_counts[worknet_start] = worknet_start_count if worknet_start_count > 0 else worknet_end_count
-            else:
-                # 여러 페이지면 시작/끝은 실제 개수, 중간은 200개
-                for page in range(worknet_start, worknet_end + 1):
-                    if page == worknet_start:
-                        worknet_counts[page] = worknet_start_count  # 실제 확인한 시작 페이지 개수
-                    elif page == worknet_end:
-                        worknet_counts[page] = worknet_end_count  # 실제 확인한 끝 페이지 개수
-                    else:
-                        worknet_counts[page] = 200  # 중간 페이지는 200개 (해당 소스만 있음)
-
-        # 검색 소요시간 계산
-        search_end_time = time.time()
-        search_duration = search_end_time - search_start_time
-        
-        # 실제 공고 수 합계 계산
-        total_jobkorea_count = sum(jobkorea_counts.values())
-        total_worknet_count = sum(worknet_counts.values())
-
-        # 결과 로깅
-        if jobkorea_start and jobkorea_end:
-            print(f"📊 잡코리아: {jobkorea_start}~{jobkorea_end}페이지 (총 {total_jobkorea_count:,}개)")
-        if worknet_start and worknet_end:
-            print(f"📊 워크넷: {worknet_start}~{worknet_end}페이지 (총 {total_worknet_count:,}개)")
-            
-        print(f"⚡ 경계 탐색 완료: {search_duration:.2f}초, 총 {total_requests}번 요청")
-
-        return jobkorea_start, jobkorea_end, worknet_start, worknet_end, total_count, jobkorea_counts, worknet_counts, search_duration
-
-    def comprehensive_job_analysis(self, search_period_type='ALL'):
-        """효율적인 범위 탐색으로 공고 분석 - CLI 버전"""
-        try:
-            print(f"🔍 {search_period_type} 공고 분석 시작...")
-            result = self.find_source_range_efficient(search_period_type)
-            jobkorea_start, jobkorea_end, worknet_start, worknet_end, total_count, jobkorea_counts, worknet_counts, search_duration = result
-
-            if total_count == 0:
-                return {
-                    'total_count': 0,
-                    'albamon_count': 0,
-                    'jobkorea_count': 0,
-                    'worknet_count': 0,
-                    'search_duration': search_duration,
-                    'analysis_type': search_period_type
-                }
-
-            # 정확한 공고 수 계산 (실제 페이지별 카운트 기반)
-            jobkorea_count = sum(jobkorea_counts.values()) if jobkorea_counts else 0
-            worknet_count = sum(worknet_counts.values()) if worknet_counts else 0
-            albamon_count = total_count - jobkorea_count - worknet_count
-
-            return {
-                'total_count': total_count,
-                'albamon_count': max(0, albamon_count),
-                'jobkorea_count': max(0, jobkorea_count),
-                'worknet_count': max(0, worknet_count),
-                'jobkorea_start_page': jobkorea_start,
-                'jobkorea_end_page': jobkorea_end,
-                'worknet_start_page': worknet_start,
-                'worknet_end_page': worknet_end,
-                'detailed_counts': {
-                    'jobkorea_by_page': jobkorea_counts,
-                    'worknet_by_page': worknet_counts
-                },
-                'search_duration': search_duration,
-                'analysis_type': search_period_type,
-                'timestamp': datetime.now().isoformat()
-            }
-
-        except Exception as e:
-            print(f"분석 중 오류 발생: {e}")
-            return None
-
-def send_report_to_api(all_result, today_result):
-    """API로 리포트 데이터 전송"""
+    api_url = os.getenv('REPORT_API_URL')
+    api_password = os.getenv('REPORT_API_PASSWORD')
+    pending = outbox.pending()
+    if not (api_url and api_password and pending):
+        return [], []
+
+    print(f"📮 보관함에 남은 리포트 {len(pending)}개 재전송 중...")
+    delivered, failed = outbox.flush(api_url, report_headers(api_password))
+    for meta in delivered:
+        print(f"✅ 재전송 완료: {meta['report_date']} (시도 {meta['attempts']}회)")
+    for meta in failed:
+        print(f"❌ 재전송 실패: {meta['report_date']} - {meta['last_error']}")
+    return delivered, failed
+
+
+def send_report_to_api(all_result, today_result, outbox=None, print_payload=False, extra_results=None):
+    """
+    리포트를 설정된 모든 대상(API, 추가 HTTP, 시계열 파일, 파일 드롭, 이메일)에 동시에 전송
+    API는 보관함(outbox)에 먼저 저장한 뒤 재시도·gzip 압축·멱등 키로 전송
+    실패하면 보관함에 남아 다음 실행 때 다시 전송
+    반환: API 전송 성공 여부
+    """
 
     # 환경 변수에서 API 설정 가져오기
     api_url = os.getenv('REPORT_API_URL')
     api_password = os.getenv('REPORT_API_PASSWORD')
 
-    if not api_url or not api_password:
+    # JSON 데이터 구성
+    today = datetime.now().strftime("%Y-%m-%d")
+    json_data = {
+        'report_date': today,
+        'all_result': all_result,
+        'today_result': today_result,
+        'generated_at': datetime.now().isoformat(),
+        'source': 'github_actions'
+    }
+    json_data.update(extra_results or {})
+
+    # 전체 JSON 출력은 선택 (전수 조사 결과는 매우 큼)
+    if print_payload:
+        print("=== 전송할 JSON 데이터 ===")
+        print(json.dumps(json_data, indent=2, ensure_ascii=False))
+
+    api_configured = bool(api_url and api_password)
+    outbox = outbox or ReportOutbox(os.getenv('REPORT_OUTBOX_DIR'))
+    sinks = sinks_from_env(outbox, report_headers(api_password) if api_configured else None)
+
+    if not api_configured:
         print("❌ API 설정이 완료되지 않았습니다.")
         print("필요한 환경 변수: REPORT_API_URL, REPORT_API_PASSWORD")
         print("\n=== 분석 결과 요약 ===")
@@ -387,75 +137,185 @@ def send_report_to_api(all_result, today_result):
             print(f"- 워크넷: {all_result['worknet_count']:,}개")
         if today_result:
             print(f"오늘 공고: {today_result['total_count']:,}개")
-        return False
-
-    try:
-        # JSON 데이터 구성
-        today = datetime.now().strftime("%Y-%m-%d")
-        json_data = {
-            'report_date': today,
-            'all_result': all_result,
-            'today_result': today_result,
-            'generated_at': datetime.now().isoformat(),
-            'source': 'github_actions'
-        }
-
-        # API 요청 헤더
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {api_password}',
-            'User-Agent': 'job-site-monitor/1.0.0'
-        }
-
-        # API 전송 전에 JSON 출력
-        print("=== 전송할 JSON 데이터 ===")
-        print(json.dumps(json_data, indent=2, ensure_ascii=False))
 
-        # API 전송
-        print(f"📡 API로 데이터 전송 중... {api_url}")
-
-        response = requests.post(
-            api_url,
-            json=json_data,
-            headers=headers,
-            timeout=30
-        )
-
-        response.raise_for_status()
-
-        print("✅ API 전송 완료!")
-        print(f"응답: {response.status_code}")
-
-        return True
-
-    except requests.exceptions.RequestException as e:
-        print(f"❌ API 전송 실패: {e}")
-        if hasattr(e, 'response') and e.response is not None:
-            print(f"응답 코드: {e.response.status_code}")
-            print(f"응답 내용: {e.response.text}")
-        return False
-    except Exception as e:
-        print(f"❌ 예상치 못한 오류: {e}")
+    if not sinks:
         return False
 
+    print(f"📡 리포트 전송 중... ({', '.join(sink.name for sink in sinks)})")
+    results = fan_out(sinks, json_data)
 
-def main():
-    """메인 실행 함수"""
+    for name, result in results.items():
+        if result['success']:
+            print(f"✅ {name} 전송 완료! ({result['detail']}, {result['duration']:.1f}초)")
+        else:
+            print(f"❌ {name} 전송 실패: {result['error']}")
+    if api_configured and not results['api']['success']:
+        print("   보관함에 보관 - 다음 실행 때 다시 전송합니다")
+
+    return api_configured and results['api']['success']
+
+
+def create_analyzer():
+    """환경 변수 설정대로 CLI 분석기 생성 (ARCHIVE_DIR 설정 시 원본 페이지 아카이브 사용)"""
+    archive_dir = os.getenv('ARCHIVE_DIR')
+    archive = PageArchive(archive_dir) if archive_dir else None
+    if archive:
+        print(f"🗄️ 원본 페이지 아카이브 사용: {archive_dir}")
+    return AlbamonAnalyzerCLI(archive=archive)
+
+
+def open_snapshot(search_period_type):
+    """SNAPSHOT_DIR 설정 시 이번 분석에서 수집한 공고를 기록할 Parquet 기록기 (pyarrow 없으면 None)"""
+    snapshot_dir = os.getenv('SNAPSHOT_DIR')
+    if not snapshot_dir:
+        return None
+    if not PARQUET_AVAILABLE:
+        print("⚠️ pyarrow가 설치되지 않아 공고 스냅샷을 저장하지 않습니다 (pip install pyarrow)")
+        return None
+    os.makedirs(snapshot_dir, exist_ok=True)
+    path = os.path.join(snapshot_dir, f"postings_{datetime.now().strftime('%Y%m%d')}_{search_period_type}.parquet")
+    print(f"🗂️ 공고 스냅샷 저장: {path}")
+    return SnapshotWriter(path)
+
+
+def open_title_index():
+    """TITLE_INDEX_PATH 설정 시 이번 분석에서 수집한 공고 제목을 색인할 전문 검색 색인"""
+    index_path = os.getenv('TITLE_INDEX_PATH')
+    if not index_path:
+        return None
+    print(f"🔎 제목 색인: {index_path}")
+    return TitleIndex(index_path)
+
+
+def membership_summary(result):
+    """전수 조사의 날짜별 공고 집합 비교를 소스별 신규/삭제 공고 수로 요약 (비교 대상이 없으면 None)"""
+    membership = result.get('membership') if result else None
+    if not membership or not membership['diff']:
+        return None
+    diff = membership['diff']
+    return {
+        'date': membership['date'],
+        'previous_date': membership['previous_date'],
+        'new': {source: counts['new'] for source, counts in diff.items()},
+        'removed': {source: counts['removed'] for source, counts in diff.items()}
+    }
+
+
+def census_complete(result):
+    """전수 조사가 모든 페이지를 빠짐없이 확정했는지 (생애 주기에서 내려간 공고를 판단할 수 있는지)"""
+    census = result.get('census') if result else None
+    return bool(census) and not census['failed_pages'] and not result['drift']['unresolved_pages']
+
+
+def exports_complete(result):
+    """
+    census_complete + 내보내기 대상(스냅샷·생애 주기·급여·직종 분포)도 모든 페이지를 받았는지
+    (중간 저장에서 이어받은 페이지를 아카이브에서 다시 읽지 못하면 그 페이지가 빠짐)
+    """
+    return census_complete(result) and not result['census'].get('export_missing_pages')
+
+
+def main(analyzer=None):
+    """
+    메인 실행 함수
+    analyzer를 넘기면 그대로 사용 (스케줄러가 연결·캐시를 유지한 분석기를 재사용)
+    """
     print("=" * 60)
     print("🚀 알바몬 공고 분석 자동화 스크립트 시작")
     print("=" * 60)
-    
-    analyzer = AlbamonAnalyzerCLI()
+
+    # 이전 실행에서 전송하지 못한 리포트부터 처리
+    outbox = ReportOutbox(os.getenv('REPORT_OUTBOX_DIR'))
+    today = datetime.now().strftime("%Y-%m-%d")
+    delivered, failed = flush_outbox(outbox)
+    if any(meta['report_date'] == today for meta in delivered):
+        print("✅ 오늘 리포트 전송 완료 - 분석을 다시 하지 않습니다")
+        return 0
+    if any(meta['report_date'] == today for meta in failed):
+        print("⚠️ 오늘 리포트가 아직 전송되지 않아 보관함에 남아 있습니다 (다음 실행 때 재전송)")
+        return 1
+
+    analyzer = analyzer or create_analyzer()
+    archive = analyzer.archive
     
     # 전체 공고 분석
     print("\n1️⃣ 전체 공고 분석 시작...")
-    all_result = analyzer.comprehensive_job_analysis('ALL')
+    census_mode = os.getenv('ANALYSIS_MODE') == 'census'
+    # 공고 스냅샷·제목 색인·생애 주기·급여 분포는 전체 페이지를 받는 전수 조사에서만 기록
+    # (표본 페이지는 소스 경계에 치우쳐 있어 생애 주기라면 처음 본 날이 틀어짐)
+    analyzer.snapshot = open_snapshot('ALL') if census_mode else None
+    analyzer.title_index = open_title_index() if census_mode else None
+    lifecycle_db = os.getenv('LIFECYCLE_DB')
+    analyzer.lifecycle = PostingLifecycle(lifecycle_db) if lifecycle_db and census_mode else None
+    pay_collector = PayCollector() if census_mode else None
+    analyzer.pay_stats = pay_collector
+    tag_store = TagStore() if census_mode else None
+    tag_counter = tag_store.counter() if tag_store else None
+    analyzer.tag_stats = tag_counter
+    all_result = None
+    try:
+        if census_mode:
+            # 전수 조사: 모든 페이지를 멀티프로세스로 디코딩·분류
+            all_result = analyzer.full_census('ALL')
+        else:
+            all_result = analyzer.comprehensive_job_analysis('ALL')
+    finally:
+        analyzer.pay_stats = None
+        analyzer.tag_stats = None
+        if analyzer.snapshot is not None:
+            stats = analyzer.snapshot.close()
+            print(f"🗂️ 스냅샷: {stats['postings_written']:,}개 공고, 행 그룹 {stats['row_groups']}개")
+            analyzer.snapshot = None
+        if analyzer.title_index is not None:
+            stats = analyzer.title_index.close()
+            print(f"🔎 제목 색인: {stats['postings_indexed']:,}개 공고 추가 ({stats['pages_indexed']}페이지)")
+            analyzer.title_index = None
+
+    extra_results = {}
+    if analyzer.lifecycle is not None:
+        # 전수 조사로 전체 페이지를 받았을 때만 이번에 안 보인 공고를 내려간 것으로 처리
+        lifecycle_result = analyzer.lifecycle.finish(complete=exports_complete(all_result))
+        analyzer.lifecycle.close()
+        analyzer.lifecycle = None
+        removed = lifecycle_result['removed_postings']
+        print(f"⏳ 생애 주기: {lifecycle_result['postings']:,}개 반영 (신규 {lifecycle_result['new_postings']:,}개, "
+              f"내려감 {'-' if removed is None else f'{removed:,}'}개, {lifecycle_result['duration']:.1f}초)")
+        extra_results['lifecycle_result'] = lifecycle_result
 
     if all_result:
         print(f"✅ 전체 공고 분석 완료: {all_result['total_count']:,}개")
         print(f"   - 자사: {all_result['albamon_count']:,}개")
         print(f"   - 잡코리아: {all_result['jobkorea_count']:,}개") 
         print(f"   - 워크넷: {all_result['worknet_count']:,}개")
+        membership_diff = membership_summary(all_result)
+        if membership_diff:
+            print(f"🔀 {membership_diff['previous_date']} 대비 소스별 신규/삭제 공고:")
+            for source, new in membership_diff['new'].items():
+                print(f"   - {source}: +{new:,} / -{membership_diff['removed'][source]:,}")
+            extra_results['membership_diff'] = membership_diff
+        exports_partial = not exports_complete(all_result)
+        if pay_collector is not None:
+            pay_result = pay_summary(pay_collector.frame())
+            pay_result['partial'] = exports_partial
+            print(f"💰 시급 환산 중앙값: {pay_result['median_hourly_pay'] or 0:,.0f}원 "
+                  f"({pay_result['parsed']:,}/{pay_result['postings']:,}개 공고)")
+            for row in pay_result['by_source']:
+                print(f"   - {row['source']}: {row['median'] or 0:,.0f}원 "
+                      f"(최저시급 미만 {(row['below_minimum'] or 0) * 100:.1f}%)")
+            extra_results['pay_result'] = pay_result
+        if tag_counter is not None:
+            changes = None
+            if not exports_partial:
+                # 모든 페이지를 받은 날만 저장해 날짜별 비교에 사용
+                tag_store.save(today, tag_counter)
+                previous_date = tag_store.previous_date(today)
+                if previous_date:
+                    changes = tag_store.compare(previous_date, today, 'parts', top_n=10)
+            tag_result = tag_summary(tag_counter.arrays(), tag_store.vocabulary.labels, top_n=10, changes=changes)
+            tag_result['partial'] = exports_partial
+            top_parts = ', '.join(f"{row['label']}({row['total']:,})" for row in tag_result.get('parts', [])[:3])
+            print(f"🏷️ 상위 직종: {top_parts or '-'}")
+            extra_results['tag_result'] = tag_result
     else:
         print("❌ 전체 공고 분석 실패")
         return 1
@@ -466,7 +326,8 @@ def main():
     
     # 오늘 공고 분석
     print("\n2️⃣ 오늘 공고 분석 시작...")
-    today_result = analyzer.comprehensive_job_analysis('TODAY')
+    # 오늘 공고는 최신순 목록을 이전 실행 이후 새 공고까지만 읽는 증분 분석
+    today_result = analyzer.incremental_analysis('TODAY')
 
     if today_result:
         print(f"✅ 오늘 공고 분석 완료: {today_result['total_count']:,}개")
@@ -480,9 +341,26 @@ def main():
         print("❌ 오늘 공고 분석 실패")
         return 1
     
+    # 이름 붙은 쿼리 일괄 분석 (BATCH_QUERIES_FILE: {이름: 쿼리 정의} JSON)
+    if os.getenv('BATCH_QUERIES_FILE'):
+        print("\n📦 쿼리 일괄 분석 시작...")
+        with open(os.getenv('BATCH_QUERIES_FILE'), encoding='utf-8') as f:
+            queries = json.load(f)
+        table = analyzer.batch_analysis(queries)
+        print(table.to_string())
+        table = table.astype(object).where(table.notna(), None)
+        extra_results['batch_result'] = table.reset_index().to_dict('records')
+
     # API 전송
     print("\n3️⃣ API 리포트 전송 시작...")
-    api_success = send_report_to_api(all_result, today_result)
+    api_success = send_report_to_api(all_result, today_result, outbox,
+                                     print_payload=os.getenv('REPORT_PRINT_PAYLOAD') == '1',
+                                     extra_results=extra_results)
+
+    if archive:
+        stats = archive.stats
+        print(f"🗄️ 아카이브: {stats['pages_stored']}페이지 저장 "
+              f"(신규 객체 {stats['objects_written']}개, 중복 {stats['objects_deduplicated']}개)")
 
     if api_success:
         print("✅ 모든 작업 완료!")
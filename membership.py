@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+날짜별 공고 집합(recruitNo) 저장·비교
+전수 조사 결과의 소스별 recruitNo 집합을 정렬된 정수 배열로 저장하고
+두 날짜 사이 신규/삭제/유지 공고 수를 공고 본문 없이 벡터 연산으로 계산
+
+디렉터리 구조:
+  ALL/2025-09-07.npz   - 소스별(SOURCE_LABELS) 정렬 배열의 차분(delta)을 압축 저장
+
+사용 예:
+  python membership.py 2025-09-06 2025-09-07
+"""
+
+import os
+import sys
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from analysis_engine import CACHE_DIR, SOURCE_LABELS
+
+MEMBERSHIP_DIR = os.path.join(CACHE_DIR, 'membership')
+
+
+def encode_set(recruit_nos):
+    """정렬된 recruitNo 배열 → 차분 배열 (작은 정수라 압축이 잘 됨)"""
+    return np.diff(recruit_nos, prepend=0)
+
+
+def decode_set(deltas):
+    return np.cumsum(deltas, dtype=np.int64)
+
+
+def diff_sets(old, new):
+    """
+    두 날짜의 소스별 집합 비교
+    반환: {소스 또는 'total': {'new', 'removed', 'kept', 'jaccard'}}
+    """
+    result = {}
+    for label in SOURCE_LABELS:
+        result[label] = _diff(old.get(label, np.zeros(0, dtype=np.int64)),
+                              new.get(label, np.zeros(0, dtype=np.int64)))
+    # 전체는 소스와 무관하게 비교 (자사 무료 → 유료 전환은 신규/삭제가 아님)
+    result['total'] = _diff(merged(old), merged(new))
+    return result
+
+
+def merged(sets):
+    """소스별 집합(서로 겹치지 않음)을 하나의 정렬 배열로"""
+    return np.sort(np.concatenate(list(sets.values())))
+
+
+def _diff(old, new):
+    """정렬된 두 집합 비교 - 정렬을 다시 하지 않고 이진 탐색으로 공통 원소 수 계산"""
+    if old.size and new.size:
+        index = np.minimum(np.searchsorted(new, old), new.size - 1)
+        kept = int(np.count_nonzero(new[index] == old))
+    else:
+        kept = 0
+    union = old.size + new.size - kept
+    return {
+        'new': int(new.size - kept),
+        'removed': int(old.size - kept),
+        'kept': int(kept),
+        'jaccard': round(kept / union, 4) if union else 1.0
+    }
+
+
+class MembershipStore:
+    """날짜별 소스별 recruitNo 집합 저장소"""
+
+    def __init__(self, root_dir=None):
+        self.root_dir = os.path.expanduser(root_dir or MEMBERSHIP_DIR)
+
+    def _path(self, date, search_period_type):
+        return os.path.join(self.root_dir, search_period_type, f"{date}.npz")
+
+    def save(self, date, sets, search_period_type='ALL'):
+        """소스별 정렬 배열 저장 (같은 날짜는 덮어씀)"""
+        path = self._path(date, search_period_type)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp.npz"
+        np.savez_compressed(tmp_path, **{label: encode_set(np.asarray(sets[label], dtype=np.int64))
+                                         for label in SOURCE_LABELS})
+        os.replace(tmp_path, path)
+        return path
+
+    def load(self, date, search_period_type='ALL'):
+        """저장된 집합 - {소스: 정렬 배열} (없으면 None)"""
+        try:
+            with np.load(self._path(date, search_period_type)) as data:
+                return {label: decode_set(data[label]) for label in SOURCE_LABELS if label in data}
+        except (OSError, ValueError):
+            return None
+
+    def dates(self, search_period_type='ALL'):
+        directory = os.path.join(self.root_dir, search_period_type)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(name[:-len('.npz')] for name in os.listdir(directory)
+                      if name.endswith('.npz') and not name.endswith('.tmp.npz'))
+
+    def previous_date(self, date, search_period_type='ALL'):
+        """date 이전에 저장된 가장 최근 날짜"""
+        earlier = [d for d in self.dates(search_period_type) if d < date]
+        return earlier[-1] if earlier else None
+
+    def compare(self, old_date, new_date, search_period_type='ALL'):
+        """두 날짜 비교 - diff_sets 결과 (어느 한쪽이 없으면 None)"""
+        old = self.load(old_date, search_period_type)
+        new = self.load(new_date, search_period_type)
+        if old is None or new is None:
+            return None
+        return diff_sets(old, new)
+
+    def overlap_matrix(self, dates=None, search_period_type='ALL'):
+        """날짜 쌍별 전체 공고 Jaccard 유사도 DataFrame"""
+        dates = dates or self.dates(search_period_type)
+        totals = {}
+        for date in dates:
+            sets = self.load(date, search_period_type)
+            if sets is not None:
+                totals[date] = merged(sets)
+        matrix = pd.DataFrame(index=list(totals), columns=list(totals), dtype=float)
+        for a in totals:
+            for b in totals:
+                matrix.loc[a, b] = _diff(totals[a], totals[b])['jaccard']
+        return matrix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="날짜별 공고 집합 비교")
+    parser.add_argument('old_date', nargs='?', help="비교 기준 날짜 (생략 시 마지막 두 날짜)")
+    parser.add_argument('new_date', nargs='?')
+    parser.add_argument('--dir', default=MEMBERSHIP_DIR, help="저장소 디렉터리")
+    parser.add_argument('--period', default='ALL', help="검색 기간 (ALL/TODAY)")
+    args = parser.parse_args()
+
+    store = MembershipStore(args.dir)
+    dates = store.dates(args.period)
+    old_date = args.old_date or (dates[-2] if len(dates) >= 2 else None)
+    new_date = args.new_date or (dates[-1] if dates else None)
+    diff = store.compare(old_date, new_date, args.period) if old_date and new_date else None
+    if diff is None:
+        print(f"❌ 비교할 집합이 없습니다 (저장된 날짜: {', '.join(dates) or '없음'})")
+        return 1
+
+    print(f"🔀 {old_date} → {new_date}")
+    print(pd.DataFrame(diff).T.to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+"""
+오프라인 재분석
+아카이브된 스냅샷(page_archive)으로 네트워크 없이 전체/지역별/유료·무료 분석을 재실행
+분류 규칙을 바꾼 뒤 과거 날짜 결과를 여러 프로세스로 다시 계산(backfill) 가능
+"""
+
+import sys
+import time
+import argparse
+import concurrent.futures
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from analysis_engine import (PAGE_SIZE, REGION_CODES, extract_columns,
+                             classify_columns)
+from page_archive import PageArchive
+
+REGION_NAME_TO_CODE = {name: code for code, name in REGION_CODES.items()}
+
+
+def load_snapshot_columns(archive, date, query):
+    """
+    스냅샷 전체를 열(NumPy 배열) 형태로 로드
+    페이지별로 추출한 뒤 한 번에 이어 붙여 공고 dict는 페이지 단위로만 유지
+    """
+    entries = archive.snapshot(date, query)
+    size = entries[0].get('size') if entries else None  # 스냅샷이 고른 페이지 크기로 고정
+    chunks = []
+    for entry, jobs in archive.iter_pages(date, query, size):
+        columns = extract_columns(jobs)
+        columns['pages'] = np.full(len(jobs), entry['page'], dtype=np.int32)
+        chunks.append(columns)
+
+    if not chunks:
+        columns = extract_columns([])
+        columns['pages'] = np.zeros(0, dtype=np.int32)
+    else:
+        columns = {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
+
+    total_count = max((entry['total_count'] for entry in entries), default=0)
+    page_size = max((entry.get('size') or PAGE_SIZE for entry in entries), default=PAGE_SIZE)
+    return columns, {
+        'total_count': total_count,
+        'page_size': page_size,
+        'pages_archived': len(entries),
+        'postings_archived': len(columns['pages'])
+    }
+
+
+def region_names(workplace_areas):
+    """workplaceArea('경북 경산시')의 첫 단어를 시/도 이름으로 사용 (벡터화)"""
+    names = pd.Series(workplace_areas, dtype=object).str.split(' ', n=1).str[0].fillna('')
+    known = names.isin(list(REGION_NAME_TO_CODE))
+    return np.where(known, names, '기타').astype(object)
+
+
+def _source_page_counts(pages, mask):
+    """소스별 페이지당 공고 수 {page: count}"""
+    if not mask.any():
+        return {}
+    counts = np.bincount(pages[mask])
+    return {int(page): int(counts[page]) for page in np.nonzero(counts)[0]}
+
+
+def _fill_range(page_counts, page_size):
+    """
+    아카이브에 없는 중간 페이지는 경계 탐색과 같은 규칙으로 한 페이지 가득 찬 것으로 간주
+    반환: (시작, 끝, 페이지별 공고 수, 추정 페이지 수)
+    """
+    if not page_counts:
+        return None, None, {}, 0
+    start, end = min(page_counts), max(page_counts)
+    filled = {}
+    estimated = 0
+    for page in range(start, end + 1):
+        if page in page_counts:
+            filled[page] = page_counts[page]
+        else:
+            filled[page] = page_size
+            estimated += 1
+    return start, end, filled, estimated
+
+
+class OfflineAnalyzer:
+    """아카이브 기반 오프라인 분석기"""
+
+    def __init__(self, archive, classifier=classify_columns, listener=None):
+        if isinstance(archive, str):
+            archive = PageArchive(archive)
+        self.archive = archive
+        self.classifier = classifier
+        self.listener = listener
+
+    def _emit(self, level, message, **data):
+        if self.listener is not None:
+            event = {'level': level, 'message': message, 'stage': 'offline', 'timestamp': time.time()}
+            event.update(data)
+            self.listener(event)
+
+    def comprehensive_job_analysis(self, date, search_period_type='ALL'):
+        """
+        전체 공고 분석 재실행 - AnalysisEngine.comprehensive_job_analysis와 같은 결과 형식
+        """
+        start_time = time.time()
+        query = f"search_{search_period_type}_RELATION"
+        columns, meta = load_snapshot_columns(self.archive, date, query)
+        if meta['pages_archived'] == 0:
+            self._emit('warning', f"📂 {date} {query} 스냅샷 없음")
+            return None
+
+        masks = self.classifier(columns)
+        pages = columns['pages']
+        page_size = meta['page_size']
+
+        jobkorea_start, jobkorea_end, jobkorea_counts, jobkorea_estimated = _fill_range(
+            _source_page_counts(pages, masks['is_jobkorea']), page_size)
+        worknet_start, worknet_end, worknet_counts, worknet_estimated = _fill_range(
+            _source_page_counts(pages, masks['is_worknet']), page_size)
+
+        total_count = meta['total_count']
+        jobkorea_count = sum(jobkorea_counts.values())
+        worknet_count = sum(worknet_counts.values())
+        albamon_count = max(0, total_count - jobkorea_count - worknet_count)
+        complete = meta['postings_archived'] >= total_count
+
+        # 유료/무료는 아카이브된 자사 공고 표본의 비율을 자사 공고 수에 맞춰 환산 (지역 재분석과 같은 방식)
+        albamon_paid = int(masks['is_paid'].sum())
+        albamon_free = int(masks['is_free'].sum())
+        sampled = albamon_paid + albamon_free
+        if not complete and sampled:
+            albamon_paid = int(round(albamon_count * albamon_paid / sampled))
+            albamon_free = albamon_count - albamon_paid
+        duration = time.time() - start_time
+
+        self._emit('success', f"📂 {date} {search_period_type} 재분석 완료: "
+                              f"{meta['postings_archived']:,}개 공고 ({duration:.2f}초)")
+
+        return {
+            'total_count': total_count,
+            'albamon_count': albamon_count,
+            'jobkorea_count': max(0, jobkorea_count),
+            'worknet_count': max(0, worknet_count),
+            'albamon_paid_count': albamon_paid,
+            'albamon_free_count': albamon_free,
+            'jobkorea_start_page': jobkorea_start,
+            'jobkorea_end_page': jobkorea_end,
+            'worknet_start_page': worknet_start,
+            'worknet_end_page': worknet_end,
+            'detailed_counts': {
+                'jobkorea_by_page': jobkorea_counts,
+                'worknet_by_page': worknet_counts
+            },
+            'search_duration': duration,
+            'analysis_type': search_period_type,
+            'snapshot_date': date,
+            'offline': {
+                'pages_archived': meta['pages_archived'],
+                'postings_archived': meta['postings_archived'],
+                'complete': complete,
+                'albamon_sampled': sampled,
+                'estimated_pages': jobkorea_estimated + worknet_estimated
+            },
+            'timestamp': datetime.now().isoformat()
+        }
+
+    def regional_breakdown(self, date, search_period_type='ALL'):
+        """
+        전체 스냅샷의 지역(시/도)별 소스·유료/무료 분포
+        반환: DataFrame (index=지역 이름)
+        """
+        query = f"search_{search_period_type}_RELATION"
+        columns, meta = load_snapshot_columns(self.archive, date, query)
+        masks = self.classifier(columns)
+        names = region_names(columns['workplace_areas'])
+
+        labels, inverse = np.unique(names, return_inverse=True)
+        frame = pd.DataFrame({
+            'total_count': np.bincount(inverse, minlength=len(labels)),
+            'albamon_count': np.bincount(inverse, weights=masks['is_albamon'], minlength=len(labels)),
+            'albamon_free_count': np.bincount(inverse, weights=masks['is_free'], minlength=len(labels)),
+            'albamon_paid_count': np.bincount(inverse, weights=masks['is_paid'], minlength=len(labels)),
+            'jobkorea_count': np.bincount(inverse, weights=masks['is_jobkorea'], minlength=len(labels)),
+            'worknet_count': np.bincount(inverse, weights=masks['is_worknet'], minlength=len(labels)),
+        }, index=pd.Index(labels, name='region_name')).astype(int)
+        frame.insert(0, 'region_code', [REGION_NAME_TO_CODE.get(name, '') for name in labels])
+        return frame.sort_values('total_count', ascending=False)
+
+    def analyze_regional_jobs(self, date, region_code, search_period_type='ALL'):
+        """
+        지역별(AREA) 스냅샷 재분석 - AnalysisEngine.analyze_regional_jobs와 같은 결과 형식
+        아카이브된 페이지만 분류하고 나머지는 같은 비율로 추정
+        """
+        query = f"area_{search_period_type}_DEFAULT_{region_code}"
+        columns, meta = load_snapshot_columns(self.archive, date, query)
+        if meta['pages_archived'] == 0:
+            self._emit('warning', f"📂 {date} {query} 스냅샷 없음")
+            return None
+
+        masks = self.classifier(columns)
+        total_count = meta['total_count']
+        analyzed = meta['postings_archived']
+        ratio = total_count / analyzed if 0 < analyzed < total_count else 1
+
+        sample = {
+            'albamon': int(masks['is_albamon'].sum()),
+            'albamon_free': int(masks['is_free'].sum()),
+            'albamon_paid': int(masks['is_paid'].sum()),
+            'jobkorea': int(masks['is_jobkorea'].sum()),
+            'worknet': int(masks['is_worknet'].sum())
+        }
+        albamon_free = int(sample['albamon_free'] * ratio)
+        albamon_paid = int(sample['albamon_paid'] * ratio)
+
+        return {
+            'region_name': REGION_CODES.get(region_code, region_code),
+            'region_code': region_code,
+            'total_count': total_count,
+            'analyzed_count': analyzed,
+            'albamon_count': albamon_free + albamon_paid,
+            'albamon_free_count': albamon_free,
+            'albamon_paid_count': albamon_paid,
+            'jobkorea_count': int(sample['jobkorea'] * ratio),
+            'worknet_count': int(sample['worknet'] * ratio),
+            'sample_jobs': [],
+            'sample_stats': {f"{key}_sample": value for key, value in sample.items()},
+            'snapshot_date': date
+        }
+
+    def backfill(self, dates=None, search_period_type='ALL', max_workers=None):
+        """
+        여러 날짜의 전체 분석을 프로세스 풀에서 병렬 재계산
+        반환: 날짜별 결과 DataFrame (시계열)
+        classifier는 프로세스로 전달되므로 모듈 최상위 함수여야 함
+        """
+        dates = dates or self.archive.dates()
+        results = []
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_analyze_date, self.archive.root_dir, date,
+                                search_period_type, self.classifier): date
+                for date in dates
+            }
+            for future in concurrent.futures.as_completed(futures):
+                date = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self._emit('error', f"📂 {date} 재분석 실패: {e}")
+                    continue
+                if result:
+                    results.append(result)
+                    self._emit('progress', f"📂 {date} 재분석 완료 ({len(results)}/{len(dates)})",
+                               current=len(results), total=len(dates))
+
+        return history_frame(results)
+
+
+def _analyze_date(root_dir, date, search_period_type, classifier):
+    """프로세스 풀 작업 단위 - 날짜 하나 재분석"""
+    return OfflineAnalyzer(root_dir, classifier=classifier).comprehensive_job_analysis(date, search_period_type)
+
+
+def history_frame(results):
+    """전체 분석 결과 목록을 날짜 인덱스 시계열 DataFrame으로 변환"""
+    columns = ['total_count', 'albamon_count', 'albamon_paid_count', 'albamon_free_count',
+               'jobkorea_count', 'worknet_count']
+    if not results:
+        return pd.DataFrame(columns=columns).rename_axis('snapshot_date')
+    frame = pd.DataFrame([{key: result.get(key) for key in ['snapshot_date'] + columns}
+                          for result in results])
+    return frame.set_index('snapshot_date').sort_index()
+
+
+def main():
+    """오프라인 재분석 CLI"""
+    parser = argparse.ArgumentParser(description="아카이브 기반 오프라인 재분석")
+    parser.add_argument('--archive', default='archive', help="아카이브 디렉터리")
+    parser.add_argument('--period', default='ALL', choices=['ALL', 'TODAY'])
+    parser.add_argument('--date', help="단일 날짜 (YYYY-MM-DD), 생략 시 전체 날짜 backfill")
+    parser.add_argument('--workers', type=int, default=None, help="프로세스 수")
+    parser.add_argument('--regions', action='store_true', help="지역별 분포 출력")
+    args = parser.parse_args()
+
+    analyzer = OfflineAnalyzer(args.archive, listener=lambda event: print(event['message']))
+
+    if args.date:
+        result = analyzer.comprehensive_job_analysis(args.date, args.period)
+        if not result:
+            return 1
+        print(history_frame([result]).to_string())
+        if args.regions:
+            print(analyzer.regional_breakdown(args.date, args.period).to_string())
+        return 0
+
+    history = analyzer.backfill(search_period_type=args.period, max_workers=args.workers)
+    print(history.to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+원본 페이지 아카이브
+수집한 검색 결과 페이지를 gzip 압축 NDJSON으로 저장해 재크롤링 없이 재분석 가능
+
+디렉터리 구조:
+  objects/ab/abcdef....ndjson.gz  - 공고 1개당 한 줄, 내용 해시(sha256)로 저장 (동일 페이지는 1번만)
+  index/YYYY-MM-DD.ndjson         - 날짜별 색인 (query, page, digest, total_count, ...)
+"""
+
+import os
+import gzip
+import json
+import mmap
+import hashlib
+import threading
+from datetime import datetime
+
+from analysis_engine import PAGE_SIZE, default_condition, page_count
+
+
+def query_key(request_body):
+    """
+    요청 본문으로 쿼리 식별자 생성
+    예) search_ALL_RELATION, area_TODAY_DEFAULT_A000, search_ALL_RELATION_1a2b3c4d
+    """
+    list_type = request_body.get('recruitListType', 'SEARCH').lower()
+    sort_tab = request_body.get('sortTabCondition', {})
+    parts = [list_type,
+             sort_tab.get('searchPeriodType', 'ALL'),
+             sort_tab.get('sortType', 'RELATION')]
+
+    condition = dict(request_body.get('condition', {}))
+    areas = condition.pop('areas', [])
+    condition.pop('selectedArea', None)
+    if areas:
+        parts.append('+'.join(area.get('si', '') for area in areas))
+
+    # 기본값과 다른 조건은 짧은 해시로 구분
+    default = default_condition()
+    default.pop('areas')
+    if condition and condition != default:
+        canonical = json.dumps(condition, sort_keys=True, ensure_ascii=False)
+        parts.append(hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:8])
+
+    return '_'.join(parts)
+
+
+class PageArchive:
+    """내용 주소 기반 페이지 아카이브"""
+
+    def __init__(self, root_dir='archive', compresslevel=6):
+        self.root_dir = root_dir
+        self.compresslevel = compresslevel
+        self._lock = threading.Lock()
+        self.stats = {
+            'pages_stored': 0,
+            'objects_written': 0,
+            'objects_deduplicated': 0,
+            'bytes_written': 0,
+            'errors': 0
+        }
+        os.makedirs(os.path.join(root_dir, 'objects'), exist_ok=True)
+        os.makedirs(os.path.join(root_dir, 'index'), exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+    def _object_path(self, digest):
+        return os.path.join(self.root_dir, 'objects', digest[:2], f"{digest}.ndjson.gz")
+
+    def _index_path(self, date):
+        return os.path.join(self.root_dir, 'index', f"{date}.ndjson")
+
+    def _write_object(self, digest, payload):
+        """압축 객체 저장 - 이미 있으면 건너뜀"""
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            self.stats['objects_deduplicated'] += 1
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(gzip.compress(payload, compresslevel=self.compresslevel, mtime=0))
+        os.replace(tmp_path, path)
+        self.stats['objects_written'] += 1
+        self.stats['bytes_written'] += os.path.getsize(path)
+
+    def store_page(self, request_body, data, fetched_at=None):
+        """
+        검색 API 응답 한 페이지 저장
+        반환: 객체 digest (실패 시 None)
+        """
+        try:
+            fetched_at = fetched_at or datetime.now()
+            jobs = data.get('base', {}).get('normal', {}).get('collection', [])
+            payload = b''.join(
+                json.dumps(job, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+                for job in jobs
+            )
+            digest = hashlib.sha256(payload).hexdigest()
+            pagination = data.get('base', {}).get('pagination', {})
+
+            entry = {
+                'query': query_key(request_body),
+                'page': pagination.get('page', request_body.get('pagination', {}).get('page')),
+                'size': pagination.get('size', request_body.get('pagination', {}).get('size')),
+                'total_count': pagination.get('totalCount', 0),
+                'count': len(jobs),
+                'digest': digest,
+                'fetched_at': fetched_at.isoformat()
+            }
+
+            with self._lock:
+                self._write_object(digest, payload)
+                with open(self._index_path(fetched_at.strftime('%Y-%m-%d')), 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                self.stats['pages_stored'] += 1
+            return digest
+        except OSError:
+            self.stats['errors'] += 1
+            return None
+
+    def add_stats(self, stats):
+        """다른 인스턴스(프로세스 풀 워커 등)에서 기록한 통계를 합산"""
+        with self._lock:
+            for key, value in stats.items():
+                self.stats[key] = self.stats.get(key, 0) + value
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+    def dates(self):
+        """아카이브된 날짜 목록"""
+        index_dir = os.path.join(self.root_dir, 'index')
+        return sorted(name[:-len('.ndjson')] for name in os.listdir(index_dir)
+                      if name.endswith('.ndjson'))
+
+    def read_index(self, date):
+        """날짜별 색인 항목 전체"""
+        path = self._index_path(date)
+        if not os.path.exists(path):
+            return []
+        with open(path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def queries(self, date):
+        """해당 날짜에 저장된 쿼리 목록"""
+        return sorted({entry['query'] for entry in self.read_index(date)})
+
+    def snapshot(self, date, query, size=None):
+        """
+        (날짜, 쿼리) 스냅샷의 페이지 색인 - 페이지 순서, 같은 (크기, 페이지)는 마지막 수집본 사용
+        페이지 번호는 페이지 크기마다 다른 구간이므로 한 가지 크기만 사용
+        size를 주지 않으면 1페이지부터 끝까지 빠짐없는 크기 중 가장 큰 것,
+        그런 크기가 없으면 가장 많은 공고를 담은 크기 (같으면 큰 것)
+        """
+        by_size = {}
+        for entry in self.read_index(date):
+            if entry['query'] == query:
+                by_size.setdefault(entry.get('size') or PAGE_SIZE, {})[entry['page']] = entry
+        if size is None and by_size:
+            def rank(item):
+                page_size, latest = item
+                total_count = max(entry['total_count'] for entry in latest.values())
+                complete = all(page in latest for page in range(1, page_count(total_count, page_size) + 1))
+                return complete, sum(entry['count'] for entry in latest.values()), page_size
+            size = max(by_size.items(), key=rank)[0]
+        latest = by_size.get(size, {})
+        return [latest[page] for page in sorted(latest)]
+
+    def iter_object_lines(self, digest):
+        """압축 객체를 메모리 매핑해 NDJSON 줄 단위로 스트리밍"""
+        with open(self._object_path(digest), 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with gzip.GzipFile(fileobj=mm, mode='rb') as gz:
+                    for line in gz:
+                        yield line
+
+    def iter_pages(self, date, query, size=None):
+        """스냅샷을 페이지 단위로 스트리밍 - (색인 항목, 공고 목록)"""
+        for entry in self.snapshot(date, query, size):
+            jobs = [json.loads(line) for line in self.iter_object_lines(entry['digest'])]
+            yield entry, jobs
+
+    def iter_postings(self, date, query, size=None):
+        """스냅샷의 공고를 하나씩 스트리밍"""
+        for entry in self.snapshot(date, query, size):
+            for line in self.iter_object_lines(entry['digest']):
+                yield json.loads(line)
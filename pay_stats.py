@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+급여 정규화·분포 통계
+공고의 pay("2,500,000원")와 payType(시급/일급/월급/연봉)을 시급 환산액으로 변환해
+소스·지역·급여 유형별 분포(분위수, 최저임금 미만 비율, 구간별 공고 수)를 계산
+
+- 문자열 파싱과 환산은 수집 단위 전체를 pandas/NumPy 벡터 연산으로 처리
+- 협의(negoPay)이면서 금액이 없거나, 환산 기준이 없는 급여 유형(건별 등)은 NaN으로 제외
+- 수집 중에는 PayCollector가 페이지마다 시급·코드 배열만 남기고 문자열은 버림
+
+사용 예:
+  python pay_stats.py --snapshot snapshots/postings_20250907_ALL.parquet --by source,pay_type
+  python pay_stats.py --archive archive --date 2025-09-07
+"""
+
+import re
+import sys
+import argparse
+import threading
+
+import numpy as np
+import pandas as pd
+
+from analysis_engine import (SOURCE_LABELS, REGION_LABELS, RecruitNoSet, column_region_codes, column_source_codes,
+                             posting_columns)
+from page_archive import PageArchive
+
+# 급여 유형별 시급 환산 시간 (월 209시간 = 주 40시간 + 주휴 기준 월 소정근로시간)
+PAY_TYPE_HOURS = {
+    'HOURLY_WAGE': 1,
+    'DAILY_WAGE': 8,
+    'MONTHLY_SALARY': 209,
+    'YEARLY_SALARY': 209 * 12
+}
+PAY_TYPES = tuple(PAY_TYPE_HOURS) + ('OTHER',)  # 급여 유형 코드 (int8) 순서
+PAY_TYPE_DIVISORS = np.array(list(PAY_TYPE_HOURS.values()) + [np.nan])  # 급여 유형 코드 → 환산 시간
+
+MINIMUM_WAGE = 10030  # 2025년 최저시급
+HOURLY_RANGE = (1000, 500000)  # 이 범위를 벗어난 시급 환산액은 입력 오류로 보고 제외
+PAY_BINS = (0, MINIMUM_WAGE, 12000, 15000, 20000, 30000, np.inf)  # 분포 구간 (시급, 원)
+GROUP_COLUMNS = ('source', 'region', 'pay_type')
+AMOUNT_PATTERN = re.compile(r'\d[\d,]*')
+
+
+def parse_amounts(pay):
+    """
+    급여 문자열 배열 → 금액 배열 (첫 숫자, 범위 표기는 하한, 숫자가 없으면 NaN)
+    같은 금액 표기가 반복되므로 고유한 문자열만 파싱해 다시 펼침
+    """
+    codes, uniques = pd.factorize(np.asarray(pay, dtype=object))
+    amounts = np.full(len(uniques) + 1, np.nan)  # 마지막 칸은 값이 없는 공고(코드 -1)
+    for i, text in enumerate(uniques):
+        match = AMOUNT_PATTERN.search(text or '')
+        if match:
+            amounts[i] = float(match.group().replace(',', ''))
+    return amounts[codes]
+
+
+def _codes(values, labels):
+    """문자열 배열 → labels 인덱스 코드 (int8, 없는 값은 마지막 코드) - 고유한 값만 조회"""
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+    index = {label: i for i, label in enumerate(labels)}
+    other = len(labels) - 1
+    table = np.array([index.get(value, other) for value in uniques] + [other], dtype=np.int8)
+    return table[codes]
+
+
+def hourly_pay(pay, pay_type, nego_pay=None):
+    """
+    급여 문자열·급여 유형(payType.key) 배열 → 시급 환산액 배열 (float64, 제외 대상은 NaN)
+    협의 공고는 금액이 적혀 있으면 그 금액을 사용
+    """
+    amounts = parse_amounts(pay)
+    hourly = amounts / PAY_TYPE_DIVISORS[_codes(pay_type, PAY_TYPES)]
+    if nego_pay is not None:
+        hourly[np.asarray(nego_pay, dtype=bool) & ~(amounts > 0)] = np.nan
+    low, high = HOURLY_RANGE
+    hourly[~((hourly >= low) & (hourly <= high))] = np.nan
+    return hourly
+
+
+def pay_columns(columns):
+    """
+    페이지 공고 열(analysis_engine.posting_columns) → 급여 분석 열 (코드는 SOURCE_LABELS·REGION_LABELS·PAY_TYPES 인덱스)
+    """
+    return {
+        'hourly_pay': hourly_pay(columns['pay'], columns['pay_type'], columns.get('nego_pay')),
+        'source': column_source_codes(columns),
+        'region': column_region_codes(columns),
+        'pay_type': _codes(columns['pay_type'], PAY_TYPES)
+    }
+
+
+def pay_frame(columns):
+    """급여 분석 열 → DataFrame (source/region/pay_type은 category)"""
+    return pd.DataFrame({
+        'source': pd.Categorical.from_codes(columns['source'], SOURCE_LABELS),
+        'region': pd.Categorical.from_codes(columns['region'], REGION_LABELS),
+        'pay_type': pd.Categorical.from_codes(columns['pay_type'], PAY_TYPES),
+        'hourly_pay': columns['hourly_pay']
+    })
+
+
+class PayCollector:
+    """
+    수집 중 급여 열 누적 - AnalysisEngine(pay_stats=...)에 넘기면 수집한 페이지를 자동 반영
+    공고당 시급(float32)과 코드 3개(int8), 중복 확인용 recruitNo(int64 정렬 배열)만 보관 (공고 27만 개에 약 4MB)
+    같은 recruitNo는 처음 한 번만 반영 (경계 탐색·재수집 중복 제거)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._chunks = []
+        self._seen = RecruitNoSet()
+
+    def write_page(self, columns, request_body=None, query=None):
+        parsed = pay_columns(columns)
+        with self._lock:
+            keep = self._seen.add_new(columns['recruit_no'])
+            if keep.any():
+                self._chunks.append({
+                    'hourly_pay': parsed['hourly_pay'][keep].astype(np.float32),
+                    'source': parsed['source'][keep],
+                    'region': parsed['region'][keep],
+                    'pay_type': parsed['pay_type'][keep]
+                })
+
+    def frame(self):
+        """누적한 공고의 급여 DataFrame"""
+        with self._lock:
+            chunks = list(self._chunks)
+        if not chunks:
+            chunks = [{'hourly_pay': np.zeros(0, dtype=np.float32), 'source': np.zeros(0, dtype=np.int8),
+                       'region': np.zeros(0, dtype=np.int8), 'pay_type': np.zeros(0, dtype=np.int8)}]
+        return pay_frame({name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]})
+
+
+def pay_distribution(frame, by='source'):
+    """
+    by 열별 시급 환산액 분포
+    반환: DataFrame (postings, parsed, mean, p10, p25, median, p75, p90, below_minimum)
+    below_minimum은 환산액이 있는 공고 중 최저시급 미만 비율 (월급·연봉은 주휴 포함 209시간 기준이라 근사값)
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    unknown = set(by) - set(GROUP_COLUMNS)
+    if unknown:
+        raise ValueError(f"집계 기준은 {', '.join(GROUP_COLUMNS)} 중에서 선택: {', '.join(sorted(unknown))}")
+    grouped = frame.groupby(by, observed=True)['hourly_pay']
+    quantiles = pd.DataFrame({name: grouped.quantile(q) for name, q in
+                              (('p10', 0.1), ('p25', 0.25), ('median', 0.5), ('p75', 0.75), ('p90', 0.9))})
+    below = (frame['hourly_pay'] < MINIMUM_WAGE).where(frame['hourly_pay'].notna())
+    table = pd.DataFrame({
+        'postings': grouped.size(),
+        'parsed': grouped.count(),
+        'mean': grouped.mean(),
+        'below_minimum': below.groupby([frame[column] for column in by], observed=True).mean()
+    }).join(quantiles)
+    table = table[['postings', 'parsed', 'mean', 'p10', 'p25', 'median', 'p75', 'p90', 'below_minimum']]
+    return table.round({'mean': 0, 'p10': 0, 'p25': 0, 'median': 0, 'p75': 0, 'p90': 0, 'below_minimum': 4})
+
+
+def pay_histogram(frame, by='source', bins=PAY_BINS):
+    """by 열별 시급 구간(bins)별 공고 수 DataFrame (행: by, 열: 구간)"""
+    buckets = pd.cut(frame['hourly_pay'], bins=list(bins), right=False)
+    return pd.crosstab(frame[by], buckets)
+
+
+def pay_summary(frame):
+    """리포트 전송용 요약 - 소스·급여 유형·지역별 분포를 JSON 직렬화 가능한 dict로"""
+    def records(by):
+        table = pay_distribution(frame, by).reset_index()
+        table[by] = table[by].astype(str)
+        return table.astype(object).where(table.notna(), None).to_dict('records')
+
+    total = len(frame)
+    parsed = int(frame['hourly_pay'].notna().sum())
+    return {
+        'postings': total,
+        'parsed': parsed,
+        'median_hourly_pay': float(frame['hourly_pay'].median()) if parsed else None,
+        'minimum_wage': MINIMUM_WAGE,
+        'by_source': records('source'),
+        'by_pay_type': records('pay_type'),
+        'by_region': records('region')
+    }
+
+
+def load_frame(snapshot=None, archive=None, date=None, query='search_ALL_RELATION'):
+    """Parquet 스냅샷 또는 아카이브에서 급여 DataFrame 생성 (네트워크 요청 없음)"""
+    if snapshot:
+        from snapshot_export import load_snapshot
+        import pyarrow.parquet as pq
+        names = ['recruit_no', 'source', 'is_paid', 'workplace_area', 'pay_type', 'pay', 'nego_pay']
+        available = set(pq.read_schema(snapshot).names)  # nego_pay 열이 없는 이전 스냅샷 호환
+        data = load_snapshot(snapshot, columns=[name for name in names if name in available])
+        columns = {name: data[name].astype(object).to_numpy() if name not in ('recruit_no', 'is_paid', 'nego_pay')
+                   else data[name].to_numpy() for name in data.columns}
+        return pay_frame(pay_columns(columns))
+
+    collector = PayCollector()
+    archive = PageArchive(archive) if isinstance(archive, str) else archive
+    for entry, jobs in archive.iter_pages(date, query):
+        collector.write_page(posting_columns(jobs, entry['page']))
+    return collector.frame()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="급여 시급 환산 분포")
+    parser.add_argument('--snapshot', help="Parquet 스냅샷 경로 (snapshot_export)")
+    parser.add_argument('--archive', default='archive', help="아카이브 디렉터리 (스냅샷을 주지 않을 때)")
+    parser.add_argument('--date', help="아카이브 스냅샷 날짜 (YYYY-MM-DD)")
+    parser.add_argument('--query', default='search_ALL_RELATION', help="쿼리 식별자")
+    parser.add_argument('--by', default='source', help="집계 기준 (source,region,pay_type)")
+    args = parser.parse_args()
+
+    if not args.snapshot and not args.date:
+        parser.error("--snapshot 또는 --date가 필요합니다")
+    frame = load_frame(args.snapshot, args.archive, args.date, args.query)
+    if frame.empty:
+        print("❌ 급여를 계산할 공고가 없습니다")
+        return 1
+
+    by = args.by.split(',')
+    print(f"💰 시급 환산 분포 ({frame['hourly_pay'].notna().sum():,}/{len(frame):,}개 공고, "
+          f"최저시급 {MINIMUM_WAGE:,}원)")
+    print(pay_distribution(frame, by).to_string())
+    print("\n📊 시급 구간별 공고 수")
+    print(pay_histogram(frame, by[0]).to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
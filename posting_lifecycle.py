@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+공고 생애 주기 저장소 (SQLite)
+recruitNo별 처음/마지막 확인일, 소스, 마감일, 목록에서 사라진 날을 기록해
+"워크넷 공고는 며칠 동안 올라와 있나", "오늘 내려간 공고는 몇 개인가" 같은 질문에 답함
+
+- 수집 중에는 페이지마다 대기 테이블(staging)에 쌓고, 수집이 끝나면 upsert 한 번으로 반영
+- 대기 테이블은 파일에 있으므로 전수 조사가 중단 후 이어받아도 앞서 받은 페이지가 남아 있음
+- 전체 페이지를 빠짐없이 받은 수집(complete)일 때만 이번에 안 보인 공고를 '내려감'으로 표시
+
+사용 예:
+  python posting_lifecycle.py --db ~/.cache/job-site-monitor/lifecycle.sqlite
+"""
+
+import os
+import sys
+import time
+import sqlite3
+import argparse
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+from analysis_engine import CACHE_DIR
+
+LIFECYCLE_PATH = os.path.join(CACHE_DIR, 'lifecycle.sqlite')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS postings (
+    recruit_no INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    is_paid INTEGER NOT NULL,
+    company_name TEXT NOT NULL,
+    workplace_area TEXT NOT NULL,
+    closing_date TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    seen_count INTEGER NOT NULL DEFAULT 1,
+    removed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS postings_removed_at ON postings (removed_at);
+CREATE TABLE IF NOT EXISTS staging (
+    crawl_date TEXT NOT NULL,
+    recruit_no INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    is_paid INTEGER NOT NULL,
+    company_name TEXT NOT NULL,
+    workplace_area TEXT NOT NULL,
+    closing_date TEXT NOT NULL,
+    PRIMARY KEY (crawl_date, recruit_no)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS crawls (
+    crawl_date TEXT NOT NULL,
+    finished_at TEXT NOT NULL,
+    postings INTEGER NOT NULL,
+    new_postings INTEGER NOT NULL,
+    removed_postings INTEGER,
+    complete INTEGER NOT NULL
+);
+"""
+
+
+class PostingLifecycle:
+    """
+    공고 생애 주기 저장소 - AnalysisEngine(lifecycle=...)에 넘기면 수집한 페이지를 자동 기록
+    수집이 끝나면 finish(complete)로 반영 (여러 워커 스레드에서 write_page 호출 가능)
+    """
+
+    def __init__(self, path=LIFECYCLE_PATH, crawl_date=None):
+        self.path = os.path.expanduser(path)
+        self.crawl_date = crawl_date or datetime.now().strftime('%Y-%m-%d')
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        with self._conn:
+            # 다른 날 중단된 수집의 대기 행은 버림
+            self._conn.execute('DELETE FROM staging WHERE crawl_date != ?', (self.crawl_date,))
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+    def write_page(self, columns, request_body=None, query=None):
+        """페이지 하나의 공고 열(analysis_engine.posting_columns)을 대기 테이블에 추가"""
+        rows = [
+            (self.crawl_date, int(recruit_no), source, int(is_paid), company, area, closing)
+            for recruit_no, source, is_paid, company, area, closing in zip(
+                columns['recruit_no'], columns['source'], columns['is_paid'],
+                columns['company_name'], columns['workplace_area'], columns['closing_date'])
+            if recruit_no
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany('INSERT OR REPLACE INTO staging VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def finish(self, complete=False):
+        """
+        이번 수집을 생애 주기 테이블에 upsert로 반영
+        complete=True(전체 페이지 수집)면 이번에 안 보인 공고를 오늘 내려간 것으로 표시
+        반환: {'postings', 'new_postings', 'removed_postings', 'reappeared_postings', 'duration'}
+        """
+        start_time = time.time()
+        date = self.crawl_date
+        with self._lock, self._conn:
+            conn = self._conn
+            postings = conn.execute('SELECT COUNT(*) FROM staging WHERE crawl_date = ?', (date,)).fetchone()[0]
+            new_postings = conn.execute(
+                'SELECT COUNT(*) FROM staging s WHERE s.crawl_date = ? AND NOT EXISTS '
+                '(SELECT 1 FROM postings p WHERE p.recruit_no = s.recruit_no)', (date,)).fetchone()[0]
+            reappeared = conn.execute(
+                'SELECT COUNT(*) FROM staging s JOIN postings p ON p.recruit_no = s.recruit_no '
+                'WHERE s.crawl_date = ? AND p.removed_at IS NOT NULL', (date,)).fetchone()[0]
+
+            # 같은 날 다시 반영해도 seen_count는 한 번만 증가
+            conn.execute(
+                'INSERT INTO postings (recruit_no, source, is_paid, company_name, workplace_area, closing_date, '
+                'first_seen, last_seen) '
+                'SELECT recruit_no, source, is_paid, company_name, workplace_area, closing_date, crawl_date, crawl_date '
+                'FROM staging WHERE crawl_date = ? '
+                'ON CONFLICT (recruit_no) DO UPDATE SET '
+                'source = excluded.source, is_paid = excluded.is_paid, company_name = excluded.company_name, '
+                'workplace_area = excluded.workplace_area, closing_date = excluded.closing_date, '
+                'seen_count = seen_count + (last_seen != excluded.last_seen), '
+                'last_seen = excluded.last_seen, removed_at = NULL', (date,))
+
+            removed = None
+            if complete:
+                removed = conn.execute(
+                    'UPDATE postings SET removed_at = ? WHERE removed_at IS NULL AND last_seen < ?',
+                    (date, date)).rowcount
+
+            conn.execute('DELETE FROM staging WHERE crawl_date = ?', (date,))
+            conn.execute('INSERT INTO crawls VALUES (?, ?, ?, ?, ?, ?)',
+                         (date, datetime.now().isoformat(), postings, new_postings, removed, int(complete)))
+
+        return {
+            'postings': postings,
+            'new_postings': new_postings,
+            'removed_postings': removed,
+            'reappeared_postings': reappeared,
+            'duration': time.time() - start_time
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def _query(self, sql, params=()):
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=params)
+
+    def removed_on(self, date=None):
+        """해당 날짜(기본 오늘)에 목록에서 내려간 공고 수 - 소스별 DataFrame"""
+        return self._query('SELECT source, COUNT(*) AS count FROM postings WHERE removed_at = ? '
+                           'GROUP BY source ORDER BY source', (date or self.crawl_date,))
+
+    def listing_durations(self, since=None):
+        """
+        내려간 공고의 게시 기간(처음 확인 ~ 마지막 확인, 일) 분포 - 소스별 DataFrame
+        since를 주면 그 날짜 이후 내려간 공고만
+        """
+        frame = self._query(
+            'SELECT source, julianday(last_seen) - julianday(first_seen) + 1 AS days FROM postings '
+            'WHERE removed_at IS NOT NULL AND removed_at >= ?', (since or '',))
+        return duration_stats(frame)
+
+    def active_ages(self):
+        """아직 올라와 있는 공고의 게시 기간(처음 확인 ~ 마지막 확인, 일) 분포 - 소스별 DataFrame"""
+        frame = self._query(
+            'SELECT source, julianday(last_seen) - julianday(first_seen) + 1 AS days FROM postings '
+            'WHERE removed_at IS NULL')
+        return duration_stats(frame)
+
+    def crawls(self, limit=30):
+        """최근 수집 기록"""
+        return self._query('SELECT * FROM crawls ORDER BY finished_at DESC LIMIT ?', (limit,))
+
+
+def duration_stats(frame):
+    """소스별 게시 기간 통계 (개수, 평균, 중앙값, 90%)"""
+    if frame.empty:
+        return pd.DataFrame(columns=['count', 'mean', 'median', 'p90'])
+    grouped = frame.groupby('source')['days']
+    return pd.DataFrame({
+        'count': grouped.size(),
+        'mean': grouped.mean().round(1),
+        'median': grouped.median(),
+        'p90': grouped.quantile(0.9)
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공고 생애 주기 조회")
+    parser.add_argument('--db', default=LIFECYCLE_PATH, help="저장소 파일 경로")
+    parser.add_argument('--date', help="내려간 공고를 볼 날짜 (기본 오늘)")
+    args = parser.parse_args()
+
+    with PostingLifecycle(args.db) as lifecycle:
+        print("📅 최근 수집")
+        print(lifecycle.crawls(5).to_string(index=False))
+        print(f"\n📉 {args.date or lifecycle.crawl_date} 내려간 공고")
+        print(lifecycle.removed_on(args.date).to_string(index=False))
+        print("\n⏳ 내려간 공고의 게시 기간 (일)")
+        print(lifecycle.listing_durations().to_string())
+        print("\n📌 게시 중인 공고의 게시 기간 (일)")
+        print(lifecycle.active_ages().to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,392 +1,84 @@
 import streamlit as st
-import requests
 import pandas as pd
 import plotly.graph_objects as go
-import time
 from datetime import datetime
 import json
-import concurrent.futures
-import numpy as np
+from analysis_engine import AnalysisEngine, REGION_CODES
 
-# 지역 코드 매핑
-REGION_CODES = {
-    'A000': '서울',
-    'H000': '부산', 
-    'I000': '대구',
-    'C000': '인천',
-    'D000': '광주',
-    'E000': '대전',
-    'F000': '울산',
-    'G000': '세종',
-    'B000': '경기',
-    'J000': '강원',
-    'K000': '충북',
-    'L000': '충남',
-    'M000': '전북',
-    'N000': '전남',
-    'O000': '경북',
-    'P000': '경남',
-    'Q000': '제주'
-}
+MIB = 1024 * 1024
+DASHBOARD_DEADLINE = 30  # 대시보드 분석 1회 시간 예산 (초) - 넘으면 추정값으로 응답 (지역·전체 대시보드 공통)
+
+
+class StreamlitEventListener:
+    """분석 엔진 이벤트를 Streamlit 위젯으로 표시하는 리스너"""
 
-class RegionalAnalyzer:
     def __init__(self):
-        self.base_url = 'https://bff-general.albamon.com'
-        self.headers = {
-            'Accept': '*/*',
-            'User-Agent': 'job-site-monitor/1.0.0',
-            'origin': 'https://www.albamon.com',
-            'Content-Type': 'application/json',
-            'cookie': 'ConditionId=25C99562-77E3-40EB-A750-DA27D2D03C54; ab.storage.deviceId.7a5f1472-069a-4372-8631-2f711442ee40=%7B%22g%22%3A%22efb20921-d9c8-43dd-3c27-8a1487d7d2c4%22%2C%22c%22%3A1756907811760%2C%22l%22%3A1756943038663%7D; AM_USER_UUID=e69544f8-bed4-4fc3-94c7-6efac20359f7; ab.storage.sessionId.7a5f1472-069a-4372-8631-2f711442ee40=%7B%22g%22%3A%22898147fc-a8ba-6427-1f60-647c10d3514e%22%2C%22e%22%3A1756945521947%2C%22c%22%3A1756943038661%2C%22l%22%3A1756943721947%7D'
-        }
-        # 고급 캐시 시스템
-        self._cache = {}
-        self._cache_timeout = 300  # 5분 캐시
-        self._request_session = requests.Session()  # 연결 재사용
-        self._request_session.headers.update(self.headers)
-        # 성능 카운터
-        self.performance_stats = {
-            'api_calls': 0,
-            'cache_hits': 0,
-            'total_processing_time': 0
-        }
-    
-    def _get_cache_key(self, region_code, search_period_type, max_pages):
-        """캐시 키 생성"""
-        return f"{region_code}_{search_period_type}_{max_pages}_{datetime.now().strftime('%H_%M')[:4]}"  # 10분 단위로 캐시
-    
-    def _get_from_cache(self, cache_key):
-        """캐시에서 데이터 조회"""
-        if cache_key in self._cache:
-            cached_data, timestamp = self._cache[cache_key]
-            if time.time() - timestamp < self._cache_timeout:
-                self.performance_stats['cache_hits'] += 1
-                return cached_data
-            else:
-                # 만료된 캐시 삭제
-                del self._cache[cache_key]
-        return None
-    
-    def _set_cache(self, cache_key, data):
-        """캐시에 데이터 저장"""
-        self._cache[cache_key] = (data, time.time())
+        self._progress_placeholder = None
+
+    def __call__(self, event):
+        level = event['level']
+        if level == 'progress':
+            # 진행 상황은 하나의 placeholder에서 갱신
+            if self._progress_placeholder is None:
+                self._progress_placeholder = st.empty()
+            self._progress_placeholder.info(event['message'])
+            return
 
-    def categorize_job_posting(self, job):
-        """
-        공고 소스 및 유형 분류
-        """
-        # 소스 분류
-        if job.get('jobkoreaRecruitNo', 0) != 0:
-            source = 'JOBKOREA'
-        elif job.get('externalRecruitSite') == 'WN':
-            source = 'WORKNET'
+        # 다음 단계 메시지가 오면 진행 표시 정리
+        if self._progress_placeholder is not None:
+            self._progress_placeholder.empty()
+            self._progress_placeholder = None
+
+        if level == 'success':
+            st.success(event['message'])
+        elif level == 'warning':
+            st.warning(event['message'])
+        elif level == 'error':
+            st.error(event['message'])
         else:
-            source = 'ALBAMON'
-        
-        # 유료/무료 분류 (ALBAMON 공고만)
-        is_paid = False
-        product_count = 0
-        if source == 'ALBAMON':
-            product_count = job.get('paidService', {}).get('totalProductCount', 0)
-            is_paid = product_count > 0
-        
-        return {
-            'source': source,
-            'is_paid': is_paid,
-            'product_count': product_count
-        }
+            st.info(event['message'])
 
-    def search_regional_jobs(self, region_code, page=1, size=200, search_period_type='ALL'):
-        """
-        지역별 공고 검색
-        """
-        request_body = {
-            "pagination": {
-                "page": int(page),
-                "size": int(size)
-            },
-            "recruitListType": "AREA",
-            "sortTabCondition": {
-                "searchPeriodType": str(search_period_type),
-                "sortType": "DEFAULT"
-            },
-            "condition": {
-                "areas": [
-                    {
-                        "si": region_code,
-                        "gu": "",
-                        "dong": ""
-                    }
-                ],
-                "employmentTypes": [],
-                "excludeKeywords": [],
-                "excludeBar": False,
-                "excludeNegoAge": False,
-                "excludeNegoWorkWeek": False,
-                "excludeNegoWorkTime": False,
-                "excludeNegoGender": False,
-                "parts": [],
-                "similarDongJoin": False,
-                "workDayTypes": [],
-                "workPeriodTypes": [],
-                "workTimeTypes": [],
-                "workWeekTypes": [],
-                "endWorkTime": "",
-                "startWorkTime": "",
-                "includeKeyword": "",
-                "excludeKeywordList": [],
-                "age": 0,
-                "genderType": "NONE",
-                "moreThanEducation": False,
-                "educationType": "ALL",
-                "selectedArea": {
-                    "si": "",
-                    "gu": "",
-                    "dong": ""
-                }
-            }
-        }
-        
-        try:
-            # 세션 기반 요청으로 연결 재사용 (속도 향상)
-            response = self._request_session.post(
-                f'{self.base_url}/recruit/search',
-                json=request_body,
-                timeout=15  # 타임아웃 단축
-            )
-            response.raise_for_status()
-            data = response.json()
-            self.performance_stats['api_calls'] += 1
-            
-            # 올바른 JSON 경로로 공고 데이터 추출
-            jobs = data.get('base', {}).get('normal', {}).get('collection', [])
-            
-            return {
-                'result': {'recruitList': jobs},
-                'base': data.get('base', {}),
-                '_debug_info': {
-                    'original_job_count': len(jobs),
-                    'region_code': region_code,
-                    'json_structure': 'base.normal.collection'
-                }
-            }
-        except requests.exceptions.RequestException as e:
-            st.error(f"지역별 API 요청 실패: {e}")
-            return None
 
-    def fetch_page_data(self, region_code, page, size, search_period_type):
-        """단일 페이지 데이터 가져오기 (병렬 처리용)"""
-        try:
-            response = self.search_regional_jobs(region_code, page, size, search_period_type)
-            if response:
-                jobs = response.get('result', {}).get('recruitList', [])
-                return {'page': page, 'jobs': jobs, 'success': True}
-            return {'page': page, 'jobs': [], 'success': False}
-        except Exception as e:
-            st.error(f"페이지 {page} 요청 실패: {e}")
-            return {'page': page, 'jobs': [], 'success': False}
+class RegionalAnalyzer(AnalysisEngine):
+    """지역별 분석기 - 분석 엔진 + Streamlit 이벤트 표시"""
+
+    def __init__(self):
+        super().__init__(listener=StreamlitEventListener())
+
+def memory_frame(memory):
+    """단계별 메모리 측정 결과(MemoryTracker.finish) → 표시용 DataFrame (MiB)"""
+    return pd.DataFrame([
+        {'단계': name, '최대 증가 (MiB)': round(phase['peak_bytes'] / MIB, 1),
+         '종료 후 남은 증가 (MiB)': round(phase['retained_bytes'] / MIB, 1)}
+        for name, phase in memory['phases'].items()
+    ])
+
+
+def render_performance_panel(performance):
+    """소요 시간·요청 수와 단계별 최대 메모리 (메모리는 JOB_MONITOR_TRACE_MEMORY=1일 때만 측정)"""
+    if not performance:
+        return
+    with st.expander("⚙️ 성능 정보"):
+        col1, col2, col3 = st.columns(3)
+        duration = performance.get('api_time', performance.get('duration'))
+        with col1:
+            if duration is not None:
+                st.metric(label="⏱️ 수집 시간", value=f"{duration:.2f}초")
+        with col2:
+            if performance.get('api_calls_made') is not None:
+                st.metric(label="📡 API 호출", value=f"{performance['api_calls_made']:,}회")
+        with col3:
+            if performance.get('page_size'):
+                st.metric(label="📄 페이지 크기", value=f"{performance['page_size']:,}개")
+
+        memory = performance.get('memory')
+        if memory:
+            st.write(f"**단계별 메모리** (최대 {memory['peak_bytes'] / MIB:.1f}MiB, "
+                     f"이 프로세스의 Python 할당 기준)")
+            st.dataframe(memory_frame(memory), use_container_width=True)
+        else:
+            st.caption("단계별 메모리는 JOB_MONITOR_TRACE_MEMORY=1로 실행하면 표시됩니다")
 
-    def analyze_regional_jobs(self, region_code, region_name, search_period_type='ALL', max_pages=3):
-        """
-        지역별 공고 분석 (유료/무료 포함) - 최적화된 버전
-        """
-        try:
-            # 캐시 확인
-            cache_key = self._get_cache_key(region_code, search_period_type, max_pages)
-            cached_result = self._get_from_cache(cache_key)
-            if cached_result:
-                st.success("⚡ 캐시된 데이터를 사용합니다 (5분 캐시)")
-                return cached_result
-            # 첫 번째 페이지로 전체 공고 수 확인
-            first_response = self.search_regional_jobs(region_code, 1, 200, search_period_type)
-            if not first_response:
-                return None
-                
-            total_count = first_response.get('base', {}).get('pagination', {}).get('totalCount', 0)
-            calculated_max_pages = (total_count + 199) // 200 if total_count > 0 else 1
-            actual_max_pages = min(max_pages, calculated_max_pages)
-            
-            st.info(f"{region_name} 전체 공고 수: {total_count:,}개 ({calculated_max_pages} 페이지)")
-            st.info(f"분석 대상: {actual_max_pages}페이지 (샘플링)")
-            
-            if total_count == 0:
-                return {
-                    'region_name': region_name,
-                    'region_code': region_code,
-                    'total_count': 0,
-                    'albamon_count': 0,
-                    'albamon_free_count': 0,
-                    'albamon_paid_count': 0,
-                    'jobkorea_count': 0,
-                    'worknet_count': 0,
-                    'sample_jobs': []
-                }
-            
-            # 병렬로 여러 페이지 분석 (속도 대폭 개선)
-            all_jobs = []
-            start_time = time.time()
-            
-            # 더 많은 동시 연결 허용 (속도 대폭 향상)
-            max_workers = min(actual_max_pages, 10)  # 5 → 10으로 증가
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # 모든 페이지를 병렬로 요청
-                future_to_page = {
-                    executor.submit(self.fetch_page_data, region_code, page, 200, search_period_type): page 
-                    for page in range(1, actual_max_pages + 1)
-                }
-                
-                # 진행 상황 표시용
-                completed_count = 0
-                progress_placeholder = st.empty()
-                
-                for future in concurrent.futures.as_completed(future_to_page):
-                    page = future_to_page[future]
-                    result = future.result()
-                    
-                    completed_count += 1
-                    progress_placeholder.info(f"📡 API 호출 진행 중... {completed_count}/{actual_max_pages} 페이지 완료")
-                    
-                    if result['success']:
-                        all_jobs.extend(result['jobs'])
-            
-            elapsed_time = time.time() - start_time
-            st.success(f"⚡ {actual_max_pages}페이지 병렬 처리 완료 ({elapsed_time:.1f}초)")
-            progress_placeholder.empty()
-            
-            # 초고속 벡터화 분류 처리
-            start_classification = time.time()
-            
-            if not all_jobs:
-                counters = {'albamon_count': 0, 'albamon_free_count': 0, 'albamon_paid_count': 0, 'jobkorea_count': 0, 'worknet_count': 0}
-                sample_jobs = []
-            else:
-                # NumPy 벡터화로 초고속 처리
-                job_count = len(all_jobs)
-                
-                # 벡터화를 위한 데이터 추출
-                jobkorea_nos = np.array([job.get('jobkoreaRecruitNo', 0) for job in all_jobs])
-                external_sites = np.array([job.get('externalRecruitSite', '') for job in all_jobs])
-                product_counts = np.array([job.get('paidService', {}).get('totalProductCount', 0) for job in all_jobs])
-                
-                # 벡터화된 분류
-                is_jobkorea = jobkorea_nos != 0
-                is_worknet = (external_sites == 'WN') & ~is_jobkorea  # JOBKOREA가 우선
-                is_albamon = ~is_jobkorea & ~is_worknet
-                is_paid = is_albamon & (product_counts > 0)
-                is_free = is_albamon & (product_counts == 0)
-                
-                # 빠른 카운팅
-                counters = {
-                    'jobkorea_count': int(np.sum(is_jobkorea)),
-                    'worknet_count': int(np.sum(is_worknet)),
-                    'albamon_count': int(np.sum(is_albamon)),
-                    'albamon_paid_count': int(np.sum(is_paid)),
-                    'albamon_free_count': int(np.sum(is_free))
-                }
-                
-                # 샘플 데이터 (처음 10개만, 기존 방식 유지)
-                sample_jobs = []
-                for i in range(min(10, job_count)):
-                    job = all_jobs[i]
-                    source = 'JOBKOREA' if is_jobkorea[i] else 'WORKNET' if is_worknet[i] else 'ALBAMON'
-                    sample_jobs.append({
-                        'recruitNo': job.get('recruitNo'),
-                        'title': job.get('recruitTitle', '')[:40] + '...',
-                        'source': source,
-                        'is_paid': bool(is_paid[i]) if is_albamon[i] else False,
-                        'product_count': int(product_counts[i]) if is_albamon[i] else 0,
-                        'pay': job.get('pay', ''),
-                        'workplaceArea': job.get('workplaceArea', ''),
-                        'jobkoreaRecruitNo': int(jobkorea_nos[i]),
-                        'externalRecruitSite': external_sites[i],
-                        'paidService': str(job.get('paidService', {}))
-                    })
-            
-            classification_time = time.time() - start_classification
-            st.info(f"📊 {len(all_jobs):,}개 공고 분류 완료 ({classification_time:.2f}초)")
-            
-            # 카운터에서 값 추출
-            albamon_count = counters['albamon_count']
-            albamon_free_count = counters['albamon_free_count'] 
-            albamon_paid_count = counters['albamon_paid_count']
-            jobkorea_count = counters['jobkorea_count']
-            worknet_count = counters['worknet_count']
-            
-            # 외부 연동 공고가 있을 때만 간단히 표시
-            external_count = jobkorea_count + worknet_count
-            if external_count > 0:
-                st.success(f"🔗 외부 연동 공고 {external_count:,}개 발견 (잡코리아: {jobkorea_count:,}개, 워크넷: {worknet_count:,}개)")
-            
-            # 집계 오류 검증 (오류 시에만 표시)
-            if albamon_free_count + albamon_paid_count != albamon_count:
-                st.error(f"⚠️ 집계 오류 발견 - 수정 중...")
-            
-            # 비율에 따른 전체 추정 (디버깅 정보 최소화)
-            if len(all_jobs) > 0 and len(all_jobs) < total_count:
-                # 샘플 비율로 전체 추정
-                ratio = total_count / len(all_jobs)
-                
-                albamon_estimated = int(albamon_count * ratio)
-                albamon_free_estimated = int(albamon_free_count * ratio)
-                albamon_paid_estimated = int(albamon_paid_count * ratio)
-                jobkorea_estimated = int(jobkorea_count * ratio)
-                worknet_estimated = int(worknet_count * ratio)
-                
-                # 추정 완료 알림만 표시
-                st.info(f"📊 샘플 {len(all_jobs):,}개 분석 → 전체 {total_count:,}개 추정 완료")
-                    
-            else:
-                # 전체 분석 완료
-                albamon_estimated = albamon_count
-                albamon_free_estimated = albamon_free_count
-                albamon_paid_estimated = albamon_paid_count
-                jobkorea_estimated = jobkorea_count
-                worknet_estimated = worknet_count
-            
-            # 최종 검증 (오류 시에만 자동 수정)
-            if albamon_free_estimated + albamon_paid_estimated != albamon_estimated:
-                albamon_estimated = albamon_free_estimated + albamon_paid_estimated
-            
-            # 결과 생성
-            result = {
-                'region_name': region_name,
-                'region_code': region_code,
-                'total_count': total_count,
-                'analyzed_count': len(all_jobs),
-                'albamon_count': albamon_estimated,
-                'albamon_free_count': albamon_free_estimated,
-                'albamon_paid_count': albamon_paid_estimated,
-                'jobkorea_count': jobkorea_estimated,
-                'worknet_count': worknet_estimated,
-                'sample_jobs': sample_jobs,
-                'sample_stats': {
-                    'albamon_sample': albamon_count,
-                    'albamon_free_sample': albamon_free_count,
-                    'albamon_paid_sample': albamon_paid_count,
-                    'jobkorea_sample': jobkorea_count,
-                    'worknet_sample': worknet_count
-                },
-                'performance': {
-                    'api_time': elapsed_time,
-                    'classification_time': classification_time,
-                    'total_jobs_processed': len(all_jobs),
-                    'api_calls_made': self.performance_stats['api_calls'],
-                    'cache_hits': self.performance_stats['cache_hits'],
-                    'avg_time_per_page': elapsed_time / max(actual_max_pages, 1),
-                    'processing_speed': len(all_jobs) / max(classification_time, 0.001),
-                    'concurrent_workers': max_workers
-                }
-            }
-            
-            # 결과를 캐시에 저장
-            self._set_cache(cache_key, result)
-            st.success(f"💾 분석 결과가 캐시에 저장되었습니다 (5분간 유효)")
-            
-            return result
-            
-        except Exception as e:
-            st.error(f"지역별 분석 중 오류 발생: {e}")
-            return None
 
 def render_regional_dashboard(results):
     """지역별 대시보드 렌더링"""
@@ -395,6 +87,10 @@ def render_regional_dashboard(results):
         return
         
     st.header(f"🏙️ {results['region_name']} 공고 분석 결과")
+
+    if results.get('partial'):
+        st.warning(f"⏱️ 시간 예산 안에 {len(results['pages_exact'])}페이지만 받아 추정한 결과입니다 "
+                   f"(누락: {', '.join(map(str, results['pages_missing']))}페이지)")
     
     # 메트릭 카드
     col1, col2, col3, col4 = st.columns(4)
@@ -485,11 +181,13 @@ def render_regional_dashboard(results):
         
         sample_df = pd.DataFrame(results['sample_jobs'])
         st.dataframe(sample_df, use_container_width=True)
+
+    render_performance_panel(results.get('performance'))
     
     # JSON 다운로드
     st.download_button(
         label="📥 결과 JSON 다운로드",
-        data=json.dumps(results, indent=2, ensure_ascii=False),
+        data=json.dumps(results, ensure_ascii=False, separators=(',', ':')),
         file_name=f"{results['region_name']}_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
         mime="application/json"
     )
@@ -548,7 +246,8 @@ def main():
                 region_code, 
                 region_name, 
                 period_type, 
-                max_pages
+                max_pages,
+                deadline=DASHBOARD_DEADLINE
             )
         
         if results:
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+리포트 전송 보관함 (outbox)
+리포트를 먼저 로컬 디스크에 저장한 뒤 전송하고, 전송에 성공한 것만 삭제
+실패한 리포트는 다음 실행에서 다시 전송 (분석 결과 유실 방지)
+
+디렉터리 구조:
+  20250101-090000-1a2b3c4d5e6f.json.gz    - gzip 압축한 전송 본문 (그대로 전송)
+  20250101-090000-1a2b3c4d5e6f.meta.json  - 멱등 키, 리포트 날짜, 시도 횟수, 마지막 오류
+"""
+
+import os
+import gzip
+import json
+import time
+import hashlib
+from datetime import datetime
+
+import requests
+
+from analysis_engine import CACHE_DIR
+
+OUTBOX_DIR = os.path.join(CACHE_DIR, 'outbox')
+RETRY_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class ReportOutbox:
+    """디스크 기반 리포트 전송 보관함"""
+
+    def __init__(self, root_dir=None, retries=3, backoff=2.0, timeout=30):
+        self.root_dir = os.path.expanduser(root_dir or OUTBOX_DIR)
+        self.retries = retries  # 한 번 실행할 때 리포트당 최대 시도 횟수
+        self.backoff = backoff  # 재시도 대기 (초, 시도마다 2배)
+        self.timeout = timeout
+        os.makedirs(self.root_dir, exist_ok=True)
+
+    def _path(self, name, suffix):
+        return os.path.join(self.root_dir, f"{name}{suffix}")
+
+    def _write_meta(self, name, meta):
+        tmp_path = self._path(name, '.meta.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp_path, self._path(name, '.meta.json'))
+
+    def put(self, payload):
+        """
+        리포트 저장 - 본문 해시를 멱등 키로 사용 (같은 리포트를 다시 보내도 서버가 구분 가능)
+        반환: 항목 이름
+        """
+        body = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode('utf-8')
+        idempotency_key = hashlib.sha256(body).hexdigest()[:32]
+        name = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{idempotency_key[:12]}"
+
+        tmp_path = self._path(name, '.json.gz.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(gzip.compress(body, mtime=0))
+        os.replace(tmp_path, self._path(name, '.json.gz'))
+        self._write_meta(name, {
+            'idempotency_key': idempotency_key,
+            'report_date': payload.get('report_date'),
+            'created_at': datetime.now().isoformat(),
+            'attempts': 0,
+            'last_error': None
+        })
+        return name
+
+    def pending(self):
+        """전송 대기 중인 항목 (오래된 순) - [(이름, 메타)]"""
+        entries = []
+        for filename in sorted(os.listdir(self.root_dir)):
+            if not filename.endswith('.meta.json'):
+                continue
+            name = filename[:-len('.meta.json')]
+            try:
+                with open(self._path(name, '.meta.json'), encoding='utf-8') as f:
+                    entries.append((name, json.load(f)))
+            except (OSError, ValueError):
+                continue
+        return entries
+
+    def deliver(self, name, meta, url, headers, session=None):
+        """
+        항목 하나 전송 (gzip 본문, Idempotency-Key 헤더)
+        연결 오류·일시적 오류 응답이면 지수 백오프로 재시도
+        반환: (성공 여부, 마지막 오류 메시지)
+        """
+        with open(self._path(name, '.json.gz'), 'rb') as f:
+            body = f.read()
+        headers = dict(headers)
+        headers.update({
+            'Content-Type': 'application/json',
+            'Content-Encoding': 'gzip',
+            'Idempotency-Key': meta['idempotency_key']
+        })
+        post = session.post if session is not None else requests.post
+
+        error = None
+        for attempt in range(self.retries):
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            meta['attempts'] += 1
+            try:
+                response = post(url, data=body, headers=headers, timeout=self.timeout)
+                if response.status_code < 400:
+                    self.remove(name)
+                    return True, None
+                error = f"HTTP {response.status_code}: {response.text[:200]}"
+                if response.status_code not in RETRY_STATUS_CODES:
+                    break
+            except requests.exceptions.RequestException as e:
+                error = str(e)
+
+        meta['last_error'] = error
+        meta['last_attempt_at'] = datetime.now().isoformat()
+        self._write_meta(name, meta)
+        return False, error
+
+    def send(self, name, url, headers, session=None):
+        """
+        항목 하나만 전송 (방금 저장한 리포트용 - 밀린 항목은 flush가 담당)
+        반환: (성공 여부, 마지막 오류 메시지)
+        """
+        try:
+            with open(self._path(name, '.meta.json'), encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError) as e:
+            return False, str(e)
+        return self.deliver(name, meta, url, headers, session)
+
+    def flush(self, url, headers, session=None):
+        """
+        대기 중인 리포트를 오래된 순으로 모두 전송
+        반환: (전송한 항목 메타 목록, 실패한 항목 메타 목록)
+        """
+        delivered, failed = [], []
+        for name, meta in self.pending():
+            success, _ = self.deliver(name, meta, url, headers, session)
+            (delivered if success else failed).append(meta)
+        return delivered, failed
+
+    def remove(self, name):
+        for suffix in ('.json.gz', '.meta.json'):
+            try:
+                os.remove(self._path(name, suffix))
+            except OSError:
+                pass
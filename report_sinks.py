@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+리포트 전송 대상(sink)
+같은 리포트를 여러 대상(HTTP API, 로컬 시계열 파일, 파일 드롭, 이메일)에 동시에 전달
+대상마다 타임아웃·재시도 정책이 따로 있고, 느리거나 실패한 대상이 다른 대상이나 실행 종료를 막지 않음
+"""
+
+import os
+import csv
+import json
+import time
+import threading
+from datetime import datetime
+
+from report_outbox import OUTBOX_DIR, ReportOutbox
+
+# 이메일 관련 import (try-except로 안전하게)
+try:
+    import smtplib
+    from email.mime.text import MIMEText
+    EMAIL_AVAILABLE = True
+except ImportError:
+    EMAIL_AVAILABLE = False
+
+TIMESERIES_COLUMNS = ['report_date', 'generated_at', 'scope', 'total_count', 'albamon_count',
+                      'albamon_paid_count', 'albamon_free_count', 'jobkorea_count', 'worknet_count']
+
+
+class ReportSink:
+    """
+    전송 대상 기본 클래스 - 하위 클래스는 send(payload)만 구현
+    send가 예외를 던지면 retries번까지 backoff 간격으로 재시도
+    """
+
+    def __init__(self, name, timeout=30, retries=3, backoff=2.0):
+        self.name = name
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+
+    @property
+    def deadline(self):
+        """이 대상을 기다릴 최대 시간 (모든 재시도 포함)"""
+        return self.timeout * self.retries + self.backoff * (2 ** max(self.retries - 1, 0))
+
+    def send(self, payload):
+        raise NotImplementedError
+
+    def deliver(self, payload):
+        """재시도 포함 전송 - 반환: 결과 dict (워커 스레드에서 호출되므로 출력 없음)"""
+        start_time = time.time()
+        error = None
+        for attempt in range(1, self.retries + 1):
+            if attempt > 1:
+                time.sleep(self.backoff * 2 ** (attempt - 2))
+            try:
+                detail = self.send(payload)
+                return {'success': True, 'attempts': attempt, 'error': None, 'detail': detail,
+                        'duration': time.time() - start_time}
+            except Exception as e:
+                error = str(e)
+        return {'success': False, 'attempts': self.retries, 'error': error, 'detail': None,
+                'duration': time.time() - start_time}
+
+
+class HttpSink(ReportSink):
+    """
+    HTTP API - 보관함(outbox)을 거쳐 gzip·멱등 키로 전송, 재시도는 보관함이 담당
+    이번 리포트만 전송 (밀린 항목은 실행 시작 시 flush_outbox가 재전송 - 마감 시간 안에 다 못 보내는 일 방지)
+    """
+
+    def __init__(self, name, url, headers, outbox=None, timeout=30, retries=3, backoff=2.0):
+        super().__init__(name, timeout, retries=1, backoff=backoff)
+        self.url = url
+        self.headers = headers
+        self.outbox = outbox or ReportOutbox(retries=retries, backoff=backoff, timeout=timeout)
+
+    @property
+    def deadline(self):
+        outbox = self.outbox
+        return outbox.timeout * outbox.retries + outbox.backoff * (2 ** max(outbox.retries - 1, 0))
+
+    def send(self, payload):
+        name = self.outbox.put(payload)
+        success, error = self.outbox.send(name, self.url, self.headers)
+        if not success:
+            raise RuntimeError(error or "전송 실패")
+        return name
+
+
+class TimeSeriesSink(ReportSink):
+    """로컬 시계열 파일(CSV) - 리포트마다 전체/오늘 결과를 한 줄씩 추가"""
+
+    def __init__(self, path, name='timeseries', timeout=5, retries=2, backoff=0.5):
+        super().__init__(name, timeout, retries, backoff)
+        self.path = os.path.expanduser(path)
+
+    def send(self, payload):
+        rows = []
+        for scope in ('all', 'today'):
+            result = payload.get(f'{scope}_result')
+            if not result:
+                continue
+            row = {column: result.get(column) for column in TIMESERIES_COLUMNS}
+            row.update(report_date=payload['report_date'], generated_at=payload['generated_at'], scope=scope)
+            rows.append(row)
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        write_header = not os.path.exists(self.path)
+        with open(self.path, 'a', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=TIMESERIES_COLUMNS)
+            if write_header:
+                writer.writeheader()
+            writer.writerows(rows)
+        return f"{len(rows)}줄 추가"
+
+
+class FileDropSink(ReportSink):
+    """파일 드롭 - 디렉터리에 리포트 JSON을 원자적으로 저장 (다른 도구가 수거)"""
+
+    def __init__(self, directory, name='file_drop', timeout=5, retries=2, backoff=0.5):
+        super().__init__(name, timeout, retries, backoff)
+        self.directory = os.path.expanduser(directory)
+
+    def send(self, payload):
+        os.makedirs(self.directory, exist_ok=True)
+        filename = f"job_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        path = os.path.join(self.directory, filename)
+        with open(f"{path}.tmp", 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+        os.replace(f"{path}.tmp", path)
+        return path
+
+
+class SmtpSink(ReportSink):
+    """이메일(SMTP) - 요약 본문 발송"""
+
+    def __init__(self, server, port, sender, password, receiver, name='email',
+                 timeout=30, retries=2, backoff=5.0):
+        super().__init__(name, timeout, retries, backoff)
+        self.server = server
+        self.port = int(port)
+        self.sender = sender
+        self.password = password
+        self.receiver = receiver
+
+    def send(self, payload):
+        if not EMAIL_AVAILABLE:
+            raise RuntimeError("이메일 모듈을 사용할 수 없습니다")
+
+        lines = [f"📊 알바몬 공고 분석 리포트 ({payload['report_date']})", ""]
+        for scope, label in (('all', '전체 공고'), ('today', '오늘 공고')):
+            result = payload.get(f'{scope}_result')
+            if not result:
+                continue
+            lines.append(f"{label}: {result['total_count']:,}개")
+            for key, source in (('albamon_count', '자사'), ('jobkorea_count', '잡코리아'),
+                                ('worknet_count', '워크넷')):
+                if result.get(key) is not None:
+                    lines.append(f"  - {source}: {result[key]:,}개")
+            lines.append("")
+
+        message = MIMEText('\n'.join(lines), 'plain', 'utf-8')
+        message['Subject'] = f"[알바몬 공고 분석] {payload['report_date']} 리포트"
+        message['From'] = self.sender
+        message['To'] = self.receiver
+
+        with smtplib.SMTP(self.server, self.port, timeout=self.timeout) as smtp:
+            smtp.starttls()
+            smtp.login(self.sender, self.password)
+            smtp.send_message(message)
+        return self.receiver
+
+
+def sinks_from_env(outbox=None, api_headers=None):
+    """
+    환경 변수로 전송 대상 구성
+    HTTP 대상은 각자 보관함을 가짐 (기본 API는 outbox, 추가 대상은 그 아래 webhookN 디렉터리)
+      REPORT_API_URL + REPORT_API_PASSWORD  - 기본 API (보관함 사용)
+      REPORT_WEBHOOK_URLS                   - 추가 HTTP 대상 (쉼표 구분)
+      REPORT_TIMESERIES_PATH                - 로컬 시계열 CSV
+      REPORT_DROP_DIR                       - 파일 드롭 디렉터리
+      SMTP_SERVER, SMTP_PORT, SENDER_EMAIL, SENDER_PASSWORD, RECEIVER_EMAIL - 이메일
+    """
+    sinks = []
+    api_url = os.getenv('REPORT_API_URL')
+    if api_url and api_headers is not None:
+        sinks.append(HttpSink('api', api_url, api_headers, outbox=outbox))
+
+    outbox_root = outbox.root_dir if outbox is not None else OUTBOX_DIR
+    for i, url in enumerate(filter(None, (os.getenv('REPORT_WEBHOOK_URLS') or '').split(',')), start=1):
+        webhook_outbox = ReportOutbox(os.path.join(outbox_root, f"webhook{i}"), timeout=15)
+        sinks.append(HttpSink(f"webhook{i}", url.strip(), {'User-Agent': 'job-site-monitor/1.0.0'},
+                              outbox=webhook_outbox, timeout=15))
+
+    if os.getenv('REPORT_TIMESERIES_PATH'):
+        sinks.append(TimeSeriesSink(os.getenv('REPORT_TIMESERIES_PATH')))
+    if os.getenv('REPORT_DROP_DIR'):
+        sinks.append(FileDropSink(os.getenv('REPORT_DROP_DIR')))
+
+    smtp_keys = ('SMTP_SERVER', 'SMTP_PORT', 'SENDER_EMAIL', 'SENDER_PASSWORD', 'RECEIVER_EMAIL')
+    if all(os.getenv(key) for key in smtp_keys):
+        sinks.append(SmtpSink(*(os.getenv(key) for key in smtp_keys)))
+
+    return sinks
+
+
+def fan_out(sinks, payload):
+    """
+    모든 대상에 동시에 전달하고 대상별 마감 시간까지만 기다림
+    마감을 넘긴 대상은 시간 초과로 보고하되 스레드는 일반 스레드로 계속 실행
+    (프로세스 종료 시 끝까지 기다리므로 보관함·파일 쓰기가 중간에 끊기지 않음 - 각 대상의 타임아웃으로 상한)
+    반환: {대상 이름: 결과 dict}
+    """
+    finished = {}
+    threads = []
+    for sink in sinks:
+        def run(sink=sink):
+            finished[sink.name] = sink.deliver(payload)
+        thread = threading.Thread(target=run, name=f"sink-{sink.name}")
+        thread.start()
+        threads.append((sink, thread, time.time() + sink.deadline))
+
+    results = {}
+    for sink, thread, deadline in threads:
+        thread.join(max(0.0, deadline - time.time()))
+        if thread.is_alive():
+            results[sink.name] = {'success': False, 'attempts': None, 'detail': None,
+                                  'error': f"{sink.deadline:.0f}초 안에 완료되지 않음 (백그라운드에서 계속 전송)",
+                                  'duration': sink.deadline}
+        else:
+            results[sink.name] = finished[sink.name]
+    return results
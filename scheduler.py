@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+상주형 스케줄러
+GitHub Actions의 5분 cron + 캐시 마커 대신 한 프로세스가 계속 떠 있으면서 작업을 주기적으로 실행
+- 작업별 실행 간격 + 무작위 지연(jitter)
+- 분석기(HTTP 연결, 페이지 크기, 지역 캐시)를 실행 사이에 재사용
+- 마지막 실행 상태를 파일에 저장해 재시작해도 주기 유지
+- 같은 작업은 한 번에 하나만 실행 (실행 중이면 이번 차례 건너뜀)
+- 분석기를 공유하는 작업끼리는 차례로 실행 (리포트가 붙인 스냅샷·생애 주기 등에 다른 작업의 페이지가 섞이거나
+  전수 조사 중간 저장을 서로 덮어쓰지 않도록)
+
+사용 예:
+  python scheduler.py                                  # 기본 작업 (daily_report 1일, today 15분)
+  python scheduler.py --job today:600:60 --job census:21600
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import random
+import argparse
+import threading
+from datetime import datetime
+
+from analysis_engine import CACHE_DIR
+import daily_report
+
+try:
+    import fcntl
+except ImportError:  # Windows - 프로세스 간 잠금 없이 스레드 잠금만 사용
+    fcntl = None
+
+STATE_PATH = os.path.join(CACHE_DIR, 'scheduler_state.json')
+
+# 기본 작업: (이름, 간격 초, 최대 jitter 초)
+DEFAULT_JOBS = [
+    ('daily_report', 24 * 3600, 300),
+    ('today', 15 * 60, 60),
+]
+
+
+def run_daily_report(analyzer):
+    """전체/오늘 분석 + 리포트 전송 (daily_report.py와 동일)"""
+    return daily_report.main(analyzer) == 0
+
+
+def run_today(analyzer):
+    """오늘 공고 증분 분석"""
+    result = analyzer.incremental_analysis('TODAY')
+    if not result:
+        return False
+    print(f"📅 오늘 공고 {result['total_count']:,}개 (신규 {result['incremental']['new_postings']:,}개)")
+    return True
+
+
+def run_census(analyzer):
+    """전체 공고 전수 조사"""
+    result = analyzer.full_census('ALL')
+    if not result:
+        return False
+    print(f"🔍 전수 조사: 고유 공고 {result['census']['unique_postings']:,}개")
+    return True
+
+
+JOB_FUNCTIONS = {
+    'daily_report': run_daily_report,
+    'today': run_today,
+    'census': run_census,
+}
+
+
+def parse_job(spec):
+    """'이름:간격[:jitter]' 형식 작업 설정 파싱"""
+    parts = spec.split(':')
+    if parts[0] not in JOB_FUNCTIONS or len(parts) not in (2, 3):
+        raise argparse.ArgumentTypeError(
+            f"작업 형식은 이름:간격초[:jitter초], 이름은 {', '.join(JOB_FUNCTIONS)} 중 하나: {spec}")
+    return parts[0], float(parts[1]), float(parts[2]) if len(parts) == 3 else 0.0
+
+
+class Scheduler:
+    """작업 주기 실행기"""
+
+    def __init__(self, jobs, analyzer=None, state_path=STATE_PATH):
+        self.jobs = {name: {'interval': interval, 'jitter': jitter} for name, interval, jitter in jobs}
+        self.analyzer = analyzer or daily_report.create_analyzer()
+        self.state_path = state_path
+        self.state = self._load_state()
+        self._state_lock = threading.Lock()
+        self._running = {name: threading.Lock() for name in self.jobs}
+        self._analyzer_lock = threading.Lock()  # 공유 분석기를 쓰는 작업은 한 번에 하나만
+        self._stop = threading.Event()
+
+        for name, job in self.jobs.items():
+            last_run = self.state.get(name, {}).get('last_run_at')
+            # 이전 실행 기록이 있으면 그 시점부터 주기 계산 (재시작 직후 중복 실행 방지)
+            job['next_run'] = (last_run + job['interval']) if last_run else time.time()
+
+    # ------------------------------------------------------------------
+    # 상태
+    # ------------------------------------------------------------------
+    def _load_state(self):
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self):
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        with open(f"{self.state_path}.tmp", 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(f"{self.state_path}.tmp", self.state_path)
+
+    def _record(self, name, **fields):
+        with self._state_lock:
+            self.state.setdefault(name, {}).update(fields)
+            self._save_state()
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+    def _acquire_process_lock(self, name):
+        """
+        다른 스케줄러 프로세스와의 중복 실행 방지 (파일 잠금)
+        반환: 잠금 파일, 잠금 미지원 시 True, 이미 실행 중이면 None
+        """
+        if fcntl is None:
+            return True
+        lock_file = open(os.path.join(os.path.dirname(self.state_path), f"{name}.lock"), 'w')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return None
+        return lock_file
+
+    def _run_job(self, name):
+        lock = self._running[name]
+        process_lock = self._acquire_process_lock(name)
+        if not process_lock:
+            lock.release()
+            print(f"⏭️ {name}: 다른 프로세스에서 실행 중 - 건너뜀")
+            return
+
+        try:
+            if not self._analyzer_lock.acquire(blocking=False):
+                print(f"⏳ {name}: 다른 작업이 분석기를 사용 중 - 끝날 때까지 대기")
+                self._analyzer_lock.acquire()
+            start_time = time.time()
+            print(f"\n▶️ {name} 시작 ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})")
+            try:
+                success = JOB_FUNCTIONS[name](self.analyzer)
+                status = 'success' if success else 'failed'
+                error = None
+            except Exception as e:
+                status, error = 'error', str(e)
+            finally:
+                self._analyzer_lock.release()
+
+            duration = time.time() - start_time
+            self._record(name, last_run_at=start_time, last_status=status, last_error=error,
+                         last_duration=duration, runs=self.state.get(name, {}).get('runs', 0) + 1)
+            print(f"{'✅' if status == 'success' else '❌'} {name} 완료: {status} ({duration:.1f}초)"
+                  + (f" - {error}" if error else ""))
+        finally:
+            if process_lock is not True:
+                process_lock.close()
+            lock.release()
+
+    def tick(self):
+        """실행할 때가 된 작업 시작 - 반환: 다음 작업까지 남은 시간"""
+        now = time.time()
+        for name, job in self.jobs.items():
+            if job['next_run'] > now:
+                continue
+            job['next_run'] = now + job['interval'] + random.uniform(0, job['jitter'])
+            if not self._running[name].acquire(blocking=False):
+                print(f"⏭️ {name}: 이전 실행이 아직 진행 중 - 이번 차례 건너뜀")
+                continue
+            self._record(name, next_run_at=job['next_run'])
+            threading.Thread(target=self._run_job, args=(name,), name=f"job-{name}", daemon=True).start()
+        return max(0.0, min(job['next_run'] for job in self.jobs.values()) - time.time())
+
+    def run_forever(self):
+        print("🕒 스케줄러 시작: " + ", ".join(
+            f"{name}({job['interval']:.0f}초 ±{job['jitter']:.0f})" for name, job in self.jobs.items()))
+        while not self._stop.is_set():
+            self._stop.wait(self.tick())
+        # 실행 중인 작업이 끝날 때까지 대기
+        for lock in self._running.values():
+            lock.acquire()
+        print("🛑 스케줄러 종료")
+
+    def stop(self, *_):
+        self._stop.set()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상주형 분석 스케줄러")
+    parser.add_argument('--job', action='append', type=parse_job, dest='jobs',
+                        help="이름:간격초[:jitter초] (여러 번 지정 가능)")
+    args = parser.parse_args()
+
+    scheduler = Scheduler(args.jobs or DEFAULT_JOBS)
+    signal.signal(signal.SIGTERM, scheduler.stop)
+    signal.signal(signal.SIGINT, scheduler.stop)
+    scheduler.run_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
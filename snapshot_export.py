@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+공고 스냅샷 열 형식(Parquet) 내보내기
+수집한 공고를 페이지가 들어오는 대로 행 그룹 단위로 기록해, pandas에서 필요한 열만 읽어 분석
+중첩 JSON을 다시 파싱하지 않고 회사·지역·급여 유형·소스·유료 여부로 바로 집계 가능
+
+열:
+  recruit_no, page, query                     - 공고 번호, 수집 페이지, 쿼리 식별자(page_archive.query_key)
+  source, is_paid                             - albamon/jobkorea/worknet, 자사 유료 공고 여부
+  company_name, workplace_area, pay_type      - 사전 인코딩 (pandas에서 category로 로드)
+  pay, nego_pay, recruit_title, posted_date, closing_date
+
+사용 예:
+  python snapshot_export.py --archive archive --date 2025-09-07 --output postings.parquet
+"""
+
+import sys
+import argparse
+import threading
+
+import numpy as np
+import pandas as pd
+
+from analysis_engine import RecruitNoSet, posting_columns
+from page_archive import PageArchive, query_key
+
+# pyarrow는 선택 의존성 (try-except로 안전하게)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+DICTIONARY_COLUMNS = ('query', 'source', 'company_name', 'workplace_area', 'pay_type')
+ROW_GROUP_SIZE = 20000  # 행 그룹 하나에 모을 최대 공고 수
+
+
+def snapshot_schema():
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ('recruit_no', pa.int64()),
+        ('page', pa.int32()),
+        ('query', dictionary),
+        ('source', dictionary),
+        ('is_paid', pa.bool_()),
+        ('company_name', dictionary),
+        ('workplace_area', dictionary),
+        ('pay_type', dictionary),
+        ('pay', pa.string()),
+        ('nego_pay', pa.bool_()),
+        ('recruit_title', pa.string()),
+        ('posted_date', pa.string()),
+        ('closing_date', pa.string())
+    ])
+
+
+class SnapshotWriter:
+    """
+    공고 스냅샷 Parquet 기록기 - AnalysisEngine(snapshot=...)에 넘기면 수집한 페이지를 자동 기록
+    여러 워커 스레드에서 호출해도 안전, 같은 recruitNo는 처음 한 번만 기록 (경계 탐색·재수집 중복 제거)
+    """
+
+    def __init__(self, path, row_group_size=ROW_GROUP_SIZE, dedupe=True):
+        if not PARQUET_AVAILABLE:
+            raise RuntimeError("Parquet 내보내기에는 pyarrow가 필요합니다 (pip install pyarrow)")
+        self.path = path
+        self.row_group_size = row_group_size
+        self.dedupe = dedupe
+        self.schema = snapshot_schema()
+        self._writer = pq.ParquetWriter(path, self.schema, use_dictionary=list(DICTIONARY_COLUMNS),
+                                        compression='zstd')
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._buffered_rows = 0
+        self._seen = RecruitNoSet()
+        self.stats = {
+            'pages_written': 0,
+            'postings_written': 0,
+            'duplicates_skipped': 0,
+            'row_groups': 0
+        }
+
+    def write_page(self, columns, request_body=None, query=None):
+        """
+        페이지 하나의 공고 열(analysis_engine.posting_columns) 추가 - 행 그룹 크기가 차면 파일에 기록
+        쿼리 식별자는 query 또는 요청 본문에서 계산
+        """
+        if query is None:
+            query = query_key(request_body) if request_body else ''
+        with self._lock:
+            if self.dedupe:
+                keep = self._seen.add_new(columns['recruit_no'])  # 같은 페이지 안의 중복도 처음 것만 유지
+            else:
+                keep = np.ones(len(columns['recruit_no']), dtype=bool)
+            self.stats['duplicates_skipped'] += int((~keep).sum())
+            self.stats['pages_written'] += 1
+            if not keep.any():
+                return
+
+            # 스키마에 있는 열만 변환 (parts·hash_tags 등 다른 수집기용 열은 건너뜀)
+            index = np.flatnonzero(keep)
+            chunk = {name: np.asarray(columns[name], dtype=object if isinstance(columns[name], list) else None)[index]
+                     for name in self.schema.names if name != 'query'}
+            chunk['query'] = np.full(len(index), query, dtype=object)
+            self._buffer.append(chunk)
+            self._buffered_rows += len(index)
+            if self._buffered_rows >= self.row_group_size:
+                self._flush()
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        arrays = []
+        for field in self.schema:
+            values = np.concatenate([chunk[field.name] for chunk in self._buffer])
+            if pa.types.is_dictionary(field.type):
+                arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+            else:
+                arrays.append(pa.array(values, type=field.type))
+        table = pa.Table.from_arrays(arrays, schema=self.schema)
+        self._writer.write_table(table, row_group_size=len(table))
+        self.stats['postings_written'] += len(table)
+        self.stats['row_groups'] += 1
+        self._buffer = []
+        self._buffered_rows = 0
+
+    def close(self):
+        with self._lock:
+            self._flush()
+            self._writer.close()
+        return self.stats
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def export_archive(archive, date, query, path, row_group_size=ROW_GROUP_SIZE):
+    """
+    아카이브된 스냅샷(page_archive)을 네트워크 없이 Parquet로 변환
+    반환: 기록 통계 dict
+    """
+    if isinstance(archive, str):
+        archive = PageArchive(archive)
+    with SnapshotWriter(path, row_group_size) as writer:
+        for entry, jobs in archive.iter_pages(date, query):
+            writer.write_page(posting_columns(jobs, entry['page']), query=query)
+    return writer.stats
+
+
+def load_snapshot(path, columns=None, filters=None):
+    """
+    스냅샷 로드 - 필요한 열만 읽음 (사전 인코딩 열은 category)
+    예) load_snapshot(path, ['company_name', 'source'], filters=[('source', '==', 'albamon')])
+    """
+    if not PARQUET_AVAILABLE:
+        raise RuntimeError("Parquet 읽기에는 pyarrow가 필요합니다 (pip install pyarrow)")
+    return pd.read_parquet(path, columns=columns, filters=filters)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="아카이브 스냅샷 Parquet 내보내기")
+    parser.add_argument('--archive', default='archive', help="아카이브 디렉터리")
+    parser.add_argument('--date', required=True, help="스냅샷 날짜 (YYYY-MM-DD)")
+    parser.add_argument('--query', default='search_ALL_RELATION', help="쿼리 식별자")
+    parser.add_argument('--output', required=True, help="Parquet 파일 경로")
+    args = parser.parse_args()
+
+    stats = export_archive(args.archive, args.date, args.query, args.output)
+    print(f"💾 {args.output}: {stats['postings_written']:,}개 공고, {stats['pages_written']}페이지, "
+          f"행 그룹 {stats['row_groups']}개 (중복 {stats['duplicates_skipped']:,}개 제외)")
+    return 0 if stats['pages_written'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
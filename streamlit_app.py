@@ -1,463 +1,39 @@
 import streamlit as st
-import requests
 import pandas as pd
 import plotly.graph_objects as go
 from datetime import datetime
-import time
 import json
-from regional_analyzer import (RegionalAnalyzer,
+from analysis_engine import AnalysisEngine, PAGE_SIZE, page_count
+from regional_analyzer import (DASHBOARD_DEADLINE,
+                               RegionalAnalyzer,
                                REGION_CODES,
+                               StreamlitEventListener,
+                               render_performance_panel,
                                render_regional_dashboard)
 
+SOURCE_COLORS = {'albamon_free': '#95E1D3', 'albamon_paid': '#F38BA8', 'jobkorea': '#4ECDC4', 'worknet': '#45B7D1'}
+SOURCE_NAMES = {'albamon_free': '자사 무료', 'albamon_paid': '자사 유료', 'jobkorea': '잡코리아', 'worknet': '워크넷'}
 
-class AlbamonAnalyzer:
-    def __init__(self):
-        self.base_url = 'https://bff-general.albamon.com'
-        self.headers = {
-            'Accept': '*/*',
-            'User-Agent': 'job-site-monitor/1.0.0',
-            'origin': 'https://www.albamon.com',
-            'Content-Type': 'application/json',
-            'cookie': (
-                'ConditionId=25C99562-77E3-40EB-A750-DA27D2D03C54; '
-                'ab.storage.deviceId.7a5f1472-069a-4372-8631-2f711442ee40'
-                '=%7B%22g%22%3A%22efb20921-d9c8-43dd-3c27-8a1487d7d2c4%22'
-                '%2C%22c%22%3A1756907811760%2C%22l%22%3A1756943038663%7D; '
-                'AM_USER_UUID=e69544f8-bed4-4fc3-94c7-6efac20359f7; '
-                'ab.storage.sessionId.7a5f1472-069a-4372-8631-2f711442ee40'
-                '=%7B%22g%22%3A%22898147fc-a8ba-6427-1f60-647c10d3514e%22'
-                '%2C%22e%22%3A1756945521947%2C%22c%22%3A1756943038661%2C'
-                '%22l%22%3A1756943721947%7D'
-            )
-        }
-
-    def search_jobs(self, page=1, size=200, search_period_type='ALL',
-                    sort_type='RELATION'):
-        request_body = {
-            "pagination": {
-                "page": int(page),
-                "size": int(size)
-            },
-            "recruitListType": "SEARCH",
-            "sortTabCondition": {
-                "searchPeriodType": str(search_period_type),
-                "sortType": str(sort_type)
-            },
-            "condition": {
-                "areas": [],
-                "employmentTypes": [],
-                "excludeKeywords": [],
-                "excludeBar": False,
-                "excludeNegoAge": False,
-                "excludeNegoWorkWeek": False,
-                "excludeNegoWorkTime": False,
-                "excludeNegoGender": False,
-                "parts": [],
-                "similarDongJoin": False,
-                "workDayTypes": [],
-                "workPeriodTypes": [],
-                "workTimeTypes": [],
-                "workWeekTypes": [],
-                "endWorkTime": "",
-                "startWorkTime": "",
-                "includeKeyword": "",
-                "excludeKeywordList": [],
-                "age": 0,
-                "genderType": "NONE",
-                "moreThanEducation": False,
-                "educationType": "ALL"
-            },
-            "extensionCondition": {
-                "search": {
-                    "keyword": "",
-                    "featureCode": "",
-                    "disableExceptedConditions": []
-                }
-            }
-        }
 
-        try:
-            response = requests.post(
-                f'{self.base_url}/recruit/search',
-                json=request_body,
-                headers=self.headers,
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # 올바른 JSON 경로로 공고 데이터 추출
-            jobs = data.get('base', {}).get('normal', {}).get('collection', [])
-
-            # 기존 형식에 맞추어 반환 (호환성 유지)
-            return {
-                'result': {'recruitList': jobs},
-                'base': data.get('base', {}),
-                '_debug_info': {
-                    'original_job_count': len(jobs),
-                    'json_structure': 'base.normal.collection'
-                }
-            }
-        except requests.exceptions.RequestException as e:
-            st.error(f"API 요청 실패: {e}")
-            return None
-
-    def categorize_job_posting(self, job):
-        """
-        공고 소스 및 유형 분류
-        """
-        # 소스 분류
-        if job.get('jobkoreaRecruitNo', 0) != 0:
-            source = 'JOBKOREA'
-        elif job.get('externalRecruitSite') == 'WN':
-            source = 'WORKNET'
-        else:
-            source = 'ALBAMON'
-
-        # 유료/무료 분류 (ALBAMON 공고만)
-        is_paid = False
-        if source == 'ALBAMON':
-            total_product_count = job.get(
-                'paidService', {}).get('totalProductCount', 0)
-            is_paid = total_product_count > 0
-
-        return {
-            'source': source,
-            'is_paid': is_paid,
-            'product_count': (
-                job.get('paidService', {}).get('totalProductCount', 0)
-                if source == 'ALBAMON' else None
-            )
-        }
-
-
-    def find_source_range_efficient(self, search_period_type='ALL'):
-        """
-        🚀 경계 기반 효율적 탐색 - 자사>잡코리아>워크넷 순서를 활용한 간단한 경계 탐지
-        """
-        search_start_time = time.time()
-        total_requests = 0
-        
-        # 전체 공고 수 확인
-        first_response = self.search_jobs(1, 200, search_period_type)
-        total_requests += 1
-        
-        if not first_response:
-            return None, None, None, None, 0, {}, {}, 0
+class AlbamonAnalyzer(AnalysisEngine):
+    """대시보드용 분석기 - 분석 엔진 + Streamlit 이벤트 표시"""
 
-        total_count = (
-            first_response.get('base', {})
-            .get('pagination', {})
-            .get('totalCount', 0)
-        )
-        max_pages = (total_count + 199) // 200 if total_count > 0 else 1
-
-        st.info(f"🚀 경계 기반 탐색: 전체 {total_count:,}개 공고 ({max_pages}페이지)")
-
-        # 1단계: 워크넷 경계 찾기 (끝페이지부터)
-        st.info("🔍 워크넷 경계 탐색 중...")
-        worknet_start = None
-        worknet_end = None
-        worknet_end_count = 0
-        worknet_start_count = 0
-        
-        # 끝페이지에서 워크넷 확인
-        try:
-            response = self.search_jobs(max_pages, 200, search_period_type)
-            total_requests += 1
-            if response:
-                jobs = response.get('result', {}).get('recruitList', [])
-                worknet_count = sum(1 for job in jobs if job.get('externalRecruitSite') == 'WN')
-                if worknet_count > 0:
-                    worknet_end = max_pages
-                    worknet_end_count = worknet_count
-                    st.info(f"📍 워크넷 끝: {max_pages}페이지 ({worknet_count}개)")
-        except Exception as e:
-            st.warning(f"끝페이지 확인 오류: {e}")
-
-        # 워크넷이 있으면 시작점 찾기
-        if worknet_end:
-            for i, page in enumerate(range(max_pages, 0, -1)):
-                try:
-                    # 진행 상황 표시
-                    progress = (i + 1) / max_pages * 100
-                    remaining_pages = max_pages - i
-                    if i % 20 == 0 or page % 100 == 0:  # 20번마다 또는 100페이지마다 표시
-                        st.info(f"🔍 워크넷 탐색: 페이지 {page} 확인 중 | 진행률: {progress:.1f}% | 남은 페이지: {remaining_pages}")
-                    
-                    response = self.search_jobs(page, 200, search_period_type)
-                    total_requests += 1
-                    
-                    if not response:
-                        continue
-
-                    jobs = response.get('result', {}).get('recruitList', [])
-                    if not jobs:
-                        continue
-                    
-                    worknet_count = sum(1 for job in jobs if job.get('externalRecruitSite') == 'WN')
-                    
-                    if worknet_count > 0:
-                        worknet_start = page
-                        worknet_start_count = worknet_count
-                    else:
-                        # 워크넷이 없는 첫 페이지 발견 = 워크넷 시작점 확정
-                        st.info(f"✅ 워크넷 시작점 확정: {worknet_start}~{worknet_end}페이지")
-                        break
-                        
-                    time.sleep(0.002)
-                    
-                except Exception as e:
-                    st.warning(f"페이지 {page} 검색 오류: {e}")
-                    continue
-
-        if worknet_start and worknet_end:
-            st.success(f"✅ 워크넷: {worknet_start}~{worknet_end}페이지")
-        else:
-            st.info("📊 워크넷 공고 없음")
-
-        # 2단계: 잡코리아 경계 찾기 (워크넷 앞쪽부터)
-        st.info("🔍 잡코리아 경계 탐색 중...")
-        jobkorea_start = None
-        jobkorea_end = None
-        jobkorea_end_count = 0
-        jobkorea_start_count = 0
-        search_start_page = worknet_start - 1 if worknet_start else max_pages
-        
-        # 워크넷 바로 앞 페이지에서 잡코리아 확인
-        if search_start_page > 0:
-            try:
-                response = self.search_jobs(search_start_page, 200, search_period_type)
-                total_requests += 1
-                if response:
-                    jobs = response.get('result', {}).get('recruitList', [])
-                    jobkorea_count = sum(1 for job in jobs if job.get('jobkoreaRecruitNo', 0) != 0)
-                    if jobkorea_count > 0:
-                        jobkorea_end = search_start_page
-                        jobkorea_end_count = jobkorea_count
-                        st.info(f"📍 잡코리아 끝: {search_start_page}페이지 ({jobkorea_count}개)")
-            except Exception as e:
-                st.warning(f"잡코리아 끝페이지 확인 오류: {e}")
-
-        # 잡코리아가 있으면 시작점 찾기
-        if jobkorea_end:
-            total_search_pages = search_start_page
-            for i, page in enumerate(range(search_start_page, 0, -1)):
-                try:
-                    # 진행 상황 표시
-                    progress = (i + 1) / total_search_pages * 100
-                    remaining_pages = total_search_pages - i
-                    if i % 20 == 0 or page % 100 == 0:  # 20번마다 또는 100페이지마다 표시
-                        st.info(f"🔍 잡코리아 탐색: 페이지 {page} 확인 중 | 진행률: {progress:.1f}% | 남은 페이지: {remaining_pages}")
-                    
-                    response = self.search_jobs(page, 200, search_period_type)
-                    total_requests += 1
-                    
-                    if not response:
-                        continue
-
-                    jobs = response.get('result', {}).get('recruitList', [])
-                    if not jobs:
-                        continue
-                    
-                    jobkorea_count = sum(1 for job in jobs if job.get('jobkoreaRecruitNo', 0) != 0)
-                    
-                    if jobkorea_count > 0:
-                        jobkorea_start = page
-                        jobkorea_start_count = jobkorea_count
-                    else:
-                        # 잡코리아가 없는 첫 페이지 발견 = 잡코리아 시작점 확정
-                        st.info(f"✅ 잡코리아 시작점 확정: {jobkorea_start}~{jobkorea_end}페이지")
-                        break
-                        
-                    time.sleep(0.002)
-                    
-                except Exception as e:
-                    st.warning(f"페이지 {page} 검색 오류: {e}")
-                    continue
-
-        if jobkorea_start and jobkorea_end:
-            st.success(f"✅ 잡코리아: {jobkorea_start}~{jobkorea_end}페이지")
-        else:
-            st.info("📊 잡코리아 공고 없음")
-
-        # 3단계: 실제 확인한 개수 기반 계산 (추가 요청 없이)
-        st.info("🔍 공고 수 계산 중...")
-        jobkorea_counts = {}
-        worknet_counts = {}
-        
-        # 잡코리아 공고 수 계산 (실제 확인한 개수 사용)
-        if jobkorea_start and jobkorea_end:
-            total_pages = jobkorea_end - jobkorea_start + 1
-            if total_pages == 1:
-                # 1페이지만 있으면 시작=끝이므로 시작 페이지 개수 사용
-                jobkorea_counts[jobkorea_start] = jobkorea_start_count if jobkorea_start_count > 0 else jobkorea_end_count
-            else:
-                # 여러 페이지면 시작/끝은 실제 개수, 중간은 200개
-                for page in range(jobkorea_start, jobkorea_end + 1):
-                    if page == jobkorea_start:
-                        jobkorea_counts[page] = jobkorea_start_count  # 실제 확인한 시작 페이지 개수
-                    elif page == jobkorea_end:
-                        jobkorea_counts[page] = jobkorea_end_count  # 실제 확인한 끝 페이지 개수
-                    else:
-                        jobkorea_counts[page] = 200  # 중간 페이지는 200개 (해당 소스만 있음)
-        
-        # 워크넷 공고 수 계산 (실제 확인한 개수 사용)
-        if worknet_start and worknet_end:
-            total_pages = worknet_end - worknet_start + 1
-            if total_pages == 1:
-                # 1페이지만 있으면 시작=끝이므로 시작 페이지 개수 사용
-                worknet_counts[worknet_start] = worknet_start_count if worknet_start_count > 0 else worknet_end_count
-            else:
-                # 여러 페이지면 시작/끝은 실제 개수, 중간은 200개
-                for page in range(worknet_start, worknet_end + 1):
-                    if page == worknet_start:
-                        worknet_counts[page] = worknet_start_count  # 실제 확인한 시작 페이지 개수
-                    elif page == worknet_end:
-                        worknet_counts[page] = worknet_end_count  # 실제 확인한 끝 페이지 개수
-                    else:
-                        worknet_counts[page] = 200  # 중간 페이지는 200개 (해당 소스만 있음)
-
-        # 검색 소요시간 계산
-        search_end_time = time.time()
-        search_duration = search_end_time - search_start_time
-        
-        # 실제 공고 수 합계 계산
-        total_jobkorea_count = sum(jobkorea_counts.values())
-        total_worknet_count = sum(worknet_counts.values())
-
-        # 결과 로깅
-        if jobkorea_start and jobkorea_end:
-            st.success(f"📊 잡코리아: {jobkorea_start}~{jobkorea_end}페이지 (총 {total_jobkorea_count:,}개)")
-        if worknet_start and worknet_end:
-            st.success(f"📊 워크넷: {worknet_start}~{worknet_end}페이지 (총 {total_worknet_count:,}개)")
-            
-        st.success(f"⚡ 경계 탐색 완료: {search_duration:.2f}초, 총 {total_requests}번 요청")
-
-        return jobkorea_start, jobkorea_end, worknet_start, worknet_end, total_count, jobkorea_counts, worknet_counts, search_duration
-
-    def analyze_page_sources(self, start_page=1, end_page=10,
-                             search_period_type='ALL'):
-        """
-        특정 페이지 범위의 공고 소스 분석
-        """
-        page_results = []
-
-        for page in range(start_page, end_page + 1):
-            try:
-                response = self.search_jobs(page, 200, search_period_type)
-                if not response:
-                    continue
-
-                jobs = response.get('result', {}).get('recruitList', [])
-
-                page_stats = {
-                    'page': page,
-                    'total_jobs': len(jobs),
-                    'albamon': 0,
-                    'jobkorea': 0,
-                    'worknet': 0,
-                    'sample_jobs': []
-                }
-
-                for job in jobs:
-                    category = self.categorize_job_posting(job)
-                    source = category['source']
-
-                    if source == 'ALBAMON':
-                        page_stats['albamon'] += 1
-                    elif source == 'JOBKOREA':
-                        page_stats['jobkorea'] += 1
-                    elif source == 'WORKNET':
-                        page_stats['worknet'] += 1
-
-                # 각 페이지에서 처음 3개 공고만 샘플로 저장
-                for job in jobs[:3]:
-                    category = self.categorize_job_posting(job)
-                    sample_info = {
-                        'recruitNo': job.get('recruitNo'),
-                        'title': job.get('recruitTitle', '')[:40] + '...',
-                        'source': category['source'],
-                        'is_paid': category['is_paid'],
-                        'product_count': category['product_count'],
-                        'jobkoreaRecruitNo': job.get('jobkoreaRecruitNo', 0),
-                        'externalRecruitSite': job.get(
-                            'externalRecruitSite', ''),
-                    }
-                    page_stats['sample_jobs'].append(sample_info)
-
-                page_results.append(page_stats)
-                time.sleep(0.1)
-
-            except Exception as e:
-                st.error(f"페이지 {page} 분석 중 오류: {e}")
-                continue
-
-        return page_results
+    def __init__(self):
+        super().__init__(listener=StreamlitEventListener())
 
     def comprehensive_job_analysis(self, search_period_type='ALL'):
         """
-        효율적인 범위 탐색으로 공고 분석 - 범위를 찾으면 해당 범위만 정확히 카운팅
+        효율적인 범위 탐색으로 공고 분석 - 처음 5페이지 상세 분석 포함
         """
-        try:
-            # 효율적인 범위 탐색 사용
-            with st.spinner("🔍 효율적 범위 탐색으로 잡코리아/워크넷 범위 검색 중..."):
-                result = self.find_source_range_efficient(search_period_type)
-                    
-            jobkorea_start, jobkorea_end, worknet_start, worknet_end, total_count, jobkorea_counts, worknet_counts, search_duration = result
-
-            if total_count == 0:
-                return {
-                    'total_count': 0,
-                    'albamon_count': 0,
-                    'jobkorea_count': 0,
-                    'worknet_count': 0,
-                    'jobkorea_start_page': None,
-                    'jobkorea_end_page': None,
-                    'worknet_start_page': None,
-                    'worknet_end_page': None,
-                    'page_analysis': []
-                }
-
-            # 처음 5페이지 상세 분석 (샘플링용)
-            page_results = self.analyze_page_sources(1, 5, search_period_type)
-
-            # 🎯 정확한 공고 수 계산 (실제 페이지별 카운트 기반)
-            # 잡코리아 실제 공고 수
-            jobkorea_count = sum(jobkorea_counts.values()) if jobkorea_counts else 0
-            
-            # 워크넷 실제 공고 수  
-            worknet_count = sum(worknet_counts.values()) if worknet_counts else 0
-            
-            # 자사 공고 수 = 전체 - 잡코리아 - 워크넷
-            albamon_count = total_count - jobkorea_count - worknet_count
-
-            return {
-                'total_count': total_count,
-                'albamon_count': max(0, albamon_count),
-                'jobkorea_count': max(0, jobkorea_count),
-                'worknet_count': max(0, worknet_count),
-                'jobkorea_start_page': jobkorea_start,
-                'jobkorea_end_page': jobkorea_end,
-                'worknet_start_page': worknet_start,
-                'worknet_end_page': worknet_end,
-                'page_analysis': page_results,
-                'detailed_counts': {
-                    'jobkorea_by_page': jobkorea_counts,
-                    'worknet_by_page': worknet_counts
-                },
-                'search_duration': search_duration,
-                'optimization_info': {
-                    'jobkorea_range': f"{jobkorea_start}~{jobkorea_end}" if jobkorea_start and jobkorea_end else "없음",
-                    'worknet_range': f"{worknet_start}~{worknet_end}" if worknet_start and worknet_end else "없음",
-                    'accuracy': "페이지별 실제 공고 수 기반 정확 계산",
-                    'search_time': f"{search_duration:.2f}초"
-                }
-            }
-
-        except Exception as e:
-            st.error(f"분석 중 오류 발생: {e}")
-            return None
+        with st.spinner("🔍 효율적 범위 탐색으로 잡코리아/워크넷 범위 검색 중..."):
+            return super().comprehensive_job_analysis(search_period_type, sample_pages=5,
+                                                      deadline=DASHBOARD_DEADLINE)
+
+    def employer_analysis(self, search_period_type='ALL', max_pages=None):
+        """업체별 공고 수 스트리밍 집계 - 시간 예산 안에 받은 페이지까지"""
+        with st.spinner("🏢 페이지를 받는 대로 업체별 공고 수 집계 중..."):
+            return super().employer_analysis(search_period_type, max_pages=max_pages,
+                                             deadline=DASHBOARD_DEADLINE)
 
 
 def render_dashboard(results, title="공고 분석 결과"):
@@ -468,6 +44,15 @@ def render_dashboard(results, title="공고 분석 결과"):
 
     st.header(f"🔍 {title}")
 
+    if results.get('partial'):
+        estimated = [field for field, value in results['exactness'].items() if value == 'estimated']
+        st.warning(f"⏱️ 시간 예산({results['deadline']}초) 안에 확정하지 못해 일부 값은 추정치입니다: "
+                   f"{', '.join(estimated)}")
+
+    if results.get('verified_at'):
+        st.caption(f"✅ 변경 없음 확인: {results['verified_at'][:19]} "
+                   f"(분석 시각: {results.get('timestamp', '')[:19]})")
+
     # 메트릭 카드
     col1, col2, col3, col4, col5 = st.columns(5)
 
@@ -615,7 +200,7 @@ def render_dashboard(results, title="공고 분석 결과"):
             "1~자사끝",
             jobkorea_range,
             worknet_range,
-            f"1~{((results['total_count'] + 199) // 200)}"
+            f"1~{page_count(results['total_count'], results.get('page_size', PAGE_SIZE))}"
         ]
     }
 
@@ -668,7 +253,7 @@ def render_dashboard(results, title="공고 분석 결과"):
     # JSON 다운로드 버튼
     st.download_button(
         label="📥 결과 JSON 다운로드",
-        data=json.dumps(results, indent=2, ensure_ascii=False),
+        data=json.dumps(results, ensure_ascii=False, separators=(',', ':')),
         file_name=(
             f"albamon_analysis_"
             f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
@@ -677,6 +262,112 @@ def render_dashboard(results, title="공고 분석 결과"):
     )
 
 
+def employer_frame(rows):
+    """업체 집계 행 목록을 표시용 DataFrame으로 변환"""
+    frame = pd.DataFrame(rows, columns=['company_name', 'total', *SOURCE_NAMES, 'error'])
+    return frame.rename(columns={'company_name': '업체명', 'total': '공고 수', 'error': '최대 오차', **SOURCE_NAMES})
+
+
+def render_employer_dashboard(results):
+    """업체별 공고 수 (전국 상위 + 시/도별 상위) 렌더링"""
+    st.header("🏢 업체별 공고 순위")
+    st.caption(f"{results['pages_read']:,}페이지 · 공고 {results['analyzed_count']:,}개 집계 "
+               f"(전체 {results['total_count']:,}개) · 추적 업체 {results['employers_tracked']:,}곳")
+    if results.get('partial'):
+        st.warning("⏱️ 전체 페이지 중 일부만 집계한 결과입니다 (페이지 수를 늘리거나 다시 실행)")
+    if results['error_bound']:
+        st.info(f"공고 수가 {results['error_bound']:,}개 이하인 업체는 추적에서 빠졌을 수 있습니다 "
+                f"('최대 오차'만큼 실제보다 적게 셀 수 있음)")
+
+    top = results['top_employers']
+    if not top:
+        st.info("집계된 업체가 없습니다.")
+        return
+
+    names = [row['company_name'] for row in reversed(top)]
+    fig = go.Figure(data=[
+        go.Bar(y=names, x=[row[source] for row in reversed(top)], name=label,
+               orientation='h', marker_color=SOURCE_COLORS[source])
+        for source, label in SOURCE_NAMES.items()
+    ])
+    fig.update_layout(title="전국 상위 업체", barmode='stack', xaxis_title="공고 수",
+                      height=max(400, 24 * len(top)))
+    st.plotly_chart(fig, use_container_width=True)
+    st.dataframe(employer_frame(top), use_container_width=True)
+    render_freshness_panel(results.get('freshness'))
+    render_performance_panel(results.get('performance'))
+
+    st.subheader("📍 시/도별 상위 업체")
+    regions = list(results['regions'])
+    for tab, region in zip(st.tabs([f"{region} ({results['region_counts'][region]:,})" for region in regions]),
+                           regions):
+        with tab:
+            st.dataframe(employer_frame(results['regions'][region]), use_container_width=True)
+
+
+def render_freshness_panel(freshness):
+    """공고 신선도 - 소스별 게시 경과일·마감까지 남은 일수 분포 (분석 중 받은 공고 기준)"""
+    if not freshness or not freshness['analyzed_count']:
+        return
+    st.subheader("🕒 공고 신선도")
+    st.caption(f"{freshness['today']} 기준 · 받은 공고 {freshness['analyzed_count']:,}개 "
+               f"(추가 요청 없이 게시일·마감일로 계산)")
+
+    bins = freshness['bins']
+    recent = sum(sum(row[:3]) for row in freshness['age'].values())  # 게시 7일 이내
+    dated = sum(sum(row) for row in freshness['age'].values())
+    closing_soon = sum(sum(row[:3]) for row in freshness['days_to_close'].values())  # 7일 이내 마감
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("🆕 게시 7일 이내", f"{recent:,}개", delta=f"{recent / max(dated, 1) * 100:.1f}%")
+    with col2:
+        st.metric("⏰ 7일 이내 마감", f"{closing_soon:,}개")
+    with col3:
+        st.metric("♾️ 마감일 없음", f"{sum(freshness['open_ended'].values()):,}개")
+
+    col1, col2 = st.columns(2)
+    for col, key, title in ((col1, 'age', "게시 경과일"), (col2, 'days_to_close', "마감까지 남은 일수")):
+        with col:
+            fig = go.Figure(data=[
+                go.Bar(x=bins, y=freshness[key][source], name=label, marker_color=SOURCE_COLORS[source])
+                for source, label in SOURCE_NAMES.items() if any(freshness[key][source])
+            ])
+            fig.update_layout(title=title, barmode='stack', yaxis_title="공고 수")
+            st.plotly_chart(fig, use_container_width=True)
+
+    table = pd.DataFrame({
+        '평균 경과일': freshness['mean_age'],
+        '평균 남은 일수': freshness['mean_days_to_close'],
+        '마감일 없음': freshness['open_ended'],
+        '마감 지남': freshness['overdue'],
+        '게시일 미상': freshness['undated']
+    }).rename(index=SOURCE_NAMES)
+    st.dataframe(table, use_container_width=True)
+
+
+def render_count_cube(cube):
+    """지역 × 기간 공고 수 큐브 렌더링"""
+    st.header("📊 지역별 공고 수 (전체/오늘)")
+
+    table = cube.pivot_table(index='area', columns='search_period_type',
+                             values='total_count', aggfunc='sum')
+    table.index = [REGION_CODES.get(code, code) for code in table.index]
+
+    columns = st.columns(len(table.columns))
+    for col, period in zip(columns, table.columns):
+        with col:
+            fig = go.Figure(data=[go.Bar(
+                x=list(table.index),
+                y=list(table[period]),
+                marker_color='#4ECDC4' if period == 'ALL' else '#F38BA8'
+            )])
+            fig.update_layout(title="전체 공고" if period == 'ALL' else "오늘 공고",
+                              yaxis_title="공고 수")
+            st.plotly_chart(fig, use_container_width=True)
+
+    st.dataframe(table, use_container_width=True)
+
+
 def main():
     st.set_page_config(
         page_title="채용공고 모니터링",
@@ -786,6 +477,14 @@ def main():
         if st.button("📅 오늘 공고 분석"):
             st.session_state.check_today = True
 
+        if st.button("📊 지역별 공고 수 한눈에 보기"):
+            st.session_state.run_count_cube = True
+
+        employer_pages = st.slider("업체별 집계 페이지 수", min_value=1, max_value=100, value=10,
+                                   key="employer_pages")
+        if st.button("🏢 업체별 공고 순위"):
+            st.session_state.run_employer_analysis = True
+
         # 지역별 분석 설정
         st.markdown("#### 🏙️ 지역별 분석 설정")
         selected_region_code = st.selectbox(
@@ -849,6 +548,22 @@ def main():
             render_dashboard(results, "오늘 등록된 공고 분석 결과")
         st.session_state.check_today = False
 
+    # 지역 × 기간 공고 수 (count-only 조회)
+    if (hasattr(st.session_state, 'run_count_cube') and
+            st.session_state.run_count_cube):
+        cube = analyzer.count_cube(search_period_types=('ALL', 'TODAY'),
+                                   areas=tuple(REGION_CODES))
+        render_count_cube(cube)
+        st.session_state.run_count_cube = False
+
+    # 업체별 공고 순위
+    if (hasattr(st.session_state, 'run_employer_analysis') and
+            st.session_state.run_employer_analysis):
+        results = analyzer.employer_analysis('ALL', max_pages=employer_pages)
+        if results:
+            render_employer_dashboard(results)
+        st.session_state.run_employer_analysis = False
+
     # 지역별 분석
     if (hasattr(st.session_state, 'run_regional_analysis') and
             st.session_state.run_regional_analysis):
@@ -857,10 +572,11 @@ def main():
         period = st.session_state.selected_regional_period
 
         results = regional_analyzer.analyze_regional_jobs(
-            region_code, region_name, period, max_pages=3
+            region_code, region_name, period, max_pages=3, deadline=DASHBOARD_DEADLINE
         )
         if results:
             render_regional_dashboard(results)
+            render_freshness_panel(results.get('freshness'))
         st.session_state.run_regional_analysis = False
 
     # 푸터
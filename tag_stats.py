@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""
+직종·태그 스트리밍 집계
+공고의 parts(직종), hashTags, skillTags를 소스·시/도별로 세어 분포를 계산
+
+- 직종·태그 이름은 날짜와 무관하게 고정된 작은 정수 코드(TagVocabulary)로 바꾸고 코드별 공고 수 배열만 보관
+  → 여러 날짜 비교는 같은 코드끼리 배열 뺄셈
+- 메모리는 (소스 × 시/도 × 코드 수) 배열 크기로 고정 (종류별 코드는 최대 TAG_CAPACITY개, 넘친 이름은 '(기타)')
+  + 중복 확인용 recruitNo 정렬 배열 (공고 27만 개에 약 2MB)
+- 같은 recruitNo는 처음 한 번만 셈 (밀림 보정으로 재수집한 페이지의 공고를 두 번 세지 않음)
+
+디렉터리 구조:
+  vocabulary.json      - 종류별 코드 순서대로의 이름 목록 (추가만 함)
+  ALL/2025-09-07.npz   - 종류별 (소스, 시/도, 코드) 공고 수 + (소스, 시/도) 전체 공고 수
+
+사용 예:
+  python tag_stats.py top --kind parts --by source
+  python tag_stats.py compare 2025-09-06 2025-09-07 --kind parts
+"""
+
+import os
+import sys
+import json
+import argparse
+import threading
+
+import numpy as np
+import pandas as pd
+
+from analysis_engine import (CACHE_DIR, SOURCE_LABELS, REGION_LABELS, RecruitNoSet, column_region_codes,
+                             column_source_codes)
+
+TAGS_DIR = os.path.join(CACHE_DIR, 'tags')
+TAG_KINDS = ('parts', 'hash_tags', 'skill_tags')  # posting_columns 열 이름 (parts, hashTags, skillTags)
+TAG_CAPACITY = {'parts': 1024, 'hash_tags': 4096, 'skill_tags': 4096}  # 종류별 최대 코드 수
+OVERFLOW_LABEL = '(기타)'  # 코드 0 - 용량을 넘어 코드를 받지 못한 이름
+GROUP_COLUMNS = ('source', 'region', 'total')
+
+
+def tag_name(item):
+    """태그 항목 → 이름 (문자열 또는 {'name'|'value'|'description': ...} 형태)"""
+    if isinstance(item, dict):
+        item = item.get('name') or item.get('value') or item.get('description') or ''
+    return str(item).strip()
+
+
+class TagVocabulary:
+    """
+    종류별 이름 ↔ 코드 사전 - 한 번 받은 코드는 바뀌지 않음 (날짜별 집계 배열을 코드 그대로 비교)
+    코드 0은 '(기타)', 새 이름은 다음 번호를 받고 용량이 차면 '(기타)'로 셈
+    """
+
+    def __init__(self, path=None, capacity=None):
+        self.path = os.path.expanduser(path) if path else None
+        self.capacity = dict(TAG_CAPACITY, **(capacity or {}))
+        self.labels = {kind: [OVERFLOW_LABEL] for kind in TAG_KINDS}
+        if self.path and os.path.exists(self.path):
+            with open(self.path, encoding='utf-8') as f:
+                self.labels.update(json.load(f))
+        self._index = {kind: {label: code for code, label in enumerate(labels)}
+                       for kind, labels in self.labels.items()}
+        self._lock = threading.Lock()
+
+    def encode(self, kind, names):
+        """이름 목록 → 코드 배열 (int16) - 고유한 이름만 사전에서 찾고 없으면 새 코드 부여"""
+        codes, uniques = pd.factorize(np.asarray(names, dtype=object))
+        index = self._index[kind]
+        labels = self.labels[kind]
+        table = np.zeros(len(uniques), dtype=np.int16)
+        with self._lock:
+            for i, name in enumerate(uniques):
+                code = index.get(name)
+                if code is None:
+                    if len(labels) >= self.capacity[kind]:
+                        continue
+                    code = index[name] = len(labels)
+                    labels.append(name)
+                table[i] = code
+        return table[codes]
+
+    def save(self):
+        """사전 저장 (임시 파일에 쓴 뒤 교체)"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with self._lock, open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.labels, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+class TagCounter:
+    """
+    수집 중 직종·태그 스트리밍 집계 - AnalysisEngine(tag_stats=...)에 넘기면 수집한 페이지를 자동 반영
+    종류별 (소스, 시/도, 코드) int32 배열 (parts 기준 약 300KB, 공고 수와 무관)과 중복 확인용 recruitNo만 보관
+    같은 recruitNo는 처음 한 번만 반영 (경계 탐색·재수집 중복 제거)
+    """
+
+    def __init__(self, vocabulary=None):
+        self.vocabulary = vocabulary or TagVocabulary()
+        cells = (len(SOURCE_LABELS), len(REGION_LABELS))
+        self.postings = np.zeros(cells, dtype=np.int64)
+        self.counts = {kind: np.zeros(cells + (self.vocabulary.capacity[kind],), dtype=np.int32)
+                       for kind in TAG_KINDS}
+        self._lock = threading.Lock()
+        self._seen = RecruitNoSet()
+
+    def write_page(self, columns, request_body=None, query=None):
+        """페이지 하나의 공고 열(analysis_engine.posting_columns) 반영"""
+        cells = column_source_codes(columns).astype(np.int64) * len(REGION_LABELS) + column_region_codes(columns)
+        with self._lock:
+            keep = self._seen.add_new(columns['recruit_no'])
+            if not keep.any():
+                return
+            index = np.flatnonzero(keep)
+            cells = cells[index]
+            self.postings.reshape(-1)[:] += np.bincount(cells, minlength=self.postings.size)
+            for kind in TAG_KINDS:
+                tag_lists = columns.get(kind)
+                if tag_lists is None:
+                    continue
+                tag_lists = [tag_lists[i] for i in index.tolist()]
+                lengths = np.fromiter(map(len, tag_lists), dtype=np.int64, count=len(tag_lists))
+                if not lengths.any():
+                    continue
+                codes = self.vocabulary.encode(kind, [tag_name(item) for tags in tag_lists for item in tags])
+                counts = self.counts[kind]
+                flat, added = np.unique(np.repeat(cells, lengths) * counts.shape[-1] + codes, return_counts=True)
+                counts.reshape(-1)[flat] += added.astype(np.int32)
+
+    def arrays(self):
+        """저장·비교용 배열 - 종류별 배열은 사용 중인 코드까지만 잘라 반환"""
+        with self._lock:
+            arrays = {kind: counts[..., :len(self.vocabulary.labels[kind])].copy()
+                      for kind, counts in self.counts.items()}
+            arrays['postings'] = self.postings.copy()
+        return arrays
+
+
+def _collapse(counts, by):
+    """(소스, 시/도, 코드) 배열 → by 기준 (그룹, 코드) 배열과 그룹 이름"""
+    if by == 'source':
+        return counts.sum(axis=1), list(SOURCE_LABELS)
+    if by == 'region':
+        return counts.sum(axis=0), list(REGION_LABELS)
+    return counts.sum(axis=(0, 1))[np.newaxis], ['total']
+
+
+def tag_distribution(counts, labels, by='source', top_n=20):
+    """
+    코드별 공고 수 배열 → 상위 이름별 공고 수 DataFrame (행: 이름, 열: by 그룹 + total)
+    counts: (소스, 시/도, 코드) 배열, labels: 코드 순서의 이름 목록
+    """
+    if by not in GROUP_COLUMNS:
+        raise ValueError(f"집계 기준은 {', '.join(GROUP_COLUMNS)} 중에서 선택: {by}")
+    grouped, groups = _collapse(counts, by)
+    total = grouped.sum(axis=0)
+    order = [code for code in np.argsort(-total, kind='stable')[:top_n] if total[code]]
+    table = pd.DataFrame(grouped[:, order].T, index=[labels[code] for code in order], columns=groups)
+    if by != 'total':
+        table = table.loc[:, table.sum() > 0]
+        table['total'] = total[order]
+    return table
+
+
+def tag_changes(old, new, labels, top_n=20):
+    """
+    두 날짜의 코드별 전체 공고 수 비교 - 같은 코드끼리 배열 뺄셈
+    반환: 변화량이 큰 순 DataFrame (old, new, change, change_rate)
+    """
+    size = len(labels)
+    old_total = np.zeros(size, dtype=np.int64)
+    new_total = np.zeros(size, dtype=np.int64)
+    old_total[:old.shape[-1]] = old.sum(axis=(0, 1))
+    new_total[:new.shape[-1]] = new.sum(axis=(0, 1))
+    change = new_total - old_total
+    order = [code for code in np.argsort(-np.abs(change), kind='stable')[:top_n] if change[code]]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rate = np.where(old_total > 0, change / np.maximum(old_total, 1), np.nan)
+    return pd.DataFrame({
+        'old': old_total[order],
+        'new': new_total[order],
+        'change': change[order],
+        'change_rate': np.round(rate[order], 4)
+    }, index=[labels[code] for code in order])
+
+
+class TagStore:
+    """날짜별 직종·태그 집계 저장소 (사전은 모든 날짜가 공유)"""
+
+    def __init__(self, root_dir=None):
+        self.root_dir = os.path.expanduser(root_dir or TAGS_DIR)
+        self.vocabulary = TagVocabulary(os.path.join(self.root_dir, 'vocabulary.json'))
+
+    def _path(self, date, search_period_type):
+        return os.path.join(self.root_dir, search_period_type, f"{date}.npz")
+
+    def counter(self):
+        """이 저장소의 사전을 쓰는 집계기 (저장한 날짜들과 같은 코드 사용)"""
+        return TagCounter(self.vocabulary)
+
+    def save(self, date, counter, search_period_type='ALL'):
+        """집계 저장 (같은 날짜는 덮어씀) - 사전을 먼저 저장해 배열의 코드가 항상 사전에 있게 함"""
+        self.vocabulary.save()
+        path = self._path(date, search_period_type)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp.npz"
+        np.savez_compressed(tmp_path, **counter.arrays())
+        os.replace(tmp_path, path)
+        return path
+
+    def load(self, date, search_period_type='ALL'):
+        """저장된 집계 - {종류: 배열, 'postings': 배열} (없으면 None)"""
+        try:
+            with np.load(self._path(date, search_period_type)) as data:
+                return {name: data[name] for name in data.files}
+        except (OSError, ValueError):
+            return None
+
+    def dates(self, search_period_type='ALL'):
+        directory = os.path.join(self.root_dir, search_period_type)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(name[:-len('.npz')] for name in os.listdir(directory)
+                      if name.endswith('.npz') and not name.endswith('.tmp.npz'))
+
+    def previous_date(self, date, search_period_type='ALL'):
+        """date 이전에 저장된 가장 최근 날짜"""
+        earlier = [d for d in self.dates(search_period_type) if d < date]
+        return earlier[-1] if earlier else None
+
+    def compare(self, old_date, new_date, kind='parts', search_period_type='ALL', top_n=20):
+        """두 날짜 비교 - tag_changes 결과 (어느 한쪽이 없으면 None)"""
+        old = self.load(old_date, search_period_type)
+        new = self.load(new_date, search_period_type)
+        if old is None or new is None:
+            return None
+        return tag_changes(old[kind], new[kind], self.vocabulary.labels[kind], top_n)
+
+
+def tag_summary(arrays, labels, top_n=10, changes=None):
+    """리포트 전송용 요약 - 종류별 상위 이름의 소스별 공고 수 (changes: 직전 날짜 대비 직종 변화 DataFrame)"""
+    def records(table, index_name):
+        return table.rename_axis(index_name).reset_index().to_dict('records')
+
+    summary = {
+        'postings': int(arrays['postings'].sum()),
+        'postings_by_source': dict(zip(SOURCE_LABELS, arrays['postings'].sum(axis=1).tolist()))
+    }
+    for kind in TAG_KINDS:
+        table = tag_distribution(arrays[kind], labels[kind], 'source', top_n)
+        if not table.empty:
+            summary[kind] = records(table, 'label')
+    if changes is not None and not changes.empty:
+        summary['parts_changes'] = records(changes.astype(object).where(changes.notna(), None), 'label')
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="직종·태그 분포")
+    parser.add_argument('--dir', default=TAGS_DIR, help="저장소 디렉터리")
+    parser.add_argument('--period', default='ALL', help="검색 기간 (ALL/TODAY)")
+    parser.add_argument('--kind', default='parts', choices=TAG_KINDS, help="집계 종류")
+    parser.add_argument('--top', type=int, default=20, help="표시할 상위 이름 수")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    top = commands.add_parser('top', help="날짜별 상위 직종·태그")
+    top.add_argument('--date', help="날짜 (생략 시 마지막 날짜)")
+    top.add_argument('--by', default='source', choices=GROUP_COLUMNS, help="집계 기준")
+
+    compare = commands.add_parser('compare', help="두 날짜 비교")
+    compare.add_argument('old_date', nargs='?', help="비교 기준 날짜 (생략 시 마지막 두 날짜)")
+    compare.add_argument('new_date', nargs='?')
+    args = parser.parse_args()
+
+    store = TagStore(args.dir)
+    dates = store.dates(args.period)
+    labels = store.vocabulary.labels[args.kind]
+
+    if args.command == 'top':
+        date = args.date or (dates[-1] if dates else None)
+        arrays = store.load(date, args.period) if date else None
+        if arrays is None:
+            print(f"❌ 저장된 집계가 없습니다 (저장된 날짜: {', '.join(dates) or '없음'})")
+            return 1
+        print(f"🏷️ {date} {args.kind} 상위 {args.top}개 (공고 {int(arrays['postings'].sum()):,}개)")
+        print(tag_distribution(arrays[args.kind], labels, args.by, args.top).to_string())
+        return 0
+
+    old_date = args.old_date or (dates[-2] if len(dates) >= 2 else None)
+    new_date = args.new_date or (dates[-1] if dates else None)
+    changes = store.compare(old_date, new_date, args.kind, args.period, args.top) if old_date and new_date else None
+    if changes is None:
+        print(f"❌ 비교할 집계가 없습니다 (저장된 날짜: {', '.join(dates) or '없음'})")
+        return 1
+    print(f"🏷️ {old_date} → {new_date} {args.kind} 변화")
+    print(changes.to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+k진 경계 탐색 테스트 (네트워크 요청 없음)
+페이지 번호만으로 소스가 정해지는 가상 목록에서 잡코리아·워크넷 시작 페이지를 찾음
+시간 예산(deadline)이 부족하면 확정하지 못한 구간을 추정값과 함께 반환
+
+실행: python -m pytest -q test_boundary_search.py
+"""
+
+import pytest
+
+from analysis_engine import AnalysisEngine
+
+
+class FakeIndex:
+    """페이지 번호만으로 소스를 정하는 가상 목록 - 요청한 페이지를 memo에 채움"""
+
+    def __init__(self, jobkorea_start, worknet_start):
+        self.jobkorea_start = jobkorea_start
+        self.worknet_start = worknet_start
+        self.requested = []
+
+    def source(self, page):
+        if page >= self.worknet_start:
+            return 'worknet'
+        return 'jobkorea' if page >= self.jobkorea_start else 'albamon'
+
+    def fetch_pages(self, pages, search_period_type, memo, timeout=30):
+        pages = [page for page in pages if page not in memo]
+        for page in pages:
+            memo[page] = {'result': {'recruitList': [{'source': self.source(page)}]}}
+        self.requested.extend(pages)
+        return len(pages)
+
+
+PREDICATES = [
+    ('jobkorea', lambda jobs: jobs[0]['source'] in ('jobkorea', 'worknet')),
+    ('worknet', lambda jobs: jobs[0]['source'] == 'worknet')
+]
+
+
+@pytest.fixture
+def boundary_engine(monkeypatch):
+    engine = AnalysisEngine(page_size=200)
+    index = FakeIndex(jobkorea_start=377, worknet_start=912)
+    monkeypatch.setattr(engine, '_fetch_pages', index.fetch_pages)
+    engine.index = index
+    return engine
+
+
+def test_kary_boundaries_exact(boundary_engine):
+    boundaries, requests_made, rounds, unresolved = boundary_engine._kary_boundaries(
+        PREDICATES, 1000, 'ALL', {})
+    assert boundaries == {'jobkorea': 377, 'worknet': 912}
+    assert unresolved == {}
+    assert requests_made == len(set(boundary_engine.index.requested))
+    assert requests_made < 100
+
+
+@pytest.mark.parametrize('jobkorea_start, worknet_start', [(1, 2), (999, 1000), (500, 501)])
+def test_kary_boundaries_adjacent_and_edge_pages(monkeypatch, jobkorea_start, worknet_start):
+    engine = AnalysisEngine(page_size=200)
+    index = FakeIndex(jobkorea_start, worknet_start)
+    monkeypatch.setattr(engine, '_fetch_pages', index.fetch_pages)
+    boundaries, _, _, unresolved = engine._kary_boundaries(PREDICATES, 1000, 'ALL', {})
+    assert boundaries == {'jobkorea': jobkorea_start, 'worknet': worknet_start}
+    assert unresolved == {}
+
+
+def test_kary_boundaries_deadline_reports_unresolved(boundary_engine):
+    boundaries, requests_made, rounds, unresolved = boundary_engine._kary_boundaries(
+        PREDICATES, 1000, 'ALL', {}, deadline_at=0)
+    assert requests_made == 0 and rounds == 0
+    assert unresolved == {'jobkorea': [1, 1000], 'worknet': [1, 1000]}
+    assert boundaries == {'jobkorea': 500, 'worknet': 500}
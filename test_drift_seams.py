@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+페이지 밀림 감지·보정 테스트 (네트워크 요청 없음)
+인접 페이지 recruitNo 중복으로만 밀림을 판단하고, 전수 조사 중 공고가 추가되면 밀린 페이지만 다시 받음
+
+실행: python -m pytest -q test_drift_seams.py
+"""
+
+import copy
+
+import numpy as np
+
+import analysis_engine
+from analysis_engine import AnalysisEngine, find_drift_seams
+from test_memory_regression import SimulatedIndex
+
+
+def page_summary(page, recruit_nos, total_count=1000):
+    return {
+        'page': page,
+        'total_count': total_count,
+        'recruit_nos': np.array(recruit_nos, dtype=np.int64)
+    }
+
+
+def test_drift_seam_on_boundary_overlap():
+    summaries = {
+        1: page_summary(1, [10, 11, 12]),
+        2: page_summary(2, [12, 13, 14]),  # 앞 페이지 마지막 공고가 밀려 다시 나옴
+        3: page_summary(3, [15, 16, 17])
+    }
+    assert find_drift_seams(summaries) == {1, 2}
+
+
+def test_total_count_change_alone_is_not_a_seam():
+    summaries = {
+        1: page_summary(1, [10, 11, 12], total_count=1000),
+        2: page_summary(2, [13, 14, 15], total_count=1003),
+        3: page_summary(3, [16, 17, 18], total_count=998)
+    }
+    assert find_drift_seams(summaries) == set()
+
+
+def test_drift_seam_only_between_adjacent_pages():
+    summaries = {
+        1: page_summary(1, [10, 11]),
+        2: page_summary(2, [11, 12]),
+        4: page_summary(4, [12, 13]),  # 3페이지가 없으면 2·4는 인접하지 않음
+        5: page_summary(5, [14, 15])
+    }
+    assert find_drift_seams(summaries) == {1, 2}
+    assert find_drift_seams(summaries, pages=[2, 4, 5]) == set()
+
+
+def test_census_repairs_pages_shifted_by_new_postings(tmp_path, monkeypatch):
+    monkeypatch.setattr(analysis_engine, 'CACHE_DIR', str(tmp_path))
+    index = SimulatedIndex()
+    calls = []
+
+    def fetch_raw(request_body, timeout):
+        calls.append(request_body['pagination']['page'])
+        if len(calls) == 10:
+            # 수집 중 맨 앞에 공고 3개 추가, 맨 뒤 3개 마감 → 이후 받는 페이지는 3개씩 밀림
+            for i in range(3):
+                job = copy.deepcopy(index.jobs[0])
+                job['recruitNo'] = 99000000 + i
+                index.jobs.insert(0, job)
+                index.jobs.pop()
+        return index.fetch_raw(request_body, timeout)
+
+    engine = AnalysisEngine(page_size=1000)
+    monkeypatch.setattr(engine, '_fetch_raw', fetch_raw)
+    result = engine.full_census('ALL', fetch_workers=1, decode_workers=1)
+
+    census = result['census']
+    drift = result['drift']
+    assert drift['pages_refetched'] == [9, 10]
+    assert not drift['unresolved_pages']
+    # 밀린 경계는 다시 받은 판까지 recruitNo 기준으로 합쳐 남은 원래 공고를 중복 없이 모두 셈
+    # (새 공고는 이미 받은 1페이지 앞에 들어가 이번 조사에서는 빠짐)
+    assert census['unique_postings'] == 20000 - 3
+    assert result['albamon_count'] + result['jobkorea_count'] + result['worknet_count'] == 20000 - 3
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공고 신선도 테스트 (네트워크 요청 없음)
+연도 없는 게시일(연말·연초) 해석, 마감일 대체 필드, 소스별 경과일·남은 일수 집계
+
+실행: python -m pytest -q test_freshness.py
+"""
+
+import numpy as np
+
+from analysis_engine import FreshnessCounter, freshness_labels, parse_closing_dates, parse_posted_dates
+
+
+def test_posted_date_year_rollover():
+    posted = parse_posted_dates(['12/30', '1/5', '1/4'], today='2026-01-05')
+    assert posted.tolist() == [np.datetime64('2025-12-30', 'D').item(),
+                               np.datetime64('2026-01-05', 'D').item(),
+                               np.datetime64('2026-01-04', 'D').item()]
+
+
+def test_posted_date_invalid_values():
+    posted = parse_posted_dates(['2/30', '', None, '오늘'], today='2026-03-01')
+    assert np.isnat(posted).all()
+
+
+def test_closing_date_fallback():
+    closing = parse_closing_dates(['2026-01-10', '', ''], ['', '2026-01-20 (마감일 15일전)', '상시모집'])
+    assert str(closing[0]) == '2026-01-10'
+    assert str(closing[1]) == '2026-01-20'
+    assert np.isnat(closing[2])
+
+
+def test_freshness_counter_by_source():
+    counter = FreshnessCounter(today='2026-01-05')
+    counter.write_page({
+        'source': ['albamon', 'albamon', 'jobkorea', 'worknet'],
+        'is_paid': [False, True, False, False],
+        'posted_date': ['1/5', '12/30', '', '1/1'],
+        'closing_date': ['2026-01-10', '', '', '2026-01-01'],
+        'closing_date_with_dday': ['', '2026-01-05 (마감일 0일전)', '', '']
+    })
+    result = counter.result()
+    labels = freshness_labels()
+
+    assert result['analyzed_count'] == 4
+    assert result['age']['albamon_free'][labels.index('0일')] == 1
+    assert result['age']['albamon_paid'][labels.index('4~7일')] == 1  # 작년 12/30
+    assert result['mean_age'] == {'albamon_free': 0.0, 'albamon_paid': 6.0, 'jobkorea': None, 'worknet': 4.0}
+    assert result['undated'] == {'albamon_free': 0, 'albamon_paid': 0, 'jobkorea': 1, 'worknet': 0}
+    assert result['days_to_close']['albamon_free'][labels.index('4~7일')] == 1
+    assert result['days_to_close']['albamon_paid'][labels.index('0일')] == 1  # closingDateWithDDay 사용
+    assert result['open_ended']['jobkorea'] == 1
+    assert result['overdue']['worknet'] == 1
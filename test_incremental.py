@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+증분(delta) 분석 테스트 (네트워크 요청 없음)
+기준 상태의 유료/무료 구분을 이어받아 새 공고만 더하고, 마감·삭제된 공고는 소스별 수와 따로 보고
+
+실행: python -m pytest -q test_incremental.py
+"""
+
+import copy
+
+import analysis_engine
+from analysis_engine import AnalysisEngine
+from test_memory_regression import SimulatedIndex
+
+
+def test_incremental_all_keeps_paid_free_split_and_reports_removals(tmp_path, monkeypatch):
+    monkeypatch.setattr(analysis_engine, 'CACHE_DIR', str(tmp_path))
+    index = SimulatedIndex()
+    pages = []
+
+    def fetch_raw(request_body, timeout):
+        pages.append(request_body['pagination']['page'])
+        return index.fetch_raw(request_body, timeout)
+
+    engine = AnalysisEngine(page_size=1000)
+    monkeypatch.setattr(engine, '_fetch_raw', fetch_raw)
+
+    baseline = engine.incremental_analysis('ALL')
+    assert baseline['incremental']['mode'] == 'baseline'
+    # 최신순 1페이지는 기준 상태를 만들 때 한 번만 받음 (전수 조사 20페이지 + 최신순 1페이지)
+    assert len(pages) == 21
+    assert baseline['albamon_paid_count'] == 4000
+    assert baseline['albamon_free_count'] == 8000
+
+    # 맨 앞에 유료 자사 공고 5개 추가, 맨 뒤 워크넷 공고 3개 마감
+    for i in range(5):
+        job = copy.deepcopy(index.jobs[0])
+        job['recruitNo'] = 99000000 + i
+        job['paidService']['totalProductCount'] = 1
+        index.jobs.insert(0, job)
+    del index.jobs[-3:]
+
+    pages.clear()
+    delta = engine.incremental_analysis('ALL')
+    assert pages == [1]
+    assert delta['incremental']['mode'] == 'delta'
+    assert delta['incremental']['new_postings'] == 5
+    assert delta['albamon_paid_count'] == 4005
+    assert delta['albamon_free_count'] == 8000
+    assert delta['albamon_count'] == 12005
+    assert delta['worknet_count'] == 3000  # 마감된 공고의 소스는 알 수 없어 소스별 수는 그대로
+    assert delta['incremental']['removed_postings'] == 3
+    assert delta['total_count'] == 20002
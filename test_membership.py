@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+날짜별 공고 집합 비교 테스트 (네트워크 요청 없음)
+소스별 신규/삭제/유지 공고 수와 차분 압축 저장·로드
+
+실행: python -m pytest -q test_membership.py
+"""
+
+import numpy as np
+
+from analysis_engine import SOURCE_LABELS
+from membership import MembershipStore, diff_sets
+
+
+def test_diff_sets_counts_source_moves_as_kept_in_total():
+    old = {'albamon_free': np.array([1, 2, 3], dtype=np.int64), 'worknet': np.array([10], dtype=np.int64)}
+    new = {'albamon_free': np.array([2], dtype=np.int64), 'albamon_paid': np.array([3, 4], dtype=np.int64)}
+    result = diff_sets(old, new)
+
+    assert result['albamon_free'] == {'new': 0, 'removed': 2, 'kept': 1, 'jaccard': round(1 / 3, 4)}
+    assert result['albamon_paid'] == {'new': 2, 'removed': 0, 'kept': 0, 'jaccard': 0.0}
+    assert result['jobkorea'] == {'new': 0, 'removed': 0, 'kept': 0, 'jaccard': 1.0}
+    # 무료 → 유료 전환(3)은 전체 기준으로는 유지
+    assert result['total'] == {'new': 1, 'removed': 2, 'kept': 2, 'jaccard': 0.4}
+
+
+def test_store_round_trip_and_compare(tmp_path):
+    store = MembershipStore(str(tmp_path))
+    empty = np.zeros(0, dtype=np.int64)
+    first = dict.fromkeys(SOURCE_LABELS, empty)
+    first.update(albamon_free=np.array([100000001, 100000005, 800000000], dtype=np.int64))
+    second = dict.fromkeys(SOURCE_LABELS, empty)
+    second.update(albamon_free=np.array([100000005, 100000009], dtype=np.int64))
+    store.save('2026-01-04', first)
+    store.save('2026-01-05', second)
+
+    assert store.load('2026-01-04')['albamon_free'].tolist() == [100000001, 100000005, 800000000]
+    assert store.previous_date('2026-01-05') == '2026-01-04'
+    assert store.compare('2026-01-04', '2026-01-05')['total'] == \
+        {'new': 1, 'removed': 2, 'kept': 1, 'jaccard': 0.25}
+    assert store.compare('2026-01-03', '2026-01-05') is None
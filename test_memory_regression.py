@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+메모리 회귀 테스트
+page_1340_response.json 공고를 복제한 가상 인덱스로 전수 조사·지역 분석을 실행하고
+단계별 최대 메모리(tracemalloc)가 공고 1만 개당 기준을 넘으면 실패
+
+실행: python -m pytest -q test_memory_regression.py
+"""
+
+import copy
+import json
+import os
+
+import pytest
+
+import analysis_engine
+from analysis_engine import AnalysisEngine
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'page_1340_response.json')
+
+PAGE_SIZE = 1000
+# 자사(유료/무료) → 잡코리아 → 워크넷 순서의 가상 인덱스
+SIMULATED_SOURCES = [('albamon', 12000), ('jobkorea', 5000), ('worknet', 3000)]
+
+# 공고 1만 개당 최대 메모리 기준 (바이트) - 측정값(전수 조사 약 15MB, 지역 분석 약 65MB)의 약 1.5배
+CENSUS_PEAK_PER_10K = 24 * 1024 * 1024
+REGIONAL_PEAK_PER_10K = 96 * 1024 * 1024
+
+
+def build_index():
+    """템플릿 공고를 복제해 출처 순서대로 정렬된 가상 인덱스 생성"""
+    with open(TEMPLATE_PATH, encoding='utf-8') as f:
+        template = json.load(f)
+    base_job = template['base']['normal']['collection'][0]
+
+    jobs = []
+    for source, count in SIMULATED_SOURCES:
+        for i in range(count):
+            job = copy.deepcopy(base_job)
+            job['recruitNo'] = 100000000 + len(jobs)
+            job['jobkoreaRecruitNo'] = 900000 + len(jobs) if source == 'jobkorea' else 0
+            job['externalRecruitSite'] = 'WN' if source == 'worknet' else ''
+            job['paidService']['totalProductCount'] = 1 if source == 'albamon' and i % 3 == 0 else 0
+            jobs.append(job)
+    return template, jobs
+
+
+class SimulatedIndex:
+    """검색 API 대역 - 요청 본문의 페이지 구간을 JSON 바이트로 돌려줌 (SEARCH/AREA 공통)"""
+
+    def __init__(self):
+        self.template, self.jobs = build_index()
+
+    def fetch_raw(self, request_body, timeout):
+        page = request_body['pagination']['page']
+        size = request_body['pagination']['size']
+        collection = self.jobs[(page - 1) * size:page * size]
+        for index, job in enumerate(collection):
+            job['pageNo'], job['pageIndex'], job['no'] = page, index, (page - 1) * size + index + 1
+        response = dict(self.template)
+        response['base'] = {
+            'pagination': {'page': page, 'size': size, 'totalCount': len(self.jobs)},
+            'normal': {'collection': collection}
+        }
+        return json.dumps(response, ensure_ascii=False).encode('utf-8')
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    # 체크포인트·페이지 크기 캐시는 임시 디렉터리에 저장
+    monkeypatch.setattr(analysis_engine, 'CACHE_DIR', str(tmp_path))
+    index = SimulatedIndex()
+    analyzer = AnalysisEngine(page_size=PAGE_SIZE, trace_memory=True)
+    monkeypatch.setattr(analyzer, '_fetch_raw', index.fetch_raw)
+    analyzer.index = index
+    return analyzer
+
+
+def per_10k(peak_bytes, postings):
+    return peak_bytes * 10000 / postings
+
+
+def test_census_peak_memory(engine):
+    result = engine.full_census('ALL', fetch_workers=4, decode_workers=2)
+    total = len(engine.index.jobs)
+
+    assert result['census']['unique_postings'] == total
+    assert result['jobkorea_count'] == 5000
+    assert result['worknet_count'] == 3000
+
+    memory = result['census']['memory']
+    assert set(memory['phases']) == {'fetch_decode', 'drift_repair', 'aggregate'}
+    assert per_10k(memory['peak_bytes'], total) < CENSUS_PEAK_PER_10K, memory
+
+
+def test_regional_peak_memory(engine):
+    max_pages = 10
+    result = engine.analyze_regional_jobs('I000', '테스트', max_pages=max_pages, page_size=PAGE_SIZE)
+    analyzed = result['analyzed_count']
+
+    assert analyzed == max_pages * PAGE_SIZE
+    memory = result['performance']['memory']
+    assert set(memory['phases']) == {'fetch', 'classify'}
+    assert per_10k(memory['peak_bytes'], analyzed) < REGIONAL_PEAK_PER_10K, memory
+
+
+def test_memory_tracking_disabled(engine):
+    engine.trace_memory = False
+    result = engine.analyze_regional_jobs('I000', '테스트', max_pages=1)
+    assert 'memory' not in result['performance']
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+원본 페이지 아카이브 스냅샷 테스트 (네트워크 요청 없음)
+같은 날 여러 페이지 크기로 저장된 페이지를 섞지 않고 한 가지 크기만 고르는지 확인
+
+실행: python -m pytest -q test_page_archive.py
+"""
+
+from datetime import datetime
+
+from analysis_engine import build_search_body
+from page_archive import PageArchive, query_key
+
+FETCHED_AT = datetime(2026, 1, 5, 9, 0)
+DATE = '2026-01-05'
+TOTAL_COUNT = 2500
+
+
+def store(archive, page, size, fetched_at=FETCHED_AT):
+    count = max(0, min(size, TOTAL_COUNT - (page - 1) * size))
+    jobs = [{'recruitNo': (page - 1) * size + i + 1} for i in range(count)]
+    data = {'base': {'pagination': {'page': page, 'size': size, 'totalCount': TOTAL_COUNT},
+                     'normal': {'collection': jobs}}}
+    archive.store_page(build_search_body(page, size, 'ALL'), data, fetched_at=fetched_at)
+
+
+def test_snapshot_prefers_largest_complete_page_size(tmp_path):
+    archive = PageArchive(str(tmp_path))
+    for page in (1, 7, 12):  # 경계 탐색 표본 (200개씩)
+        store(archive, page, 200)
+    for page in (1, 2, 3):  # 전수 조사 (1000개씩, 전체 2,500개)
+        store(archive, page, 1000)
+    store(archive, 1, 2000)  # 1페이지만 받은 더 큰 크기
+    query = query_key(build_search_body(1, 1000, 'ALL'))
+
+    entries = archive.snapshot(DATE, query)
+    assert [(entry['size'], entry['page']) for entry in entries] == [(1000, 1), (1000, 2), (1000, 3)]
+    assert sum(1 for _ in archive.iter_postings(DATE, query)) == TOTAL_COUNT
+
+    assert [entry['page'] for entry in archive.snapshot(DATE, query, size=200)] == [1, 7, 12]
+
+
+def test_snapshot_without_complete_size_uses_most_postings(tmp_path):
+    archive = PageArchive(str(tmp_path))
+    for page in (1, 2, 3, 4):
+        store(archive, page, 200)
+    store(archive, 1, 1000)
+    store(archive, 1, 1000, fetched_at=FETCHED_AT.replace(hour=10))  # 같은 (크기, 페이지)는 마지막 수집본
+    query = query_key(build_search_body(1, 200, 'ALL'))
+
+    entries = archive.snapshot(DATE, query)
+    assert [(entry['size'], entry['page']) for entry in entries] == [(1000, 1)]
+    assert entries[0]['fetched_at'] == FETCHED_AT.replace(hour=10).isoformat()
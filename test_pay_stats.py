@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+급여 정규화 테스트 (네트워크 요청 없음)
+급여 유형별 시급 환산, 제외 대상, 수집 중 recruitNo 중복 제거
+
+실행: python -m pytest -q test_pay_stats.py
+"""
+
+import copy
+
+import numpy as np
+import pytest
+
+from analysis_engine import RecruitNoSet, posting_columns
+from pay_stats import PAY_TYPE_HOURS, PayCollector, hourly_pay
+from test_memory_regression import build_index
+
+
+@pytest.mark.parametrize('pay, pay_type, expected', [
+    ('12,000원', 'HOURLY_WAGE', 12000),
+    ('100,000원', 'DAILY_WAGE', 100000 / PAY_TYPE_HOURS['DAILY_WAGE']),
+    ('2,500,000원', 'MONTHLY_SALARY', 2500000 / PAY_TYPE_HOURS['MONTHLY_SALARY']),
+    ('36,000,000원', 'YEARLY_SALARY', 36000000 / PAY_TYPE_HOURS['YEARLY_SALARY']),
+    ('11,000~13,000원', 'HOURLY_WAGE', 11000),  # 범위 표기는 하한
+])
+def test_hourly_pay_by_pay_type(pay, pay_type, expected):
+    assert hourly_pay([pay], [pay_type])[0] == pytest.approx(expected)
+
+
+def test_hourly_pay_excluded_values():
+    hourly = hourly_pay(['50,000원', '협의', '15,000원', '500원', '12,000원'],
+                        ['PER_CASE', 'HOURLY_WAGE', 'HOURLY_WAGE', 'HOURLY_WAGE', None],
+                        [False, True, True, False, False])
+    assert np.isnan(hourly[0])  # 환산 기준이 없는 급여 유형
+    assert np.isnan(hourly[1])  # 금액 없는 협의
+    assert hourly[2] == 15000  # 금액이 적힌 협의는 사용
+    assert np.isnan(hourly[3])  # 범위를 벗어난 환산액
+    assert np.isnan(hourly[4])  # 급여 유형 없음
+
+
+def test_recruit_no_set_keeps_first_occurrence_across_merges():
+    seen = RecruitNoSet(merge_size=3)
+    assert seen.add_new([5, 6, 5, 0]).tolist() == [True, True, False, True]
+    assert seen.add_new([6, 7, 8, 0]).tolist() == [False, True, True, True]  # 병합 전 대기 번호와 비교
+    assert seen.add_new([8, 9, 5]).tolist() == [False, True, False]  # 병합 후 정렬 배열과 비교
+    assert len(seen) == 5
+
+
+def test_pay_collector_counts_each_recruit_no_once():
+    _, jobs = build_index()
+    jobs = copy.deepcopy(jobs[:6])
+    collector = PayCollector()
+    collector.write_page(posting_columns(jobs[:4], 1))
+    collector.write_page(posting_columns(jobs[2:], 2))  # 앞 페이지 공고 2개가 밀려 다시 나옴
+    collector.write_page(posting_columns(jobs[:4], 1))  # 밀림 보정으로 같은 페이지 재수집
+    assert len(collector.frame()) == 6
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+직종·태그 집계 테스트 (네트워크 요청 없음)
+같은 공고가 다시 들어와도(밀림 보정 재수집) 한 번만 세는지 확인
+
+실행: python -m pytest -q test_tag_stats.py
+"""
+
+import copy
+
+from analysis_engine import posting_columns
+from tag_stats import TagCounter, TagVocabulary
+from test_memory_regression import build_index
+
+
+def tagged_jobs(count, parts):
+    _, jobs = build_index()
+    jobs = copy.deepcopy(jobs[:count])
+    for job in jobs:
+        job['parts'] = list(parts)
+        job['hashTags'] = []
+        job['skillTags'] = []
+    return jobs
+
+
+def test_refetched_postings_are_counted_once():
+    counter = TagCounter(TagVocabulary())
+    jobs = tagged_jobs(6, ['카페', '서빙'])
+    counter.write_page(posting_columns(jobs[:4], 1))
+    counter.write_page(posting_columns(jobs[2:], 2))  # 앞 페이지 공고 2개가 밀려 다시 나옴
+    counter.write_page(posting_columns(jobs[:4], 1))  # 밀림 보정으로 같은 페이지 재수집
+
+    arrays = counter.arrays()
+    assert arrays['postings'].sum() == 6
+    labels = counter.vocabulary.labels['parts']
+    totals = arrays['parts'].sum(axis=(0, 1))
+    assert totals[labels.index('카페')] == 6
+    assert totals[labels.index('서빙')] == 6
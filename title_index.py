@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+공고 제목 전문 검색 색인 (SQLite FTS5)
+수집한 공고 제목 전체를 날짜별로 색인해 키워드가 들어간 공고 수를 날짜·소스·지역별로 조회
+- trigram 토크나이저: 띄어쓰기·조사와 무관하게 한국어 부분 문자열 검색 (3글자 미만 키워드는 LIKE로 검색)
+- 페이지 하나를 트랜잭션 하나로 일괄 기록해 수집 속도에 맞춰 색인
+- 같은 날 같은 recruitNo는 한 번만 색인
+
+사용 예:
+  python title_index.py build --archive archive --date 2025-09-07
+  python title_index.py search 바리스타 --since 2025-09-01
+"""
+
+import os
+import sys
+import sqlite3
+import argparse
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+from analysis_engine import CACHE_DIR, posting_columns, region_name
+from page_archive import PageArchive
+
+INDEX_PATH = os.path.join(CACHE_DIR, 'title_index.sqlite')
+TRIGRAM_MIN_LENGTH = 3  # trigram 색인으로 찾을 수 있는 최소 키워드 길이
+GROUP_COLUMNS = ('snapshot_date', 'source', 'is_paid', 'region', 'company_name')  # 집계 기준으로 쓸 수 있는 열
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS postings (
+    id INTEGER PRIMARY KEY,
+    snapshot_date TEXT NOT NULL,
+    recruit_no INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    is_paid INTEGER NOT NULL,
+    region TEXT NOT NULL,
+    workplace_area TEXT NOT NULL,
+    company_name TEXT NOT NULL,
+    title TEXT NOT NULL,
+    UNIQUE (snapshot_date, recruit_no)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS titles USING fts5(
+    title, content='postings', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS postings_ai AFTER INSERT ON postings BEGIN
+    INSERT INTO titles(rowid, title) VALUES (new.id, new.title);
+END;
+"""
+
+
+class TitleIndex:
+    """
+    제목 전문 검색 색인 - AnalysisEngine(title_index=...)에 넘기면 수집한 페이지를 자동 색인
+    여러 워커 스레드에서 호출해도 안전 (연결 하나를 잠금으로 공유)
+    """
+
+    def __init__(self, path=INDEX_PATH, snapshot_date=None):
+        self.path = os.path.expanduser(path)
+        self.snapshot_date = snapshot_date or datetime.now().strftime('%Y-%m-%d')
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self.stats = {
+            'pages_indexed': 0,
+            'postings_indexed': 0,
+            'duplicates_skipped': 0
+        }
+
+    # ------------------------------------------------------------------
+    # 색인
+    # ------------------------------------------------------------------
+    def write_page(self, columns, request_body=None, query=None):
+        """페이지 하나의 공고 열(analysis_engine.posting_columns)을 한 트랜잭션으로 색인"""
+        rows = [
+            (self.snapshot_date, int(recruit_no), source, int(is_paid), region_name(area), area, company, title)
+            for recruit_no, source, is_paid, area, company, title in zip(
+                columns['recruit_no'], columns['source'], columns['is_paid'],
+                columns['workplace_area'], columns['company_name'], columns['recruit_title'])
+            if recruit_no
+        ]
+        with self._lock:
+            with self._conn:
+                inserted = self._conn.executemany(
+                    'INSERT OR IGNORE INTO postings (snapshot_date, recruit_no, source, is_paid, region, '
+                    'workplace_area, company_name, title) VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows).rowcount
+            self.stats['pages_indexed'] += 1
+            self.stats['postings_indexed'] += inserted
+            self.stats['duplicates_skipped'] += len(rows) - inserted
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+        return self.stats
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def _match(self, keyword, since=None, until=None):
+        """키워드·기간 조건 SQL (trigram 색인 또는 짧은 키워드는 LIKE)"""
+        keyword = keyword.strip()
+        if len(keyword) >= TRIGRAM_MIN_LENGTH:
+            clause = 'p.id IN (SELECT rowid FROM titles WHERE titles MATCH ?)'
+            params = ['"' + keyword.replace('"', '""') + '"']
+        else:
+            clause = "p.title LIKE ? ESCAPE '\\'"
+            escaped = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            params = [f'%{escaped}%']
+        if since:
+            clause += ' AND p.snapshot_date >= ?'
+            params.append(since)
+        if until:
+            clause += ' AND p.snapshot_date <= ?'
+            params.append(until)
+        return clause, params
+
+    def keyword_counts(self, keyword, since=None, until=None, by=('snapshot_date', 'source', 'region')):
+        """
+        키워드가 제목에 들어간 공고 수
+        반환: by 열별 공고 수 DataFrame (열: by..., count)
+        """
+        by = list(by)
+        unknown = set(by) - set(GROUP_COLUMNS)
+        if unknown:
+            raise ValueError(f"집계 기준은 {', '.join(GROUP_COLUMNS)} 중에서 선택: {', '.join(sorted(unknown))}")
+        clause, params = self._match(keyword, since, until)
+        group = ', '.join(f'p.{column}' for column in by)
+        with self._lock:
+            return pd.read_sql_query(
+                f'SELECT {group}, COUNT(*) AS count FROM postings p WHERE {clause} '
+                f'GROUP BY {group} ORDER BY {group}', self._conn, params=params)
+
+    def search(self, keyword, since=None, until=None, limit=50):
+        """키워드가 제목에 들어간 공고 (최근 날짜 순)"""
+        clause, params = self._match(keyword, since, until)
+        with self._lock:
+            return pd.read_sql_query(
+                f'SELECT p.snapshot_date, p.recruit_no, p.source, p.region, p.company_name, p.title '
+                f'FROM postings p WHERE {clause} ORDER BY p.snapshot_date DESC, p.recruit_no DESC LIMIT ?',
+                self._conn, params=params + [limit])
+
+    def dates(self):
+        """색인된 날짜별 공고 수"""
+        with self._lock:
+            return pd.read_sql_query('SELECT snapshot_date, COUNT(*) AS count FROM postings '
+                                     'GROUP BY snapshot_date ORDER BY snapshot_date', self._conn)
+
+
+def index_archive(archive, date, query='search_ALL_RELATION', path=INDEX_PATH):
+    """
+    아카이브된 스냅샷을 네트워크 없이 색인 - 반환: 색인 통계 dict
+    전체 공고를 덮지 못한 날짜(경계 탐색 페이지만 아카이브된 날 등)는 색인하지 않고 partial로 반환
+    """
+    if isinstance(archive, str):
+        archive = PageArchive(archive)
+    entries = archive.snapshot(date, query)
+    archived = sum(entry['count'] for entry in entries)
+    total_count = entries[0]['total_count'] if entries else 0
+    if archived < total_count:
+        return {'pages_indexed': 0, 'postings_indexed': 0, 'duplicates_skipped': 0,
+                'partial': True, 'postings_archived': archived, 'total_count': total_count}
+    with TitleIndex(path, snapshot_date=date) as index:
+        for entry, jobs in archive.iter_pages(date, query, entries[0].get('size') if entries else None):
+            index.write_page(posting_columns(jobs, entry['page']))
+    return index.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공고 제목 전문 검색 색인")
+    parser.add_argument('--db', default=INDEX_PATH, help="색인 파일 경로")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help="아카이브 스냅샷 색인")
+    build.add_argument('--archive', default='archive', help="아카이브 디렉터리")
+    build.add_argument('--date', action='append', help="색인할 날짜 (생략 시 아카이브 전체)")
+    build.add_argument('--query', default='search_ALL_RELATION', help="쿼리 식별자")
+
+    search = commands.add_parser('search', help="키워드 검색")
+    search.add_argument('keyword')
+    search.add_argument('--since', help="시작 날짜 (YYYY-MM-DD)")
+    search.add_argument('--until', help="끝 날짜 (YYYY-MM-DD)")
+    search.add_argument('--by', default='snapshot_date,source', help="집계 기준 (snapshot_date,source,region)")
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        archive = PageArchive(args.archive)
+        for date in args.date or archive.dates():
+            stats = index_archive(archive, date, args.query, args.db)
+            if stats.get('partial'):
+                print(f"⚠️ {date}: 아카이브가 전체 공고를 덮지 않아 색인하지 않음 "
+                      f"({stats['postings_archived']:,}/{stats['total_count']:,}개)")
+                continue
+            print(f"🔎 {date}: {stats['postings_indexed']:,}개 공고 색인 ({stats['pages_indexed']}페이지, "
+                  f"중복 {stats['duplicates_skipped']:,}개 제외)")
+        return 0
+
+    with TitleIndex(args.db) as index:
+        counts = index.keyword_counts(args.keyword, args.since, args.until, by=args.by.split(','))
+        if counts.empty:
+            print(f"❌ '{args.keyword}' 검색 결과 없음")
+            return 1
+        print(f"🔎 '{args.keyword}' 공고 수")
+        print(counts.to_string(index=False))
+        print(index.search(args.keyword, args.since, args.until, limit=10).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())